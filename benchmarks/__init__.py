@@ -0,0 +1,4 @@
+"""
+Benchmarks of schema building, serialization and `apply_to_model`, run on
+SQLite over the test models with generated data, see `python -m benchmarks`.
+"""
@@ -0,0 +1,70 @@
+"""
+Run the benchmarks, e.g. to compare a change against the main branch:
+
+    git checkout main && python -m benchmarks -o main.json
+    git checkout - && python -m benchmarks -o branch.json --compare main.json
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from benchmarks.environment import setup_django
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-o", "--output", help="file to save the results to, as JSON")
+    parser.add_argument("--compare", help="results file to compare with")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="slowdown allowed before failing the comparison, 0.1 for 10%%",
+    )
+    parser.add_argument(
+        "-k", "--filter", default="", help="run the benchmarks with this in their name"
+    )
+    parser.add_argument("--users", type=int, default=1000, help="users generated")
+    parser.add_argument("--groups-per-user", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=5, help="rounds per benchmark")
+    parser.add_argument(
+        "--number", type=int, help="calls per round, enough for 0.2s when omitted"
+    )
+    parser.add_argument(
+        "--database", default=":memory:", help="SQLite database file to use"
+    )
+    args = parser.parse_args(argv)
+
+    setup_django(args.database)
+
+    from benchmarks.cases import BENCHMARKS
+    from benchmarks.data import create_dataset
+    from benchmarks.runner import (
+        compare,
+        format_comparison,
+        format_results,
+        load,
+        run,
+        save,
+    )
+
+    dataset = create_dataset(args.users, groups_per_user=args.groups_per_user)
+    names = [name for name in BENCHMARKS if args.filter in name]
+    results = run(names, dataset, repeat=args.repeat, number=args.number)
+    print(format_results(results))
+    if args.output:
+        save(results, args.output)
+
+    if args.compare:
+        rows, regressions = compare(load(args.compare), results, args.tolerance)
+        print()
+        print(format_comparison(rows))
+        if regressions:
+            print(f"\nslower than {args.compare}: {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+from typing import Any, Callable, Dict, List
+
+from dantico import ModelSchema
+from dantico.build_stats import builds
+from dantico.queryset import optimize_queryset
+from dantico.schema_registry import registry
+
+from tests.models import Auction, User
+
+__all__ = ["BENCHMARKS", "Case"]
+
+# the function timed, returned by the setup function of a benchmark
+Case = Callable[[], Any]
+BENCHMARKS: Dict[str, Callable[[], Case]] = {}
+
+# registry state reset so that schemas, nested ones included, are built again
+REGISTRY_STATE = ("schemas", "keys", "schema_keys", "enums")
+
+
+def benchmark(name: str) -> Callable[[Callable[[], Case]], Callable[[], Case]]:
+    def decorator(setup: Callable[[], Case]) -> Callable[[], Case]:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+class UserFlatSchema(ModelSchema):
+    class Config:
+        model = User
+        include = ["id", "full_name", "age"]
+
+
+class UserFKSchema(ModelSchema):
+    class Config:
+        model = User
+        include = ["id", "full_name", "age", "profile", "tier"]
+        depth = 1
+
+
+class UserM2MSchema(ModelSchema):
+    class Config:
+        model = User
+        include = ["id", "full_name", "groups"]
+        depth = 1
+
+
+class AuctionSchema(ModelSchema):
+    class Config:
+        model = Auction
+        depth = 1
+
+
+def build_schema(model: type, depth: int) -> Case:
+    def build() -> None:
+        state = registry.__dict__
+        saved = {name: state[name] for name in REGISTRY_STATE}
+        count = len(builds)
+        state.update({name: {} for name in REGISTRY_STATE})
+        try:
+            type(f"{model.__name__}BuildSchema", (ModelSchema,), {"Config": config})
+        finally:
+            state.update(saved)
+            del builds[count:]
+
+    config = type("Config", (), {"model": model, "depth": depth})
+    return build
+
+
+@benchmark("build_user_depth_0")
+def build_user_depth_0() -> Case:
+    return build_schema(User, 0)
+
+
+@benchmark("build_user_depth_1")
+def build_user_depth_1() -> Case:
+    return build_schema(User, 1)
+
+
+@benchmark("build_user_depth_2")
+def build_user_depth_2() -> Case:
+    return build_schema(User, 2)
+
+
+def serialize(schema: type, model: type) -> Case:
+    # loaded up front, so that only serialization is timed
+    objs = list(optimize_queryset(schema, model.objects.order_by("pk")))
+    return lambda: [schema.from_orm(obj) for obj in objs]
+
+
+@benchmark("from_orm_flat")
+def from_orm_flat() -> Case:
+    return serialize(UserFlatSchema, User)
+
+
+@benchmark("from_orm_fk")
+def from_orm_fk() -> Case:
+    return serialize(UserFKSchema, User)
+
+
+@benchmark("from_orm_m2m")
+def from_orm_m2m() -> Case:
+    return serialize(UserM2MSchema, User)
+
+
+@benchmark("from_orm_one_to_one")
+def from_orm_one_to_one() -> Case:
+    return serialize(AuctionSchema, Auction)
+
+
+@benchmark("from_queryset_m2m")
+def from_queryset_m2m() -> Case:
+    return lambda: UserM2MSchema.from_queryset(User.objects.order_by("pk"))
+
+
+@benchmark("json_flat")
+def json_flat() -> Case:
+    rows = serialize(UserFlatSchema, User)()
+    return lambda: [row.json() for row in rows]
+
+
+@benchmark("json_m2m")
+def json_m2m() -> Case:
+    rows = serialize(UserM2MSchema, User)()
+    return lambda: [row.json() for row in rows]
+
+
+@benchmark("apply_to_model")
+def apply_to_model() -> Case:
+    rows: List[ModelSchema] = serialize(UserFlatSchema, User)()
+    users = [User() for _ in rows]
+    return lambda: [row.apply_to_model(user) for row, user in zip(rows, users)]
@@ -0,0 +1,98 @@
+import datetime
+import random
+from typing import Dict, List, Type, TypeVar
+
+from django.db.models import Model
+
+from tests.models import Auction, Category, Group, Profile, User, UserType
+
+__all__ = ["create_dataset"]
+
+M = TypeVar("M", bound=Model)
+
+
+def with_pks(model: Type[M], objs: List[M]) -> List[M]:
+    # bulk_create only sets primary keys on some backends, e.g. on SQLite
+    # from Django 4.0: read the rows back, the tables start empty
+    if objs and objs[0].pk is None:
+        return list(model.objects.order_by("pk"))
+    return objs
+
+
+def create_dataset(
+    users: int = 1000, groups: int = 50, groups_per_user: int = 10, seed: int = 0
+) -> Dict[str, int]:
+    """
+    Fill the test models with generated rows: `users` users, each with a
+    profile, a tier and `groups_per_user` of `groups` groups, and as many
+    auctions, half of them with a category.
+
+    The same `seed` gives the same data, so runs can be compared.
+    """
+    rng = random.Random(seed)
+    today = datetime.date(2022, 1, 1)
+
+    tiers = with_pks(
+        UserType,
+        UserType.objects.bulk_create(
+            UserType(name=name) for name in ("free", "basic", "pro", "enterprise")
+        ),
+    )
+    group_objs = with_pks(
+        Group,
+        Group.objects.bulk_create(
+            Group(name=f"group {index}") for index in range(groups)
+        ),
+    )
+    profiles = with_pks(
+        Profile,
+        Profile.objects.bulk_create(
+            Profile(
+                address=f"{index} Main Street",
+                dob=datetime.datetime(1970, 1, 1) + datetime.timedelta(days=index),
+            )
+            for index in range(users)
+        ),
+    )
+    user_objs = with_pks(
+        User,
+        User.objects.bulk_create(
+            User(
+                full_name=f"user {index}",
+                age=rng.randint(18, 90),
+                profile=profile,
+                tier=rng.choice(tiers),
+            )
+            for index, profile in enumerate(profiles)
+        ),
+    )
+    memberships = User.groups.through.objects.bulk_create(
+        User.groups.through(user_id=user.pk, group_id=group.pk)
+        for user in user_objs
+        for group in rng.sample(group_objs, min(groups_per_user, groups))
+    )
+
+    categories = with_pks(
+        Category,
+        Category.objects.bulk_create(
+            Category(
+                name=f"category {index}",
+                start_date=today,
+                end_date=today + datetime.timedelta(days=index),
+            )
+            for index in range(users // 2)
+        ),
+    )
+    Auction.objects.bulk_create(
+        Auction(
+            title=f"auction {index}",
+            category=categories[index] if index < len(categories) else None,
+        )
+        for index in range(users)
+    )
+    return {
+        "users": users,
+        "groups": groups,
+        "memberships": len(memberships),
+        "auctions": users,
+    }
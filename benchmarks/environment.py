@@ -0,0 +1,24 @@
+import django
+from django.conf import settings
+from django.core.management import call_command
+
+__all__ = ["setup_django"]
+
+
+def setup_django(database: str = ":memory:") -> None:
+    """
+    Configure Django with the test models on a SQLite `database` and create
+    their tables, unless settings are configured already (e.g. by pytest).
+    """
+    if settings.configured:
+        return
+    settings.configure(
+        DATABASES={
+            "default": {"ENGINE": "django.db.backends.sqlite3", "NAME": database}
+        },
+        INSTALLED_APPS=["django.contrib.contenttypes", "tests", "benchmarks"],
+        SECRET_KEY="benchmarks",
+        USE_TZ=False,
+    )
+    django.setup()
+    call_command("migrate", run_syncdb=True, verbosity=0)
@@ -0,0 +1,121 @@
+import datetime
+import json
+import platform
+import statistics
+import subprocess
+from timeit import Timer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import dantico
+import django
+import pydantic
+
+__all__ = ["compare", "measure", "metadata", "run"]
+
+
+def measure(case: Any, repeat: int = 5, number: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Time `case`, calling it `number` times per round, enough for a round to
+    take 0.2s when omitted, in `repeat` rounds. Times are per call.
+    """
+    timer = Timer(case)
+    if number is None:
+        number, _ = timer.autorange()
+    times = [time / number for time in timer.repeat(repeat, number)]
+    return {
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.mean(times),
+        "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": repeat,
+        "number": number,
+    }
+
+
+def git_commit() -> Optional[str]:
+    try:
+        output = subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return output.stdout.strip()
+
+
+def metadata(dataset: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        "commit": git_commit(),
+        "date": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "dantico": dantico.__version__,
+        "django": django.get_version(),
+        "pydantic": pydantic.VERSION,
+        "pydantic_compiled": getattr(pydantic, "compiled", False),
+        "dataset": dataset,
+    }
+
+
+def run(
+    names: Iterable[str],
+    dataset: Dict[str, int],
+    repeat: int = 5,
+    number: Optional[int] = None,
+) -> Dict[str, Any]:
+    """Run the benchmarks `names`, returning the results as saved to JSON."""
+    from benchmarks.cases import BENCHMARKS
+
+    results = {}
+    for name in names:
+        results[name] = measure(BENCHMARKS[name](), repeat=repeat, number=number)
+    return {"meta": metadata(dataset), "benchmarks": results}
+
+
+def compare(
+    baseline: Dict[str, Any], current: Dict[str, Any], tolerance: float = 0.1
+) -> Tuple[List[Tuple[str, float, float, float]], List[str]]:
+    """
+    Compare the fastest rounds of the benchmarks in both results, returning
+    rows of (name, baseline, current, ratio) and the names of the benchmarks
+    slower than the baseline by more than `tolerance` (0.1 for 10%).
+    """
+    rows, regressions = [], []
+    for name, result in current["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if before is None:
+            continue
+        ratio = result["min"] / before["min"]
+        rows.append((name, before["min"], result["min"], ratio))
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+    return rows, regressions
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    lines = [f"{'benchmark':<24} {'min ms':>10} {'median ms':>10} {'stdev':>8}"]
+    for name, result in results["benchmarks"].items():
+        lines.append(
+            f"{name:<24} {result['min'] * 1000:>10.3f} "
+            f"{result['median'] * 1000:>10.3f} {result['stdev'] * 1000:>8.3f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Tuple[str, float, float, float]]) -> str:
+    lines = [f"{'benchmark':<24} {'before ms':>10} {'after ms':>10} {'ratio':>7}"]
+    for name, before, after, ratio in rows:
+        lines.append(
+            f"{name:<24} {before * 1000:>10.3f} {after * 1000:>10.3f} {ratio:>7.2f}"
+        )
+    return "\n".join(lines)
+
+
+def save(results: Dict[str, Any], path: str) -> None:
+    with open(path, "w") as file:
+        json.dump(results, file, indent=2, sort_keys=True)
+
+
+def load(path: str) -> Dict[str, Any]:
+    with open(path) as file:
+        return json.load(file)  # type: ignore [no-any-return]
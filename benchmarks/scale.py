@@ -0,0 +1,220 @@
+"""
+Measure how schema generation and queryset serialization scale with the
+number of models and rows, on models and data generated at runtime:
+
+    python -m benchmarks.scale --models 10 100 300 --rows 1000 100000 1000000
+
+Every measure runs in a process of its own, so that its peak RSS isn't
+the one of a previous measure. It runs twice: once timed, once traced with
+`tracemalloc`, which slows it down.
+"""
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.environment import setup_django
+
+__all__ = ["measure", "measure_schemas", "measure_serialization", "run_step"]
+
+STEPS = ("schemas", "list", "stream")
+CHUNK_SIZE = 2000
+
+
+def peak_rss() -> int:
+    """Peak resident set size of the process, in bytes."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def measure(func: Callable[[], int], trace: bool = False) -> Dict[str, Any]:
+    """
+    Run `func`, returning how many items it handled, and measure its time
+    and the process' peak RSS, and with `trace` its allocations.
+    """
+    result: Dict[str, Any] = {"rss_before": peak_rss()}
+    if trace:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    items = func()
+    result["time"] = time.perf_counter() - start
+    result["peak_rss"] = peak_rss()
+    result["items"] = items
+    result["per_second"] = items / result["time"] if result["time"] else None
+    if trace:
+        _, result["traced_peak"] = tracemalloc.get_traced_memory()
+        # model instances with related objects are reference cycles
+        gc.collect()
+        stats = tracemalloc.take_snapshot().compare_to(before, "lineno")
+        tracemalloc.stop()
+        result["retained_blocks"] = sum(stat.count_diff for stat in stats)
+        result["retained_size"] = sum(stat.size_diff for stat in stats)
+        result["top_allocations"] = [
+            {
+                "line": str(stat.traceback[0]),
+                "size": stat.size_diff,
+                "blocks": stat.count_diff,
+            }
+            for stat in stats[:5]
+        ]
+    return result
+
+
+def measure_schemas(graph: Any, size: int, trace: bool) -> Dict[str, Any]:
+    """Build schemas, with their nested schemas, for `size` models."""
+    from dantico import SchemaFactory
+
+    def build() -> int:
+        for model in graph.models[:size]:
+            SchemaFactory.create_schema(model, depth=1, skip_registry=True)
+        return size
+
+    return measure(build, trace)
+
+
+def measure_serialization(
+    graph: Any, size: int, trace: bool, stream: bool
+) -> Dict[str, Any]:
+    """
+    Serialize `size` rows of the root model with their chain of parents and
+    tags, keeping them all, or with `stream` a chunk of rows at a time.
+    """
+    from dantico import SchemaFactory
+    from dantico.queryset import optimize_queryset
+
+    schema: Any = SchemaFactory.create_schema(
+        graph.root, depth=graph.chain_depth, skip_registry=True
+    )
+    queryset = graph.root.objects.order_by("pk")[:size]
+
+    def serialize() -> int:
+        rows = schema.from_queryset(queryset)
+        return len(rows)
+
+    def serialize_stream() -> int:
+        count = 0
+        rows = optimize_queryset(schema, queryset).iterator(chunk_size=CHUNK_SIZE)
+        for obj in rows:
+            schema.from_orm(obj)
+            count += 1
+        return count
+
+    return measure(serialize_stream if stream else serialize, trace)
+
+
+def run_step(
+    database: str, graph_options: Dict[str, Any], step: str, size: int, trace: bool
+) -> Dict[str, Any]:
+    """Measure `step` for `size` models or rows, in a process of its own."""
+    setup_django(database)
+
+    from benchmarks.synthetic import ModelGraph
+
+    graph = ModelGraph(**graph_options)
+    if step == "schemas":
+        result = measure_schemas(graph, size, trace)
+    else:
+        result = measure_serialization(graph, size, trace, stream=step == "stream")
+    return {"step": step, "size": size, "traced": trace, **result}
+
+
+def run_in_process(*args: Any) -> Dict[str, Any]:
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+        return executor.submit(run_step, *args).result()
+
+
+def format_results(results: List[Dict[str, Any]]) -> str:
+    mb = 1024 * 1024
+    lines = [
+        f"{'step':<8} {'size':>9} {'traced':>6} {'seconds':>9} {'per second':>11} "
+        f"{'peak RSS MB':>11} {'traced peak MB':>14} {'retained blocks':>15}"
+    ]
+    for result in results:
+        traced_peak = result.get("traced_peak")
+        traced = f"{traced_peak / mb:.1f}" if traced_peak is not None else "-"
+        lines.append(
+            f"{result['step']:<8} {result['size']:>9} {str(result['traced']):>6} "
+            f"{result['time']:>9.3f} {result['per_second'] or 0:>11.0f} "
+            f"{result['peak_rss'] / mb:>11.1f} {traced:>14} "
+            f"{result.get('retained_blocks', '-'):>15}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scale")
+    parser.add_argument("--models", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--fields", type=int, default=20, help="fields per model")
+    parser.add_argument("--choices", type=int, default=5, help="choices per enum")
+    parser.add_argument(
+        "--chain-depth", type=int, default=5, help="models per foreign key chain"
+    )
+    parser.add_argument("--fan-out", type=int, default=3, help="tags per row")
+    parser.add_argument("--steps", nargs="+", choices=STEPS, default=list(STEPS))
+    parser.add_argument(
+        "--no-trace", action="store_true", help="skip the tracemalloc runs"
+    )
+    parser.add_argument(
+        "--database", help="SQLite file to keep the data in, reused when filled"
+    )
+    parser.add_argument("-o", "--output", help="file to save the results to, as JSON")
+    args = parser.parse_args(argv)
+
+    database = args.database or os.path.join(tempfile.mkdtemp(), "scale.sqlite3")
+    graph_options = {
+        "count": max(args.models),
+        "fields": args.fields,
+        "choices": args.choices,
+        "chain_depth": args.chain_depth,
+    }
+    setup_django(database)
+
+    from benchmarks.runner import metadata
+    from benchmarks.synthetic import fill_graph, synthesize_models
+
+    graph = synthesize_models(**graph_options)
+    rows = max(args.rows)
+    existing = graph.root.objects.count()
+    if not existing:
+        fill_graph(
+            graph,
+            rows,
+            fan_out=args.fan_out,
+            progress=lambda message: print(message, file=sys.stderr),
+        )
+    elif existing < rows:
+        parser.error(f"{database} has {existing} rows, use another --database")
+
+    results = []
+    for step in args.steps:
+        for size in args.models if step == "schemas" else args.rows:
+            for trace in (False,) if args.no_trace else (False, True):
+                results.append(
+                    run_in_process(database, graph_options, step, size, trace)
+                )
+                print(format_results(results[-1:]).splitlines()[-1], file=sys.stderr)
+
+    print(format_results(results))
+    if args.output:
+        meta = metadata({"rows": rows, "fan_out": args.fan_out, **graph_options})
+        with open(args.output, "w") as file:
+            json.dump({"meta": meta, "steps": results}, file, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,199 @@
+import datetime
+import decimal
+import random
+from typing import Any, Callable, Dict, List, Optional, Type
+
+from django.apps import apps
+from django.db import connection, models
+
+__all__ = ["ModelGraph", "fill_graph", "synthesize_models"]
+
+# an installed app, for the reverse relations of the models to be known
+APP_LABEL = "benchmarks"
+BATCH_SIZE = 5000
+
+
+def scalar_field(model: int, index: int, choices: int) -> models.Field:
+    """The `index`th field of a synthetic model, of a type picked by index."""
+    kind = index % 5
+    if kind == 0:
+        options = {}
+        if choices and index % 10 == 0:
+            # labels unique to the model, so every model gets its own enums
+            options["choices"] = [
+                (f"m{model}c{choice}", f"Choice {choice} of model {model}")
+                for choice in range(choices)
+            ]
+        return models.CharField(max_length=50, blank=True, **options)
+    if kind == 1:
+        return models.IntegerField(default=0)
+    if kind == 2:
+        return models.DecimalField(max_digits=10, decimal_places=2, default=0)
+    if kind == 3:
+        return models.DateTimeField(null=True)
+    return models.BooleanField(default=False)
+
+
+def scalar_value(field: models.Field, rng: random.Random) -> Any:
+    if field.choices:
+        return rng.choice(field.choices)[0]
+    if isinstance(field, models.CharField):
+        return f"value {rng.randrange(1_000_000)}"
+    if isinstance(field, models.IntegerField):
+        return rng.randrange(1_000_000)
+    if isinstance(field, models.DecimalField):
+        return decimal.Decimal(rng.randrange(100_000)) / 100
+    if isinstance(field, models.DateTimeField):
+        return datetime.datetime(2020, 1, 1) + datetime.timedelta(
+            seconds=rng.randrange(100_000_000)
+        )
+    return rng.random() < 0.5
+
+
+class ModelGraph:
+    """
+    Models made at runtime: `count` models with `fields` fields each, every
+    tenth char field with `choices` choices, in foreign key chains of
+    `chain_depth` models, all with a many-to-many relation to `Tag`.
+
+    The last model of the first chain, the root, has the longest chain of
+    foreign keys above it, and is the one the dataset is made of.
+    """
+
+    def __init__(
+        self, count: int = 10, fields: int = 20, choices: int = 5, chain_depth: int = 5
+    ) -> None:
+        self.count = count
+        self.fields = fields
+        self.choices = choices
+        self.chain_depth = max(1, min(chain_depth, count))
+        self.tag: Type[models.Model] = self.create_model(
+            "Tag", {"name": models.CharField(max_length=20)}
+        )
+        self.models: List[Type[models.Model]] = []
+        for index in range(count):
+            attrs: Dict[str, Any] = {
+                f"field_{field}": scalar_field(index, field, choices)
+                for field in range(fields)
+            }
+            if index % self.chain_depth:
+                attrs["parent"] = models.ForeignKey(
+                    self.models[-1], on_delete=models.CASCADE, null=True
+                )
+            attrs["tags"] = models.ManyToManyField(self.tag)
+            self.models.append(self.create_model(f"Model{index}", attrs))
+
+    @property
+    def root(self) -> Type[models.Model]:
+        return self.models[self.chain_depth - 1]
+
+    @property
+    def chain(self) -> List[Type[models.Model]]:
+        """The models of the first chain, from the top down to the root."""
+        return self.models[: self.chain_depth]
+
+    def create_model(self, name: str, attrs: Dict[str, Any]) -> Type[models.Model]:
+        # registered once, the same graph can be made again, e.g. by the
+        # process measuring it
+        try:
+            return apps.get_registered_model(APP_LABEL, name)
+        except LookupError:
+            pass
+        meta = type("Meta", (), {"app_label": APP_LABEL})
+        return type(
+            name, (models.Model,), {"__module__": __name__, "Meta": meta, **attrs}
+        )
+
+    def create_tables(self) -> None:
+        # with the tables of their many-to-many relations
+        existing = set(connection.introspection.table_names())
+        with connection.schema_editor() as editor:
+            for model in [self.tag, *self.models]:
+                if model._meta.db_table not in existing:
+                    editor.create_model(model)
+
+
+def synthesize_models(**options: Any) -> ModelGraph:
+    """Make the models of a `ModelGraph` and their tables."""
+    graph = ModelGraph(**options)
+    graph.create_tables()
+    return graph
+
+
+def bulk_create(
+    model: Type[models.Model],
+    count: int,
+    make: Callable[[int], models.Model],
+    progress: Optional[Callable[[str], None]] = None,
+) -> None:
+    for start in range(0, count, BATCH_SIZE):
+        model._default_manager.bulk_create(
+            [make(index) for index in range(start, min(start + BATCH_SIZE, count))],
+            batch_size=BATCH_SIZE,
+        )
+        if progress:
+            progress(f"{model.__name__}: {min(start + BATCH_SIZE, count)}/{count}")
+
+
+def fill_graph(
+    graph: ModelGraph,
+    rows: int,
+    *,
+    parents: int = 100,
+    tags: int = 50,
+    fan_out: int = 3,
+    seed: int = 0,
+    progress: Optional[Callable[[str], None]] = None,
+) -> None:
+    """
+    Create `rows` rows of the root of `graph`, each with a parent through
+    every model of its chain, `parents` rows of each, and `fan_out` of
+    `tags` tags.
+    """
+    rng = random.Random(seed)
+    graph.tag._default_manager.bulk_create(
+        graph.tag(name=f"tag {index}") for index in range(tags)
+    )
+    tag_pks = list(graph.tag._default_manager.values_list("pk", flat=True))
+
+    parent_pks: List[Any] = []
+    for model in graph.chain:
+        count = rows if model is graph.root else parents
+        fields = [
+            field
+            for field in model._meta.concrete_fields
+            if field.name.startswith("field_")
+        ]
+
+        def make(
+            index: int,
+            model: Any = model,
+            fields: Any = fields,
+            parents: Any = parent_pks,
+        ) -> Any:
+            values = {field.name: scalar_value(field, rng) for field in fields}
+            if parents:
+                values["parent_id"] = rng.choice(parents)
+            return model(**values)
+
+        bulk_create(model, count, make, progress)
+        parent_pks = list(model._default_manager.values_list("pk", flat=True))
+
+    through = graph.root.tags.through  # type: ignore [attr-defined]
+    root_name = f"{graph.root._meta.model_name}_id"
+    root_pks = parent_pks
+    fan_out = min(fan_out, len(tag_pks))
+    bulk_create(
+        through,
+        len(root_pks) * fan_out,
+        # distinct tags for each row
+        lambda index: through(
+            **{
+                root_name: root_pks[index // fan_out],
+                "tag_id": tag_pks[
+                    (index // fan_out * 7 + index % fan_out) % len(tag_pks)
+                ],
+            }
+        ),
+        progress,
+    )
@@ -2,9 +2,20 @@
 
 __version__ = "0.0.10"
 
+from dantico.build_stats import build_report
+from dantico.expressions import SQLField
 from dantico.factory import SchemaFactory
 from dantico.model_schema import ModelSchema
 from dantico.model_validators import model_validator
+from dantico.queryset import depends_on
 from dantico.schema import Schema
 
-__all__ = ["SchemaFactory", "Schema", "ModelSchema", "model_validator"]
+__all__ = [
+    "SchemaFactory",
+    "Schema",
+    "ModelSchema",
+    "SQLField",
+    "depends_on",
+    "model_validator",
+    "build_report",
+]
@@ -0,0 +1,141 @@
+import base64
+import binascii
+from typing import Any, Callable, Dict, Iterator, Set, Tuple, Type, Union
+
+from dantico.getters import DjangoGetter
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models import Model
+from pydantic.json import ENCODERS_BY_TYPE
+
+__all__ = [
+    "Binary",
+    "DeferredBinary",
+    "DeferredBinaryGetter",
+    "iter_base64",
+    "picklable",
+]
+
+# bytes encoded at a time, a multiple of 3 so chunks don't need padding
+BASE64_CHUNK_SIZE = 3 * 64 * 1024
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+class DeferredBinary:
+    """
+    The value of a `defer_binary` field that wasn't loaded with its row,
+    loaded by `load` when serialized and not kept.
+    """
+
+    __slots__ = ("model", "pk", "attname", "using")
+
+    def __init__(self, model: Type[Model], pk: Any, attname: str, using: str) -> None:
+        self.model = model
+        self.pk = pk
+        self.attname = attname
+        self.using = using
+
+    def load(self) -> memoryview:
+        value = (
+            self.model._base_manager.using(self.using)
+            .filter(pk=self.pk)
+            .values_list(self.attname, flat=True)
+            .get()
+        )
+        return memoryview(b"" if value is None else value)
+
+    def __repr__(self) -> str:
+        return f"DeferredBinary({self.model.__name__}.{self.attname}, pk={self.pk!r})"
+
+
+class Binary:
+    """
+    `BinaryField` values, kept as a `memoryview` of the buffer the database
+    returned rather than copied into `bytes`. Serialized in base64, from
+    base64 strings when parsed from JSON.
+    """
+
+    @classmethod
+    def __get_validators__(cls) -> Iterator[Callable[[Any], Any]]:
+        yield cls.validate
+
+    @classmethod
+    def __modify_schema__(cls, field_schema: Dict[str, Any]) -> None:
+        field_schema.update(type="string", format="binary", contentEncoding="base64")
+
+    @classmethod
+    def validate(cls, value: Any) -> Union[memoryview, DeferredBinary]:
+        if isinstance(value, (memoryview, DeferredBinary)):
+            return value
+        if isinstance(value, (bytes, bytearray)):
+            return memoryview(value)
+        if isinstance(value, str):
+            try:
+                return memoryview(base64.b64decode(value, validate=True))
+            except binascii.Error:
+                raise ValueError("invalid base64 string")
+        raise TypeError("bytes-like object or base64 string expected")
+
+
+class PicklableBuffer:
+    """
+    A memoryview, which can't be pickled or deep-copied, pickled as a
+    memoryview of a copy of its bytes.
+    """
+
+    __slots__ = ("view",)
+
+    def __init__(self, view: memoryview) -> None:
+        self.view = view
+
+    def __reduce__(self) -> Tuple[Callable, Tuple[bytes]]:
+        return memoryview, (self.view.tobytes(),)
+
+
+def picklable(value: Any) -> Any:
+    """`value`, with memoryviews wrapped in a `PicklableBuffer`."""
+    return PicklableBuffer(value) if isinstance(value, memoryview) else value
+
+
+def iter_base64(
+    value: Union[BytesLike, DeferredBinary], chunk_size: int = BASE64_CHUNK_SIZE
+) -> Iterator[str]:
+    """Encode `value` in base64 a chunk at a time, without copying it whole."""
+    if isinstance(value, DeferredBinary):
+        value = value.load()
+    view = memoryview(value).cast("B")
+    step = max(chunk_size // 3, 1) * 3
+    for start in range(0, len(view), step):
+        yield base64.b64encode(view[start : start + step]).decode("ascii")
+
+
+def encode_base64(value: Union[BytesLike, DeferredBinary]) -> str:
+    return "".join(iter_base64(value))
+
+
+# encoded by `pydantic_encoder` too, e.g. in `.json()` of schemas nesting
+# model schemas, or `json.dumps(schema.dict(), default=pydantic_encoder)`
+ENCODERS_BY_TYPE.update({memoryview: encode_base64, DeferredBinary: encode_base64})
+
+
+class DeferredBinaryGetter(DjangoGetter):
+    """
+    Getter of the schemas with `defer_binary` fields: reads the ones that
+    weren't loaded with their row as `DeferredBinary` values.
+    """
+
+    defer_binary: Set[str] = set()
+
+    def get_value(self, key: Any, default: Any = None) -> Any:
+        obj = self._obj
+        if (
+            key in self.defer_binary
+            and isinstance(obj, Model)
+            and obj.pk is not None
+            and key not in obj.__dict__
+        ):
+            # deferred, reading the attribute would load it now
+            return DeferredBinary(
+                type(obj), obj.pk, key, obj._state.db or DEFAULT_DB_ALIAS
+            )
+        return super().get_value(key, default)
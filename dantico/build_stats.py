@@ -0,0 +1,213 @@
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+__all__ = ["BuildReport", "SchemaBuild", "build_report"]
+
+# schema being built, see `ModelSchemaMetaclass`
+current_build: ContextVar[Optional["SchemaBuild"]] = ContextVar(
+    "dantico_schema_build", default=None
+)
+
+
+class SchemaBuild:
+    """
+    Time spent building a model schema class, split between converting the
+    model fields to pydantic types, building the schemas of nested relations,
+    creating the enums of fields with choices and setting up the pydantic
+    fields (`update_class_missing_fields`).
+    """
+
+    __slots__ = (
+        "name",
+        "model",
+        "fields",
+        "time",
+        "conversion_time",
+        "nested_time",
+        "enum_time",
+        "update_time",
+        "enums",
+        "nested",
+        "schema",
+    )
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        # label of the model, set once the configuration is checked
+        self.model = ""
+        self.fields = 0
+        self.time = 0.0
+        self.conversion_time = 0.0
+        self.nested_time = 0.0
+        self.enum_time = 0.0
+        self.update_time = 0.0
+        self.enums = 0
+        self.nested = 0
+        self.schema: Optional["weakref.ref[type]"] = None
+
+    def __repr__(self) -> str:
+        return f"SchemaBuild({self.name!r}, model={self.model!r}, time={self.time:.6f})"
+
+    @property
+    def own_time(self) -> float:
+        """Time spent on this schema, without its nested schemas."""
+        return self.time - self.nested_time
+
+    @property
+    def factory(self) -> bool:
+        """Whether the schema was created by `SchemaFactory.create_schema`."""
+        from dantico.schema_registry import registry
+
+        schema = self.schema() if self.schema else None
+        return schema is not None and registry.get_schema_key(schema) is not None
+
+    @contextmanager
+    def converting(self) -> Iterator[None]:
+        # nested schemas and enums are built while converting fields, their
+        # time is counted apart
+        start = perf_counter()
+        inner = self.nested_time + self.enum_time
+        try:
+            yield
+        finally:
+            self.fields += 1
+            self.conversion_time += (
+                perf_counter() - start - (self.nested_time + self.enum_time - inner)
+            )
+
+    @contextmanager
+    def updating(self) -> Iterator[None]:
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.update_time += perf_counter() - start
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "model": self.model,
+            "factory": self.factory,
+            "fields": self.fields,
+            "nested": self.nested,
+            "enums": self.enums,
+            "time": self.time,
+            "own_time": self.own_time,
+            "conversion_time": self.conversion_time,
+            "nested_time": self.nested_time,
+            "enum_time": self.enum_time,
+            "update_time": self.update_time,
+        }
+
+
+# every model schema built by the process, in the order they were done
+builds: List[SchemaBuild] = []
+
+
+@contextmanager
+def recording_build(name: str) -> Iterator[SchemaBuild]:
+    """Record the build of the model schema `name`, see `builds`."""
+    start = perf_counter()
+    build = SchemaBuild(name)
+    parent = current_build.get()
+    token = current_build.set(build)
+    try:
+        yield build
+    finally:
+        current_build.reset(token)
+    # schemas failing to build aren't recorded
+    build.time = perf_counter() - start
+    if parent is not None:
+        parent.nested += 1
+        parent.nested_time += build.time
+    builds.append(build)
+
+
+@contextmanager
+def recording_enum() -> Iterator[None]:
+    """Record the creation of an enum for the schema being built."""
+    build = current_build.get()
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        if build is not None:
+            build.enums += 1
+            build.enum_time += perf_counter() - start
+
+
+class BuildReport:
+    """The schemas built so far, the slowest first."""
+
+    def __init__(self, builds: List[SchemaBuild], limit: Optional[int] = 10) -> None:
+        self.schemas = len(builds)
+        self.factory_schemas = sum(build.factory for build in builds)
+        self.enums = sum(build.enums for build in builds)
+        # nested schemas are part of the time of the schema they're built for
+        self.time = sum(build.own_time for build in builds)
+        self.slowest = sorted(builds, key=lambda build: build.own_time, reverse=True)[
+            :limit
+        ]
+
+    def __str__(self) -> str:
+        return self.table()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "schemas": self.schemas,
+            "factory_schemas": self.factory_schemas,
+            "enums": self.enums,
+            "time": self.time,
+            "slowest": [build.as_dict() for build in self.slowest],
+        }
+
+    def table(self) -> str:
+        """The slowest schemas as a text table, below the totals."""
+        header = (
+            "schema",
+            "model",
+            "fields",
+            "own ms",
+            "fields ms",
+            "nested ms",
+            "enums ms",
+            "update ms",
+        )
+        rows: List[Tuple[str, ...]] = [header]
+        for build in self.slowest:
+            times = (
+                build.own_time,
+                build.conversion_time,
+                build.nested_time,
+                build.enum_time,
+                build.update_time,
+            )
+            rows.append(
+                (build.name, build.model, str(build.fields))
+                + tuple(f"{time * 1000:.3f}" for time in times)
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        lines = [
+            f"{self.schemas} schemas ({self.factory_schemas} from SchemaFactory), "
+            f"{self.enums} enums, built in {self.time * 1000:.3f} ms"
+        ]
+        lines.extend(
+            "  ".join(
+                cell.ljust(width) if i < 2 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
+        return "\n".join(lines)
+
+
+def build_report(limit: Optional[int] = 10) -> BuildReport:
+    """
+    Report the model schemas built so far, by `ModelSchema` subclasses and
+    `SchemaFactory.create_schema`, with the `limit` slowest ones and the time
+    they spent on each step, e.g. to find the models slowing startup down.
+    """
+    return BuildReport(list(builds), limit)
@@ -0,0 +1,789 @@
+import asyncio
+from collections import defaultdict, deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from enum import Enum
+from functools import partial
+from itertools import chain, islice
+from multiprocessing.context import BaseContext
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    Union,
+    cast,
+    no_type_check,
+)
+
+import django
+from asgiref.sync import sync_to_async
+from dantico.queryset import get_model_field
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, router, transaction
+from django.db.models import Field, Model, UniqueConstraint
+from django.utils.text import capfirst, get_text_list
+from pydantic import BaseModel, ValidationError
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.utils import lenient_issubclass
+
+if TYPE_CHECKING:
+    from dantico.model_schema import ModelSchema
+
+__all__ = [
+    "BulkResult",
+    "abulk_create",
+    "abulk_create_many",
+    "abulk_update",
+    "abulk_update_many",
+    "bulk_create",
+    "bulk_update",
+    "check_foreign_keys",
+    "check_unique_constraints",
+    "run_batch_validators",
+    "parse_many",
+    "unique_sets",
+]
+
+ErrorDict = Dict[str, Any]
+RowErrors = Dict[int, List[ErrorDict]]
+
+DEFAULT_CHUNK_SIZE = 1000
+# `abulk_create` and `abulk_update` of querysets
+ASYNC_QUERYSETS = django.VERSION >= (4, 1)
+
+
+class BulkResult:
+    """
+    Outcome of a bulk parse: one slot per input record, in input order.
+
+    A slot holds either the validated schema instance or, when the record
+    failed validation, ``None`` with its errors kept in ``errors`` under the
+    same index. Errors use the same shape as ``ValidationError.errors()``.
+    """
+
+    def __init__(self, size: int = 0) -> None:
+        self.instances: List[Optional["ModelSchema"]] = [None] * size
+        self.errors: RowErrors = {}
+
+    def __len__(self) -> int:
+        return len(self.instances)
+
+    def __iter__(self) -> Iterator[Union["ModelSchema", List[ErrorDict]]]:
+        for index, instance in enumerate(self.instances):
+            yield self.errors[index] if index in self.errors else instance  # type: ignore
+
+    @property
+    def is_valid(self) -> bool:
+        return not self.errors
+
+    @property
+    def valid(self) -> List["ModelSchema"]:
+        return [
+            instance
+            for index, instance in enumerate(self.instances)
+            if index not in self.errors and instance is not None
+        ]
+
+    def add_errors(self, index: int, errors: List[ErrorDict]) -> None:
+        if errors:
+            self.errors.setdefault(index, []).extend(errors)
+            self.instances[index] = None
+
+    def merge(self, errors: RowErrors) -> None:
+        for index, row_errors in errors.items():
+            self.add_errors(index, row_errors)
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def relation_fields(schema: Type["ModelSchema"]) -> Iterator[Tuple[str, Field]]:
+    """
+    Yield the schema fields that hold primary keys of related objects, i.e.
+    foreign keys and many-to-many lists rendered without nesting (`depth=0`).
+    """
+    model = schema.__config__.model  # type: ignore
+    for name, model_field in schema.__fields__.items():
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            continue
+        if not field.is_relation or not field.concrete:
+            continue
+        if lenient_issubclass(model_field.type_, BaseModel):
+            # nested schemas carry whole objects, not references
+            continue
+        yield name, field
+
+
+@no_type_check
+def related_target(field: Field) -> Tuple[Type[Model], str]:
+    if field.many_to_many:
+        return field.related_model, field.related_model._meta.pk.name
+    return field.related_model, field.target_field.name
+
+
+def existing_values(
+    model: Type[Model], lookup: str, values: Set[Any], using: Optional[str] = None
+) -> Set[Any]:
+    using = using or router.db_for_read(model)
+    values_list = list(values)
+    batch_size = connections[using].ops.bulk_batch_size([lookup], values_list)
+    found: Set[Any] = set()
+    for batch in chunked(values_list, max(batch_size, 1)):
+        found.update(
+            model._default_manager.using(using)
+            .filter(**{f"{lookup}__in": batch})
+            .values_list(lookup, flat=True)
+        )
+    return found
+
+
+def check_foreign_keys(
+    schema: Type["ModelSchema"],
+    instances: Iterable[Optional["ModelSchema"]],
+    *,
+    using: Optional[str] = None,
+) -> RowErrors:
+    """
+    Check that every related primary key referenced by `instances` exists,
+    running a single `IN` query per related model for the whole batch.
+
+    :param schema: the schema class the instances were validated with
+    :param instances: validated instances, ``None`` entries are skipped
+    :param using: database alias, defaults to the router's read database
+    :return: errors keyed by the position of the instance in `instances`
+    """
+    fields = list(relation_fields(schema))
+    rows = list(instances)
+    wanted: Dict[Tuple[Type[Model], str], Set[Any]] = defaultdict(set)
+
+    for instance in rows:
+        if instance is None:
+            continue
+        for name, field in fields:
+            value = getattr(instance, name, None)
+            if value is None:
+                continue
+            values = value if field.many_to_many else [value]
+            wanted[related_target(field)].update(values)
+
+    found = {
+        target: existing_values(target[0], target[1], values, using=using)
+        for target, values in wanted.items()
+    }
+
+    errors: RowErrors = {}
+    for index, instance in enumerate(rows):
+        if instance is None:
+            continue
+        for name, field in fields:
+            value = getattr(instance, name, None)
+            if value is None:
+                continue
+            target = related_target(field)
+            alias = schema.__fields__[name].alias
+            missing: List[Tuple[Tuple[Any, ...], Any]]
+            if field.many_to_many:
+                missing = [
+                    ((alias, position), item)
+                    for position, item in enumerate(value)
+                    if item not in found[target]
+                ]
+            else:
+                missing = [((alias,), value)] if value not in found[target] else []
+            errors.setdefault(index, []).extend(
+                {
+                    "loc": loc,
+                    "msg": f"{target[0]._meta.object_name} instance with "
+                    f"{target[1]} {item!r} does not exist.",
+                    "type": "value_error.related_does_not_exist",
+                }
+                for loc, item in missing
+            )
+        if not errors.get(index):
+            errors.pop(index, None)
+    return errors
+
+
+def unique_sets(schema: Type["ModelSchema"]) -> List[Tuple[str, ...]]:
+    """
+    Return the groups of field names that must be unique together for the
+    model of `schema`: `unique=True` fields, `unique_together` and
+    unconditional `UniqueConstraint`s. Groups that the schema doesn't fully
+    carry as plain values, and the primary key, are left out.
+    """
+    opts = schema.__config__.model._meta  # type: ignore
+    constraints = getattr(opts, "total_unique_constraints", None)
+    if constraints is None:  # pragma: no cover # Django < 3.1
+        constraints = [
+            constraint
+            for constraint in opts.constraints
+            if isinstance(constraint, UniqueConstraint) and constraint.condition is None
+        ]
+
+    candidates: List[Tuple[str, ...]] = [
+        (field.name,) for field in opts.fields if field.unique and not field.primary_key
+    ]
+    candidates += [tuple(names) for names in opts.unique_together]
+    candidates += [tuple(constraint.fields) for constraint in constraints]
+
+    groups: List[Tuple[str, ...]] = []
+    for names in candidates:
+        names = tuple(opts.get_field(name).name for name in names)
+        if names in groups or not all(
+            name in schema.__fields__
+            and not lenient_issubclass(schema.__fields__[name].type_, BaseModel)
+            for name in names
+        ):
+            continue
+        groups.append(names)
+    return groups
+
+
+def db_value(value: Any) -> Any:
+    return value.value if isinstance(value, Enum) else value
+
+
+def existing_keys(
+    model: Type[Model],
+    names: Tuple[str, ...],
+    keys: Set[Tuple[Any, ...]],
+    using: Optional[str] = None,
+) -> Dict[Tuple[Any, ...], Set[Any]]:
+    """Map each of `keys` found in the database to the pks of the rows holding it."""
+    using = using or router.db_for_read(model)
+    keys_list = list(keys)
+    batch_size = connections[using].ops.bulk_batch_size(list(names), keys_list)
+    found: Dict[Tuple[Any, ...], Set[Any]] = defaultdict(set)
+    for batch in chunked(keys_list, max(batch_size, 1)):
+        lookups = {
+            f"{name}__in": {key[position] for key in batch}
+            for position, name in enumerate(names)
+        }
+        rows = (
+            model._default_manager.using(using)
+            .filter(**lookups)
+            .values_list("pk", *names)
+        )
+        for pk, *values in rows:
+            # `__in` lookups per column may match combinations not asked for
+            if tuple(values) in keys:
+                found[tuple(values)].add(pk)
+    return found
+
+
+def check_unique_constraints(
+    schema: Type["ModelSchema"],
+    instances: Iterable[Optional["ModelSchema"]],
+    *,
+    using: Optional[str] = None,
+) -> RowErrors:
+    """
+    Check the unique constraints of the model of `schema` for a batch of
+    instances: duplicates within the batch are found in memory, collisions
+    with existing rows with one query per constraint.
+
+    Instances carrying the pk of an existing row don't collide with that row,
+    so the check also holds for updates. Like in SQL, values containing
+    ``None`` are never considered duplicates.
+
+    :return: errors keyed by the position of the instance in `instances`
+    """
+    model = schema.__config__.model  # type: ignore
+    opts = model._meta
+    pk_name = opts.pk.name if opts.pk.name in schema.__fields__ else None
+    rows = list(instances)
+    errors: RowErrors = {}
+
+    for names in unique_sets(schema):
+        keys: Dict[int, Tuple[Any, ...]] = {}
+        for index, instance in enumerate(rows):
+            if instance is None:
+                continue
+            key = tuple(db_value(getattr(instance, name)) for name in names)
+            if None not in key:
+                keys[index] = key
+        if not keys:
+            continue
+
+        labels = get_text_list(
+            [capfirst(opts.get_field(name).verbose_name) for name in names],
+            "and",
+        )
+        loc = (schema.__fields__[names[0]].alias,) if len(names) == 1 else ("__root__",)
+        model_name = capfirst(opts.verbose_name)
+
+        found = existing_keys(model, names, set(keys.values()), using=using)
+        seen: Set[Tuple[Any, ...]] = set()
+        for index, key in keys.items():
+            pk = getattr(rows[index], pk_name) if pk_name else None
+            if found.get(key, set()) - {pk}:
+                errors.setdefault(index, []).append(
+                    {
+                        "loc": loc,
+                        "msg": f"{model_name} with this {labels} already exists.",
+                        "type": "value_error.unique",
+                    }
+                )
+            elif key in seen:
+                errors.setdefault(index, []).append(
+                    {
+                        "loc": loc,
+                        "msg": f"{model_name} with this {labels} is duplicated in the batch.",
+                        "type": "value_error.unique.batch",
+                    }
+                )
+            seen.add(key)
+    return errors
+
+
+def run_batch_validators(
+    schema: Type["ModelSchema"], instances: List[Optional["ModelSchema"]]
+) -> RowErrors:
+    """
+    Call the `batch=True` model validators of `schema` once for the whole
+    list of `instances`, updating the values they return in place.
+
+    :return: errors keyed by the position of the instance in `instances`
+    """
+    errors: RowErrors = {}
+    for name, validators in schema.__batch_validators__.items():
+        if name not in schema.__fields__:
+            continue
+        alias = schema.__fields__[name].alias
+        for validator in validators:
+            positions = [
+                index
+                for index, instance in enumerate(instances)
+                if instance is not None and index not in errors
+            ]
+            if not positions:
+                return errors
+            values = [getattr(instances[index], name) for index in positions]
+            results = validator.func(schema, values)
+            if results is None or len(results) != len(values):
+                raise TypeError(
+                    f"Batch validator {validator.func.__name__} must return "
+                    f"one result per value ({len(values)})"
+                )
+            for index, value in zip(positions, results):
+                if isinstance(value, (ValueError, TypeError, AssertionError)):
+                    errors[index] = cast(
+                        List[ErrorDict],
+                        ValidationError(
+                            [ErrorWrapper(value, loc=alias)], schema
+                        ).errors(),
+                    )
+                else:
+                    object.__setattr__(instances[index], name, value)
+    return errors
+
+
+ValidatedRecord = Tuple[Optional["ModelSchema"], List[ErrorDict]]
+
+
+def validate_records(
+    schema: Type["ModelSchema"], records: List[Any]
+) -> List[ValidatedRecord]:
+    validated: List[ValidatedRecord] = []
+    for record in records:
+        try:
+            validated.append((schema.validate(record), []))
+        except ValidationError as e:
+            validated.append((None, cast(List[ErrorDict], e.errors())))
+    return validated
+
+
+def setup_worker() -> None:
+    # spawned workers start with an empty app registry and need
+    # `DJANGO_SETTINGS_MODULE`, forked ones inherit the parent's
+    if not apps.ready:
+        django.setup()
+
+
+def validate_in_pool(
+    schema: Type["ModelSchema"],
+    chunks: Iterator[List[Any]],
+    workers: int,
+    mp_context: Optional[BaseContext] = None,
+) -> Iterator[Tuple[List[Any], List[ValidatedRecord]]]:
+    """
+    Validate `chunks` in a pool of `workers` processes, yielding the results
+    in input order. Only a bounded number of chunks is in flight at once so
+    that large inputs aren't loaded in memory up front.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=mp_context, initializer=setup_worker
+    ) as executor:
+        pending: Deque[Tuple[List[Any], "Future[List[ValidatedRecord]]"]] = deque()
+        for chunk in chunks:
+            pending.append((chunk, executor.submit(validate_records, schema, chunk)))
+            if len(pending) >= workers * 2:
+                chunk, future = pending.popleft()
+                yield chunk, future.result()
+        while pending:
+            chunk, future = pending.popleft()
+            yield chunk, future.result()
+
+
+def parse_many(
+    schema: Type["ModelSchema"],
+    records: Iterable[Any],
+    *,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    check_related: bool = True,
+    check_unique: bool = True,
+    using: Optional[str] = None,
+    workers: Optional[int] = None,
+    mp_context: Optional[BaseContext] = None,
+) -> BulkResult:
+    """
+    Validate `records` (dicts or model instances) with `schema`, chunk by
+    chunk, collecting errors per record instead of stopping at the first one.
+    Batch validators run once per chunk, after the per-record validation.
+
+    With `workers`, the per-record validation of the chunks is spread over a
+    process pool, the schema being sent to the workers by reference (see
+    `SchemaFactory.get_schema_key`). Batch validators and the database checks
+    still run in the calling process.
+    """
+    chunks = chunked(records, chunk_size)
+    validated_chunks: Iterator[Tuple[List[Any], List[ValidatedRecord]]]
+    if workers and workers > 1:
+        validated_chunks = validate_in_pool(schema, chunks, workers, mp_context)
+    else:
+        validated_chunks = (
+            (chunk, validate_records(schema, chunk)) for chunk in chunks
+        )
+
+    result = BulkResult()
+    offset = 0
+    for chunk, validated in validated_chunks:
+        result.instances.extend([None] * len(chunk))
+        for index, (instance, errors) in enumerate(validated, start=offset):
+            result.instances[index] = instance
+            result.add_errors(index, errors)
+
+        checks: List[Callable[..., RowErrors]] = [run_batch_validators]
+        if check_related:
+            checks.append(partial(check_foreign_keys, using=using))
+        if check_unique:
+            checks.append(partial(check_unique_constraints, using=using))
+        for check in checks:
+            row_errors = check(schema, result.instances[offset : offset + len(chunk)])
+            result.merge({offset + index: err for index, err in row_errors.items()})
+        offset += len(chunk)
+    return result
+
+
+def model_values(
+    instance: "ModelSchema",
+) -> Tuple[Dict[str, Any], Dict[Field, List[Any]]]:
+    """
+    Split the values of a schema instance into concrete model field values,
+    keyed by attname, and many-to-many pk lists, keyed by field.
+    """
+    schema = type(instance)
+    model = schema.__config__.model  # type: ignore
+    values: Dict[str, Any] = {}
+    many_to_many: Dict[Field, List[Any]] = {}
+    for name in schema.__fields__:
+        field = get_model_field(model, name)
+        if field is None or not field.concrete:
+            continue
+        value = getattr(instance, name)
+        if field.many_to_many:
+            if value is not None:
+                many_to_many[field] = [related_pk(field, item) for item in value]
+        elif field.is_relation:
+            values[field.attname] = related_pk(field, value)
+        elif not (field.primary_key and value is None):
+            values[field.attname] = db_value(value)
+    return values, many_to_many
+
+
+@no_type_check
+def related_pk(field: Field, value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        # nested schema, `depth > 0`
+        return getattr(value, related_target(field)[1], None)
+    return value
+
+
+def to_models(
+    schema: Type["ModelSchema"], instances: Iterable["ModelSchema"]
+) -> Tuple[List[Model], List[Dict[Field, List[Any]]]]:
+    model = schema.__config__.model  # type: ignore
+    objs, relations = [], []
+    for instance in instances:
+        values, many_to_many = model_values(instance)
+        objs.append(model(**values))
+        relations.append(many_to_many)
+    return objs, relations
+
+
+@no_type_check
+def create_many_to_many(
+    objs: List[Model],
+    relations: List[Dict[Field, List[Any]]],
+    using: str,
+    batch_size: Optional[int] = None,
+) -> None:
+    rows: Dict[Field, List[Model]] = defaultdict(list)
+    for obj, many_to_many in zip(objs, relations):
+        for field, pks in many_to_many.items():
+            if pks and obj.pk is None:
+                raise ValueError(
+                    f"Can't set '{field.name}' on {type(obj).__name__} objects: "
+                    "the database didn't return the primary keys of the created rows"
+                )
+            through = field.remote_field.through
+            source = through._meta.get_field(field.m2m_field_name()).attname
+            target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+            rows[field].extend(through(**{source: obj.pk, target: pk}) for pk in pks)
+    for field, through_objs in rows.items():
+        field.remote_field.through._default_manager.using(using).bulk_create(
+            through_objs, batch_size=batch_size
+        )
+
+
+def bulk_create(
+    schema: Type["ModelSchema"],
+    instances: Iterable["ModelSchema"],
+    *,
+    batch_size: Optional[int] = None,
+    using: Optional[str] = None,
+    ignore_conflicts: bool = False,
+) -> List[Model]:
+    """
+    Create the model rows of `instances` with `bulk_create`, many-to-many
+    links included, in a single transaction.
+    """
+    model = schema.__config__.model  # type: ignore
+    using = using or router.db_for_write(model)
+    objs, relations = to_models(schema, instances)
+    with transaction.atomic(using=using, savepoint=False):
+        objs = model._default_manager.using(using).bulk_create(
+            objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts
+        )
+        if not ignore_conflicts:
+            create_many_to_many(objs, relations, using, batch_size=batch_size)
+    return cast(List[Model], objs)
+
+
+def update_fields(schema: Type["ModelSchema"]) -> List[str]:
+    """The concrete, non many-to-many model fields of `schema`."""
+    model = schema.__config__.model  # type: ignore
+    return [
+        field.name
+        for field in map(partial(get_model_field, model), schema.__fields__)
+        if field is not None
+        and field.concrete
+        and not field.primary_key
+        and not field.many_to_many
+    ]
+
+
+def bulk_update(
+    schema: Type["ModelSchema"],
+    instances: Iterable["ModelSchema"],
+    fields: Optional[List[str]] = None,
+    *,
+    batch_size: Optional[int] = None,
+    using: Optional[str] = None,
+) -> int:
+    """
+    Update the model rows of `instances`, matched by primary key, with
+    `bulk_update`. `fields` defaults to the concrete, non many-to-many model
+    fields of the schema.
+    """
+    model = schema.__config__.model  # type: ignore
+    using = using or router.db_for_write(model)
+    if fields is None:
+        fields = update_fields(schema)
+    objs, _ = to_models(schema, instances)
+    with transaction.atomic(using=using, savepoint=False):
+        updated = model._default_manager.using(using).bulk_update(
+            objs, fields, batch_size=batch_size
+        )
+    # Django returns the number of rows matched from 4.0 only
+    return len(objs) if updated is None else cast(int, updated)
+
+
+async def abulk_create(
+    schema: Type["ModelSchema"],
+    instances: Iterable["ModelSchema"],
+    *,
+    batch_size: Optional[int] = None,
+    using: Optional[str] = None,
+    ignore_conflicts: bool = False,
+) -> List[Model]:
+    """
+    Async counterpart of `bulk_create`. Instances without many-to-many links
+    are created with the queryset's `abulk_create`, others in Django's sync
+    executor, in a single transaction.
+    """
+    model = schema.__config__.model  # type: ignore
+    using = using or router.db_for_write(model)
+    instances = list(instances)
+    objs, relations = to_models(schema, instances)
+    if ASYNC_QUERYSETS and (
+        ignore_conflicts or not any(any(links.values()) for links in relations)
+    ):
+        return cast(
+            List[Model],
+            await model._default_manager.using(using).abulk_create(
+                objs, batch_size=batch_size, ignore_conflicts=ignore_conflicts
+            ),
+        )
+    return await sync_to_async(bulk_create)(
+        schema,
+        instances,
+        batch_size=batch_size,
+        using=using,
+        ignore_conflicts=ignore_conflicts,
+    )
+
+
+async def abulk_update(
+    schema: Type["ModelSchema"],
+    instances: Iterable["ModelSchema"],
+    fields: Optional[List[str]] = None,
+    *,
+    batch_size: Optional[int] = None,
+    using: Optional[str] = None,
+) -> int:
+    """
+    Async counterpart of `bulk_update`, with the queryset's `abulk_update`
+    where Django has it.
+    """
+    if not ASYNC_QUERYSETS:
+        return await sync_to_async(bulk_update)(
+            schema, list(instances), fields, batch_size=batch_size, using=using
+        )
+    model = schema.__config__.model  # type: ignore
+    using = using or router.db_for_write(model)
+    objs, _ = to_models(schema, instances)
+    return cast(
+        int,
+        await model._default_manager.using(using).abulk_update(
+            objs, update_fields(schema) if fields is None else fields, batch_size
+        ),
+    )
+
+
+def in_atomic_block() -> bool:
+    return any(connection.in_atomic_block for connection in connections.all())
+
+
+def run_closing_connections(
+    operation: Callable[..., Any], *args: Any, **kwargs: Any
+) -> Any:
+    try:
+        return operation(*args, **kwargs)
+    finally:
+        # the thread's own connections, see `run_grouped`
+        connections.close_all()
+
+
+async def run_grouped(
+    operation: Callable[..., Any],
+    instances: Iterable["ModelSchema"],
+    concurrency: int,
+    chunk_size: int,
+    **kwargs: Any,
+) -> Dict[Type["ModelSchema"], List[Any]]:
+    """
+    Run `operation`, a sync bulk operation, for the chunks of `instances` of
+    each schema, at most `concurrency` at a time.
+
+    The sync executor runs one call at a time, so the chunks run in threads
+    of their own, with their own database connections. They can't see rows
+    written in a transaction of the calling code, so inside an atomic block
+    they run one after the other in the sync executor instead.
+    """
+    groups: Dict[Type["ModelSchema"], List["ModelSchema"]] = defaultdict(list)
+    for instance in instances:
+        groups[type(instance)].append(instance)
+
+    if concurrency < 2 or await sync_to_async(in_atomic_block)():
+        call = sync_to_async(operation)
+    else:
+        call = sync_to_async(
+            partial(run_closing_connections, operation), thread_sensitive=False
+        )
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(schema: Type["ModelSchema"], chunk: List["ModelSchema"]) -> Any:
+        async with semaphore:
+            return await call(schema, chunk, **kwargs)
+
+    tasks = {
+        schema: [run(schema, chunk) for chunk in chunked(group, chunk_size)]
+        for schema, group in groups.items()
+    }
+    results = await asyncio.gather(*chain.from_iterable(tasks.values()))
+    grouped: Dict[Type["ModelSchema"], List[Any]] = {}
+    position = 0
+    for schema, schema_tasks in tasks.items():
+        grouped[schema] = list(results[position : position + len(schema_tasks)])
+        position += len(schema_tasks)
+    return grouped
+
+
+async def abulk_create_many(
+    instances: Iterable["ModelSchema"],
+    *,
+    concurrency: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Dict[Type["ModelSchema"], List[Model]]:
+    """
+    Create the rows of schema instances of several, independent, models:
+    instances are grouped by schema and the chunks run concurrently, at most
+    `concurrency` at a time, see `run_grouped`. Each chunk is created in its
+    own transaction;
+    instances referencing rows created in the same call must be created in a
+    previous call instead.
+
+    :return: the created model objects per schema
+    """
+    grouped = await run_grouped(
+        bulk_create, instances, concurrency, chunk_size, **kwargs
+    )
+    return {schema: list(chain.from_iterable(objs)) for schema, objs in grouped.items()}
+
+
+async def abulk_update_many(
+    instances: Iterable["ModelSchema"],
+    *,
+    concurrency: int = 4,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Dict[Type["ModelSchema"], int]:
+    """
+    Update the rows of schema instances of several models, see
+    `abulk_create_many`.
+
+    :return: the number of updated rows per schema
+    """
+    grouped = await run_grouped(
+        bulk_update, instances, concurrency, chunk_size, **kwargs
+    )
+    return {schema: sum(counts) for schema, counts in grouped.items()}
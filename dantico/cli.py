@@ -0,0 +1,212 @@
+import argparse
+import importlib
+import json
+import os
+import time
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Set, Type
+
+from dantico.build_stats import builds
+from dantico.schema_registry import SchemaRegister, registry as global_registry
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+from pydantic.utils import lenient_issubclass
+
+if TYPE_CHECKING:
+    from dantico.model_schema import ModelSchema
+
+__all__ = ["describe_schema", "get_schemas", "main", "time_schema"]
+
+
+def get_schemas(
+    registry: SchemaRegister = global_registry,
+) -> List[Type["ModelSchema"]]:
+    """
+    Return the model schemas registered in `registry`, made by
+    `SchemaFactory`, and the `ModelSchema` subclasses built so far.
+    """
+    found: List[Any] = [*registry.schemas.values(), *registry.keys.values()]
+    found.extend(build.schema() for build in builds if build.schema)
+    # in order of appearance, once
+    schemas = dict.fromkeys(
+        schema
+        for schema in found
+        if schema is not None and getattr(schema.__config__, "model", None)
+    )
+    return list(schemas)
+
+
+def field_types(field: ModelField) -> Iterator[Any]:
+    """The types of `field`, with the ones of lists, unions and dicts."""
+    yield field.type_
+    for sub_field in field.sub_fields or ():
+        yield from field_types(sub_field)
+    if field.key_field:
+        yield from field_types(field.key_field)
+
+
+def walk_schema(
+    schema: Type[BaseModel], nested: Set[type], enums: Set[type], depth: int = 0
+) -> int:
+    """
+    Collect the nested schemas and enums of `schema` into `nested` and
+    `enums`, returning how deep schemas nest under it.
+    """
+    deepest = depth
+    for field in schema.__fields__.values():
+        for type_ in field_types(field):
+            if lenient_issubclass(type_, Enum):
+                enums.add(type_)
+            elif lenient_issubclass(type_, BaseModel):
+                if type_ in nested or type_ is schema:
+                    # recursive schemas nest as deep as the data does
+                    continue
+                nested.add(type_)
+                deepest = max(deepest, walk_schema(type_, nested, enums, depth + 1))
+    return deepest
+
+
+def describe_schema(schema: Type["ModelSchema"]) -> Dict[str, Any]:
+    """The fields, nested schemas and enums of `schema`, counted."""
+    nested: Set[type] = set()
+    enums: Set[type] = set()
+    depth = walk_schema(schema, nested, enums)
+    if global_registry.get_schema_key(schema):
+        # made by `SchemaFactory`, the module is the one calling `type`
+        name = f"factory:{schema.__qualname__}"
+    else:
+        name = f"{schema.__module__}.{schema.__qualname__}"
+    return {
+        "schema": name,
+        "model": schema.__config__.model._meta.label,  # type: ignore
+        "fields": len(schema.__fields__),
+        "depth": depth,
+        "nested": len(nested),
+        "enums": len(enums),
+    }
+
+
+def time_schema(schema: Type["ModelSchema"], rows: int) -> Dict[str, Any]:
+    """
+    Serialize up to `rows` rows of the model of `schema` with
+    `from_queryset`, returning the time and queries per row.
+    """
+    from dantico.queries import track_queries
+
+    model = schema.__config__.model  # type: ignore
+    queryset = model._default_manager.all()[:rows]
+    with track_queries() as stats:
+        start = time.perf_counter()
+        count = len(schema.from_queryset(queryset))
+        duration = time.perf_counter() - start
+    if not count:
+        return {"rows": 0}
+    return {
+        "rows": count,
+        "ms_per_row": duration * 1000 / count,
+        "queries_per_row": stats.count / count,
+        "n_plus_one": stats.n_plus_one,
+    }
+
+
+def format_table(rows: List[Dict[str, Any]], timed: bool) -> str:
+    header = ["schema", "model", "fields", "depth", "nested", "enums"]
+    if timed:
+        header += ["rows", "ms/row", "queries/row"]
+    lines = [header]
+    notes = []
+    for row in rows:
+        line = [str(row[name]) for name in header[:6]]
+        if timed and row.get("rows"):
+            line += [
+                str(row["rows"]),
+                f"{row['ms_per_row']:.3f}",
+                f"{row['queries_per_row']:.2f}",
+            ]
+        elif timed:
+            line += ["error" if "error" in row else "0", "-", "-"]
+        lines.append(line)
+        if "error" in row:
+            notes.append(f"{row['schema']}: {row['error']}")
+        for path, times in row.get("n_plus_one", {}).items():
+            notes.append(f"{row['schema']}: N+1 queries reading {path} ({times} times)")
+    widths = [max(len(line[i]) for line in lines) for i in range(len(header))]
+    table = [
+        "  ".join(
+            cell.ljust(width) if i < 2 else cell.rjust(width)
+            for i, (cell, width) in enumerate(zip(line, widths))
+        ).rstrip()
+        for line in lines
+    ]
+    return "\n".join(table + ([""] + notes if notes else []))
+
+
+def setup(settings: Optional[str], modules: List[str], autodiscover: bool) -> None:
+    """Set Django up with `settings` and import the modules defining schemas."""
+    import django
+    from django.apps import apps
+    from django.utils.module_loading import autodiscover_modules
+
+    if settings:
+        os.environ["DJANGO_SETTINGS_MODULE"] = settings
+    if not apps.ready:
+        django.setup()
+    if autodiscover:
+        autodiscover_modules("schemas")
+    for module in modules:
+        importlib.import_module(module)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m dantico",
+        description="List the schemas of a Django project, and time them.",
+    )
+    parser.add_argument(
+        "--settings", help="settings module, DJANGO_SETTINGS_MODULE when omitted"
+    )
+    parser.add_argument(
+        "-m",
+        "--module",
+        action="append",
+        default=[],
+        help="module defining schemas to import, besides the 'schemas' modules "
+        "of the installed apps",
+    )
+    parser.add_argument(
+        "--no-autodiscover",
+        action="store_true",
+        help="don't import the 'schemas' module of the installed apps",
+    )
+    parser.add_argument(
+        "-k", "--filter", default="", help="only the schemas with this in their name"
+    )
+    parser.add_argument(
+        "--time",
+        action="store_true",
+        help="serialize a sample of each schema's model, to time it",
+    )
+    parser.add_argument("--rows", type=int, default=100, help="rows in a sample")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    setup(args.settings, args.module, not args.no_autodiscover)
+
+    results = []
+    for schema in get_schemas():
+        result = describe_schema(schema)
+        if args.filter not in result["schema"]:
+            continue
+        if args.time:
+            try:
+                result.update(time_schema(schema, args.rows))
+            except Exception as error:
+                # e.g. rows the schema doesn't validate, the others are timed
+                result["error"] = f"{type(error).__name__}: {error}"
+        results.append(result)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results, args.time))
+    return 0
@@ -1,2 +1,6 @@
 class ConfigError(Exception):
     pass
+
+
+class NPlusOneError(Exception):
+    pass
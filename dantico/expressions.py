@@ -0,0 +1,28 @@
+from typing import Any
+
+from django.db.models.expressions import Combinable
+from pydantic.fields import FieldInfo
+
+__all__ = ["SQLField", "SQLFieldInfo"]
+
+
+class SQLFieldInfo(FieldInfo):
+    __slots__ = ("expression",)
+
+    def __init__(self, expression: Combinable, **kwargs: Any) -> None:
+        kwargs.setdefault("default", None)
+        super().__init__(**kwargs)
+        self.expression = expression
+
+
+def SQLField(expression: Combinable, **kwargs: Any) -> Any:
+    """
+    Declare a schema field computed by the database from an ORM expression,
+    e.g. `full_name: str = SQLField(Concat("first", Value(" "), "last"))`.
+
+    Querysets serialized with the schema are annotated with the expression,
+    objects loaded otherwise compute it in a query of their own.
+
+    :param kwargs: arguments of pydantic's `Field`, the default being `None`
+    """
+    return SQLFieldInfo(expression, **kwargs)
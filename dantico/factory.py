@@ -1,7 +1,26 @@
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type, Union, cast
+from contextlib import contextmanager
+from itertools import count
+from threading import RLock
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    ForwardRef,
+    Iterator,
+    List,
+    Optional,
+    Type,
+    Union,
+    cast,
+)
 
 from dantico.exceptions import ConfigError
-from dantico.schema_registry import SchemaRegister, registry as schema_registry
+from dantico.schema_registry import (
+    SchemaKey,
+    SchemaRegister,
+    registry as schema_registry,
+)
+from django.apps import apps
 from django.db.models import Model
 
 if TYPE_CHECKING:
@@ -13,6 +32,14 @@ __all__ = [
     "SchemaFactory",
 ]
 
+# makes the names of forward references to schemas being created unique
+forward_refs = count()
+
+# schemas are created one thread at a time: the forward references of
+# `SchemaFactory.building` are shared by all threads, and schemas are also
+# created lazily while serializing, e.g. for generic foreign keys
+building_lock = RLock()
+
 
 class SchemaFactory:
     @classmethod
@@ -34,7 +61,8 @@ class SchemaFactory:
         depth: int = 0,
         fields: Optional[List[str]] = None,
         exclude: Optional[List[str]] = None,
-        skip_registry: bool = False
+        skip_registry: bool = False,
+        recursive: bool = False,
     ) -> Union[Type["ModelSchema"], Type["Schema"], None]:
         from dantico.model_schema import ModelSchema
 
@@ -43,24 +71,140 @@ class SchemaFactory:
         if fields and exclude:
             raise ConfigError("Only one of 'include' or 'exclude' should be set.")
 
-        schema = registry.get_model_schema(model)
-        if schema:
-            return schema
+        with building_lock:
+            if not recursive:
+                schema = registry.get_model_schema(model)
+                if schema:
+                    return schema
+
+            options: Dict[str, Any] = dict(
+                name=name,
+                depth=depth,
+                fields=fields,
+                exclude=exclude,
+                skip_registry=skip_registry,
+            )
+            if recursive:
+                options.update(recursive=True)
+            key = cls.get_schema_key(model, **options)
+            # schemas created with the same options are only created once
+            schema = registry.get_schema_by_key(key)
+            if schema:
+                return schema
+
+            model_config_kwargs = dict(
+                model=model,
+                include=fields,
+                exclude=exclude,
+                skip_registry=skip_registry,
+                depth=depth,
+                registry=registry,
+                recursive=recursive,
+            )
+            model_config = cls.get_model_config(**model_config_kwargs)  # type: ignore
 
-        model_config_kwargs = dict(
-            model=model,
-            include=fields,
-            exclude=exclude,
+            attrs = dict(Config=model_config)
+
+            with cls.building(key, name, registry=registry):
+                new_schema = type(name, (ModelSchema,), attrs)
+                new_schema = cast(Type[ModelSchema], new_schema)
+                registry.built.append((registry.building[key], new_schema))
+            # recursive schemas aren't the default schema of their model
+            if not skip_registry and not recursive:
+                registry.register_model(model, new_schema)
+            registry.register_schema_key(key, new_schema)
+            return new_schema
+
+    @classmethod
+    @contextmanager
+    def building(
+        cls, key: SchemaKey, name: str, *, registry: SchemaRegister
+    ) -> Iterator[None]:
+        """
+        Mark the schema for `key` as being created: relations leading back to
+        it get a forward reference, resolved once the outermost schema being
+        created is done.
+        """
+        outermost = not registry.building
+        registry.building[key] = f"{name}_{next(forward_refs)}"
+        try:
+            yield
+        finally:
+            del registry.building[key]
+            if outermost:
+                built = dict(registry.built)
+                registry.built.clear()
+        if outermost:
+            for schema in built.values():
+                schema.update_forward_refs(**built)
+
+    @classmethod
+    def create_related_schema(
+        cls,
+        model: Type[Model],
+        *,
+        registry: SchemaRegister = schema_registry,
+        skip_registry: bool = False,
+    ) -> Union[Type["ModelSchema"], ForwardRef]:
+        """
+        Return the recursive schema of `model`, or a forward reference to it
+        when it is being created, i.e. on a cycle of relations.
+        """
+        key = cls.get_schema_key(
+            model,
+            name=model.__name__,
+            depth=0,
+            fields=None,
+            exclude=None,
             skip_registry=skip_registry,
-            depth=depth,
-            registry=registry,
+            recursive=True,
         )
-        model_config = cls.get_model_config(**model_config_kwargs)  # type: ignore
+        with building_lock:
+            if key in registry.building:
+                return ForwardRef(registry.building[key])
+            return cast(
+                Type["ModelSchema"],
+                cls.create_schema(
+                    model,
+                    registry=registry,
+                    skip_registry=skip_registry,
+                    recursive=True,
+                ),
+            )
 
-        attrs = dict(Config=model_config)
+    @classmethod
+    def get_schema_key(cls, model: Type[Model], **options: Any) -> SchemaKey:
+        """
+        Return a hashable, picklable key made of the model label and the
+        `create_schema` options, from which the schema can be created again
+        in another process.
+        """
+        return (
+            model._meta.label,
+            tuple(
+                sorted(
+                    (key, tuple(value) if isinstance(value, list) else value)
+                    for key, value in options.items()
+                )
+            ),
+        )
 
-        new_schema = type(name, (ModelSchema,), attrs)
-        new_schema = cast(Type[ModelSchema], new_schema)
-        if not skip_registry:
-            registry.register_model(model, new_schema)
-        return new_schema
+    @classmethod
+    def create_schema_from_key(
+        cls, key: SchemaKey, *, registry: SchemaRegister = schema_registry
+    ) -> Type["ModelSchema"]:
+        schema = registry.get_schema_by_key(key)
+        if schema:
+            return schema
+
+        label, options = key
+        kwargs: Dict[str, Any] = {
+            name: list(value) if isinstance(value, tuple) else value
+            for name, value in options
+        }
+        schema = cast(
+            Type["ModelSchema"],
+            cls.create_schema(apps.get_model(label), registry=registry, **kwargs),
+        )
+        registry.register_schema_key(key, schema)
+        return schema
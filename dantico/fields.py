@@ -15,16 +15,20 @@ from typing import (
     Type,
     TypeVar,
     Union,
+    cast,
     no_type_check,
 )
 from uuid import UUID
+from dantico.binary_fields import Binary
+from dantico.build_stats import recording_enum
 from dantico.factory import SchemaFactory
 from dantico.schema_registry import SchemaRegister, registry as global_registry
+from dantico.utils import is_generic_foreign_key
 from django.db import models
 import django
 from django.db.models.fields import Field
 from django.utils.encoding import force_str
-from pydantic import AnyUrl, EmailStr, IPvAnyAddress, Json
+from pydantic import AnyUrl, BaseModel, EmailStr, IPvAnyAddress
 from pydantic.fields import FieldInfo, Undefined
 
 if TYPE_CHECKING:
@@ -57,7 +61,7 @@ FIELD_MAP: Dict[str, _ComplexPyType] = {
     "SmallIntegerField": int,
     "BigIntegerField": int,
     "IntegerField": int,
-    "BinaryField": bytes,
+    "BinaryField": (Binary, {"is_custom_type": True}),
     "IPAddressField": IPvAnyAddress,
     "GenericIPAddressField": IPvAnyAddress,
     "FloatField": float,
@@ -71,6 +75,45 @@ FIELD_MAP: Dict[str, _ComplexPyType] = {
 }
 
 
+class ChoicesEnum(Enum):
+    """
+    Base of the enums created for fields with choices. The enums are created
+    at runtime so they can't be pickled by import path, instead their members
+    pickle by the enum's name and choices and are looked up, or created again,
+    through the registry.
+    """
+
+    __choices_key__: Tuple[str, Tuple[Tuple[str, Any], ...]]
+
+    def __reduce_ex__(self, protocol: Any) -> Tuple[Any, Tuple]:
+        return get_choices_enum_member, (type(self).__choices_key__, self.value)
+
+
+def get_choices_enum(
+    name: str,
+    named_choices: Iterable[Tuple[str, Any]],
+    *,
+    registry: SchemaRegister = global_registry,
+    module: str = __name__,
+) -> Type[ChoicesEnum]:
+    key = (name, tuple(named_choices))
+    if key not in registry.enums:
+        with recording_enum():
+            enum = cast(
+                Type[ChoicesEnum],
+                ChoicesEnum(name, list(key[1]), module=module),  # type: ignore [call-arg]
+            )
+        enum.__choices_key__ = key
+        registry.enums[key] = enum
+    return cast(Type[ChoicesEnum], registry.enums[key])
+
+
+def get_choices_enum_member(
+    key: Tuple[str, Tuple[Tuple[str, Any], ...]], value: Any
+) -> ChoicesEnum:
+    return get_choices_enum(*key)(value)
+
+
 def is_valid_name(name: str) -> None:
     """
     Checks that the given choice name for choices is valid.
@@ -146,9 +189,18 @@ def django_to_pydantic_with_choices(
     registry: SchemaRegister,
     depth: int = 0,
     skip_registry: bool = False,
+    recursive: bool = False,
 ) -> Tuple[Type, FieldInfo]:
+    if is_generic_foreign_key(field):
+        return generic_foreign_key_to_pydantic(  # type: ignore [no-any-return]
+            field, registry=registry
+        )
     return django_to_pydantic(
-        field, registry=registry, depth=depth, skip_registry=skip_registry
+        field,
+        registry=registry,
+        depth=depth,
+        skip_registry=skip_registry,
+        recursive=recursive,
     )
 
 
@@ -192,15 +244,67 @@ def create_many_to_many_link_type(
     return ManyToManyLink
 
 
+@no_type_check
+def create_generic_related_type(registry: SchemaRegister) -> Type:
+    class GenericRelatedObject:
+        @classmethod
+        def __get_validators__(cls):
+            yield cls.validate
+
+        @classmethod
+        def __modify_schema__(cls, field_schema):
+            field_schema.update(type="object")
+
+        @classmethod
+        def validate(cls, v):
+            """
+            Serialize the target of a generic foreign key with the schema
+            registered for its model, created with `SchemaFactory` when none is,
+            without registering it as the model's schema.
+            """
+            if isinstance(v, (dict, BaseModel)):
+                return v
+            if isinstance(v, models.Model):
+                schema = registry.get_model_schema(
+                    type(v)
+                ) or SchemaFactory.create_schema(
+                    type(v), registry=registry, skip_registry=True
+                )
+                return schema.from_orm(v)
+            raise ValueError("Incorrect type")
+
+    return GenericRelatedObject
+
+
+@no_type_check
+def generic_foreign_key_to_pydantic(
+    field: Any, *, registry: SchemaRegister
+) -> Tuple[Type, FieldInfo]:
+    return (
+        Optional[create_generic_related_type(registry)],
+        FieldInfo(default=None, title=field.name.replace("_", " ").title()),
+    )
+
+
 @no_type_check
 def construct_related_field_schema(
-    field: Field, *, registry: SchemaRegister, depth: int, skip_registry=False
+    field: Field,
+    *,
+    registry: SchemaRegister,
+    depth: int,
+    skip_registry=False,
+    recursive=False,
 ) -> Tuple[Type["ModelSchema"], FieldInfo]:
     # Create a sample config and return the type
     model = field.related_model
-    schema = SchemaFactory.create_schema(
-        model, depth=depth - 1, registry=registry, skip_registry=skip_registry
-    )
+    if recursive:
+        schema = SchemaFactory.create_related_schema(
+            model, registry=registry, skip_registry=skip_registry
+        )
+    else:
+        schema = SchemaFactory.create_schema(
+            model, depth=depth - 1, registry=registry, skip_registry=skip_registry
+        )
     default = ...
     if not field.concrete and field.auto_created or field.null:
         default = None
@@ -271,7 +375,7 @@ def construct_field_info(
     if field.choices:
         choices = list(get_choices(field.choices))
         named_choices = [(c[2], c[1]) for c in choices]
-        python_type = Enum(  # type: ignore
+        python_type = get_choices_enum(
             f"{field.name.title().replace('_', '')}Enum",
             named_choices,
             module=__module__,
@@ -319,11 +423,20 @@ def one_to_one_field_to_django_model(
 @django_to_pydantic.register(models.ManyToManyRel)
 @django_to_pydantic.register(models.ManyToOneRel)
 def field_to_list_or_connection(
-    field: Field, registry=None, depth=0, skip_registry=False, **kwargs: Dict[str, Any]
+    field: Field,
+    registry=None,
+    depth=0,
+    skip_registry=False,
+    recursive=False,
+    **kwargs: Dict[str, Any],
 ) -> Tuple[Type, FieldInfo]:
-    if depth > 0:
+    if depth > 0 or recursive:
         return construct_related_field_schema(
-            field, depth=depth, registry=registry, skip_registry=skip_registry
+            field,
+            depth=depth,
+            registry=registry,
+            skip_registry=skip_registry,
+            recursive=recursive,
         )
     return construct_relational_field_info(field, registry=registry, depth=depth)
 
@@ -336,14 +449,16 @@ def field_to_django_model(
     registry: Optional[SchemaRegister] = None,
     depth: int = 0,
     skip_registry: bool = False,
+    recursive: bool = False,
     **kwargs: Dict[str, Any],
 ) -> Tuple[Type, FieldInfo]:
-    if depth > 0:
+    if depth > 0 or recursive:
         return construct_related_field_schema(
             field,
             depth=depth,
             registry=registry or global_registry,
             skip_registry=skip_registry,
+            recursive=recursive,
         )
     return construct_relational_field_info(field, registry=registry, depth=depth)
 
@@ -352,10 +467,12 @@ if django.VERSION >= (3, 1):
 
     @no_type_check
     @django_to_pydantic.register(models.JSONField)
-    def field_to_json_string(
+    def field_to_json_value(
         field: Field, **kwargs: Dict[str, Any]
     ) -> Tuple[Type, FieldInfo]:
-        python_type = Json
+        # values decoded by the field, annotate the field with a schema to
+        # validate them, see `Config.raw_json` to keep them as text
+        python_type = Any
         if field.null:
-            python_type = Optional[Json]
+            python_type = Optional[Any]
         return construct_field_info(python_type, field)
@@ -0,0 +1,121 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Set, Tuple
+
+from django.core.files.storage import Storage
+from django.core.signals import setting_changed
+from django.db.models.fields.files import FieldFile
+
+__all__ = [
+    "FileURLResolver",
+    "file_url",
+    "get_url_resolver",
+    "set_url_resolver",
+]
+
+DEFAULT_TTL = 60.0
+DEFAULT_MAXSIZE = 10_000
+
+
+class FileURLResolver:
+    """
+    Resolve the URLs of stored files, caching them for `ttl` seconds by
+    storage and file name, at most `maxsize` of them.
+
+    Storages signing URLs can sign many names at once by having a
+    `urls(names)` method returning the URLs by name, called by `prefetch`
+    for the files of the rows being serialized by `from_queryset`.
+    Subclasses can override `resolve` to resolve URLs another way.
+
+    The cache should expire before the URLs do, e.g. signed URLs valid for
+    an hour can be cached a few minutes.
+    """
+
+    def __init__(
+        self, ttl: Optional[float] = DEFAULT_TTL, maxsize: int = DEFAULT_MAXSIZE
+    ) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        # URL and when it expires, by storage and name, oldest first
+        self.cache: "OrderedDict[Tuple[Storage, str], Tuple[str, float]]" = (
+            OrderedDict()
+        )
+        self.lock = threading.Lock()
+
+    def resolve(self, storage: Storage, names: Sequence[str]) -> Mapping[str, str]:
+        """Return the URLs of the files `names` of `storage`, by name."""
+        urls = getattr(storage, "urls", None)
+        if urls is not None and len(names) > 1:
+            return urls(names)  # type: ignore [no-any-return]
+        return {name: storage.url(name) for name in names}
+
+    def url(self, file: FieldFile) -> Optional[str]:
+        """Return the URL of `file`, `None` when it has no file."""
+        if not file:
+            return None
+        name = str(file.name)
+        cached = self.cache.get((file.storage, name))
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        url = self.resolve(file.storage, [name])[name]
+        self.store(file.storage, {name: url})
+        return url
+
+    def prefetch(self, files: Iterable[FieldFile]) -> None:
+        """
+        Resolve the URLs of `files` that aren't cached, with one call to
+        `resolve` per storage.
+        """
+        now = time.monotonic()
+        missing: Dict[Storage, Set[str]] = {}
+        for file in files:
+            if not file:
+                continue
+            name = str(file.name)
+            cached = self.cache.get((file.storage, name))
+            if cached is None or cached[1] <= now:
+                missing.setdefault(file.storage, set()).add(name)
+        for storage, names in missing.items():
+            self.store(storage, self.resolve(storage, sorted(names)))
+
+    def store(self, storage: Storage, urls: Mapping[str, str]) -> None:
+        if self.ttl is not None and self.ttl <= 0:
+            return
+        expires = float("inf") if self.ttl is None else time.monotonic() + self.ttl
+        with self.lock:
+            for name, url in urls.items():
+                self.cache[storage, name] = (url, expires)
+                self.cache.move_to_end((storage, name))
+            while len(self.cache) > self.maxsize:
+                self.cache.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+
+
+resolver = FileURLResolver()
+
+
+def get_url_resolver() -> FileURLResolver:
+    return resolver
+
+
+def set_url_resolver(new_resolver: FileURLResolver) -> None:
+    """Use `new_resolver` for the URLs of the files serialized from now on."""
+    global resolver
+    resolver = new_resolver
+
+
+def file_url(file: FieldFile) -> Optional[str]:
+    """The URL of `file`, as serialized, see `FileURLResolver`."""
+    return resolver.url(file)
+
+
+def clear_cache(*, setting: str, **kwargs: Any) -> None:
+    if setting in ("MEDIA_URL", "STORAGES", "DEFAULT_FILE_STORAGE"):
+        resolver.clear()
+
+
+setting_changed.connect(clear_cache)
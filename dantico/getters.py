@@ -1,6 +1,10 @@
+from time import perf_counter
 from typing import Any
 
 import pydantic
+from dantico.files import file_url
+from dantico.profiling import current_profile
+from dantico.queries import current_path, current_stats
 from django.db.models import Manager, QuerySet
 from django.db.models.fields.files import FieldFile
 from pydantic.utils import GetterDict
@@ -15,11 +19,28 @@ __all__ = [
 
 class DjangoGetter(GetterDict):
     def get(self, key: Any, default: Any = None) -> Any:
+        stats, profile = current_stats.get(), current_profile.get()
+        if stats is None and profile is None:
+            return self.get_value(key, default)
+        token = None
+        if stats is not None:
+            # queries are attributed to the field, see `track_queries`
+            token = current_path.set(f"{type(self._obj).__name__}.{key}")
+        start = perf_counter()
+        try:
+            return self.get_value(key, default)
+        finally:
+            if profile is not None:
+                profile.record_get(key, perf_counter() - start)
+            if token is not None:
+                current_path.reset(token)
+
+    def get_value(self, key: Any, default: Any = None) -> Any:
         result = super().get(key, default)
         if isinstance(result, Manager):
             return list(result.all())
         elif isinstance(result, getattr(QuerySet, "__origin__", QuerySet)):
             return list(result)
         elif isinstance(result, FieldFile):
-            return result.url if result else None
+            return file_url(result)
         return result
@@ -0,0 +1,168 @@
+import json
+import re
+import secrets
+from itertools import chain, count
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Match, Optional, Tuple
+
+from dantico.binary_fields import DeferredBinary, encode_base64, iter_base64
+from dantico.getters import DjangoGetter
+from pydantic.json import ENCODERS_BY_TYPE, pydantic_encoder
+
+__all__ = ["RawJSON", "RawJSONGetter", "iter_json", "json_dumps"]
+
+# annotation the text of a `raw_json` field is loaded into, see `QueryPlan`
+RAW_JSON_SUFFIX = "_raw_json"
+
+MISSING = object()
+
+# the placeholders of `RawJSON` and binary values, once encoded
+PLACEHOLDER = re.compile(r'"\\u0000dantico-[0-9a-f]+-\d+\\u0000"')
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+
+class RawJSON:
+    """
+    A JSON value kept as the text it was stored as, copied as is into the
+    output of `.json()` and only decoded when `value` is read.
+
+    Built from a decoded `value` instead, it is encoded when `text` is read.
+    """
+
+    __slots__ = ("_text", "_value")
+
+    def __init__(self, text: Optional[str] = None, value: Any = MISSING) -> None:
+        self._text = text
+        self._value = value
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = json.dumps(self._value, default=pydantic_encoder)
+        return self._text
+
+    @property
+    def value(self) -> Any:
+        if self._value is MISSING:
+            self._value = json.loads(self.text)
+        return self._value
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, RawJSON):
+            other = other.value
+        return bool(self.value == other)
+
+    def __repr__(self) -> str:
+        return f"RawJSON({self.text!r})"
+
+
+# decoded by `pydantic_encoder`, e.g. in `.json()` of schemas nesting model
+# schemas, where the text can't be copied as is
+ENCODERS_BY_TYPE[RawJSON] = attrgetter("value")
+
+
+class RawJSONGetter(DjangoGetter):
+    """
+    Getter of the schemas with `raw_json` fields: reads their text where
+    `from_queryset` loaded it, the decoded value otherwise.
+    """
+
+    # annotation holding the text of each `raw_json` field, by field name
+    raw_json: Dict[str, str] = {}
+
+    def get_value(self, key: Any, default: Any = None) -> Any:
+        attname = self.raw_json.get(key)
+        if attname is not None and attname in self._obj.__dict__:
+            text = self._obj.__dict__[attname]
+            return None if text is None else RawJSON(text)
+        return super().get_value(key, default)
+
+
+def placeholders(
+    default: Optional[Callable[[Any], Any]],
+) -> Tuple[Dict[str, Any], Callable[[Any], Any]]:
+    """
+    A `default` hook encoding `RawJSON` and binary values as placeholder
+    strings, and the values by encoded placeholder.
+
+    The placeholders hold a random nonce, so that strings of the data can't
+    pass for one.
+    """
+    values: Dict[str, Any] = {}
+    nonce = secrets.token_hex(8)
+    tokens = count()
+    fallback = pydantic_encoder if default is None else default
+
+    def encode(value: Any) -> Any:
+        if isinstance(value, (RawJSON, memoryview, DeferredBinary)):
+            token = f"\0dantico-{nonce}-{next(tokens)}\0"
+            values[json.dumps(token)] = value
+            return token
+        return fallback(value)
+
+    return values, encode
+
+
+def encoded(value: Any) -> str:
+    if isinstance(value, RawJSON):
+        return value.text
+    return f'"{encode_base64(value)}"'
+
+
+def json_dumps(
+    data: Any, *, default: Optional[Callable[[Any], Any]] = None, **kwargs: Any
+) -> str:
+    """
+    `json.dumps` copying the text of `RawJSON` values into the output, and
+    encoding binary values in base64, the `json_dumps` of model schemas.
+    """
+    values, encode = placeholders(default)
+    output = json.dumps(data, default=encode, **kwargs)
+    if not values:
+        return output
+
+    def replace(match: Match) -> str:
+        value = values.get(match.group())
+        return match.group() if value is None else encoded(value)
+
+    # the placeholders are replaced in a single pass over the output
+    return PLACEHOLDER.sub(replace, output)
+
+
+def iter_json(
+    data: Any,
+    *,
+    default: Optional[Callable[[Any], Any]] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Encode `data` in chunks of about `chunk_size` characters, e.g. for a
+    `StreamingHttpResponse`, copying the text of `RawJSON` values and
+    encoding binary values in base64 a chunk at a time.
+
+    Schemas in `data` are encoded with their `.dict()`, without the
+    `json_encoders` of their config.
+    """
+    values, encode = placeholders(default)
+    buffer: List[str] = []
+    size = 0
+    for chunk in json.JSONEncoder(default=encode, **kwargs).iterencode(data):
+        # the placeholders returned by `encode` are chunks of their own
+        value = values.pop(chunk, None)
+        if value is None:
+            parts: Iterable[str] = (chunk,)
+        elif isinstance(value, RawJSON):
+            parts = (value.text,)
+        else:
+            parts = chain('"', iter_base64(value, chunk_size // 4 * 3), '"')
+        for part in parts:
+            buffer.append(part)
+            size += len(part)
+            if size >= chunk_size:
+                yield "".join(buffer)
+                buffer.clear()
+                size = 0
+    if buffer:
+        yield "".join(buffer)
@@ -1,26 +1,85 @@
+import copyreg
+import pickle
+import sys
+import weakref
+import zlib
 from itertools import chain
+from multiprocessing.context import BaseContext
 from typing import (
     TYPE_CHECKING,
     Any,
+    AsyncIterator,
     Callable,
+    ClassVar,
     Dict,
+    FrozenSet,
+    Iterable,
     Iterator,
     List,
     Optional,
     Set,
+    Tuple,
     Type,
+    Union,
     cast,
     no_type_check,
 )
 
+from dantico.binary_fields import DeferredBinaryGetter, picklable
+from dantico.build_stats import SchemaBuild, recording_build
+from dantico.bulk import (
+    DEFAULT_CHUNK_SIZE,
+    BulkResult,
+    abulk_create,
+    abulk_update,
+    bulk_create,
+    bulk_update,
+    parse_many,
+)
 from dantico.exceptions import ConfigError
+from dantico.expressions import SQLFieldInfo
 from dantico.fields import django_to_pydantic_with_choices
 from dantico.getters import DjangoGetter
+from dantico.json_fields import (
+    RAW_JSON_SUFFIX,
+    RawJSONGetter,
+    json_dumps,
+)
 from dantico.mixins import SchemaMixins
-from dantico.model_validators import ModelValidatorGroup
+from dantico.model_validators import (
+    BatchValidatorListDict,
+    ModelValidatorGroup,
+    extract_batch_validators,
+    inherit_batch_validators,
+)
+from dantico.profiling import current_profile, profile_schema, profiling_schema
+from dantico.queryset import (
+    count_expression,
+    exists_expression,
+    get_dependencies,
+    load_sql_fields,
+    resolve_path,
+)
 from dantico.schema_registry import registry as global_registry
+from dantico.serialization import (
+    afrom_orm,
+    afrom_queryset,
+    current_identity_map,
+    from_queryset,
+    on_recursion_path,
+    recursion_path,
+    sideload,
+)
+from dantico.tree import from_tree
 from dantico.utils import compute_field_annotations
-from django.db.models import Field, ManyToManyRel, ManyToOneRel, Model as DJModel
+from django.db.models import (
+    BinaryField,
+    Field,
+    ManyToManyRel,
+    ManyToOneRel,
+    Model as DJModel,
+)
+from django.db.models.expressions import Combinable
 from pydantic import BaseConfig, BaseModel
 from pydantic.class_validators import (
     extract_root_validators,
@@ -94,6 +153,7 @@ def update_class_missing_fields(
     fields = old_namespace.__fields__ or {}
     config: Type[BaseConfig] = cast(Type[BaseConfig], old_namespace.__config__)
     validators: "ValidatorListDict" = {}
+    batch_validators: BatchValidatorListDict = {}
 
     pre_root_validators, post_root_validators = [], []
     class_vars: Set[str] = set()
@@ -109,13 +169,19 @@ def update_class_missing_fields(
     for base in reversed(bases):
         if base != BaseModel:
             validators = inherit_validators(base.__validators__, validators)  # type: ignore
+            batch_validators = inherit_batch_validators(
+                getattr(base, "__batch_validators__", {}), batch_validators
+            )
             pre_root_validators += base.__pre_root_validators__
             post_root_validators += base.__post_root_validators__
             class_vars.update(base.__class_vars__)
             hash_func = base.__hash__
 
     validators = inherit_validators(extract_validators(namespace), validators)
-    vg = ModelValidatorGroup(validators)
+    batch_validators = inherit_batch_validators(
+        batch_validators, extract_batch_validators(namespace)
+    )
+    vg = ModelValidatorGroup(validators, batch_validators)
     new_annotations = resolve_annotations(
         namespace.get("__annotations__") or {}, getattr(cls, "__module__", None)
     )
@@ -171,6 +237,8 @@ def update_class_missing_fields(
     _custom_root_type = ROOT_KEY in fields
     if _custom_root_type:
         validate_custom_root_type(fields)
+    for field_name in fields:
+        vg.get_batch_validators(field_name)
     vg.check_for_unused()
 
     old_namespace.__annotations__.update(new_annotations)
@@ -186,6 +254,7 @@ def update_class_missing_fields(
         "__config__": config,
         "__fields__": fields,
         "__validators__": vg.validators,
+        "__batch_validators__": vg.batch_validators,
         "__pre_root_validators__": unique_list(pre_root_validators),
         "__post_root_validators__": unique_list(post_root_validators),
         "__class_vars__": class_vars,
@@ -218,6 +287,11 @@ class ModelSchemaConfig(BaseConfig):
         )
 
         self.depth = getattr(options, "depth", 0)
+        self.recursive = getattr(options, "recursive", False)
+        self.counts = dict(getattr(options, "counts", None) or {})
+        self.exists = dict(getattr(options, "exists", None) or {})
+        self.raw_json = set(getattr(options, "raw_json", None) or ())
+        self.defer_binary = set(getattr(options, "defer_binary", None) or ())
         self.schema_class_name = schema_class_name
         self.validate_configuration()
         self.process_build_schema_parameters()
@@ -237,6 +311,24 @@ class ModelSchemaConfig(BaseConfig):
                 continue
             yield cast(Field, fld)
 
+    def sql_fields(self) -> Dict[str, Combinable]:
+        """Expressions of the `counts` and `exists` fields, by field name."""
+        fields = {
+            name: count_expression(self.model, path)  # type: ignore [arg-type]
+            for name, path in self.counts.items()
+        }
+        fields.update(
+            (name, exists_expression(self.model, path))  # type: ignore [arg-type]
+            for name, path in self.exists.items()
+        )
+        return fields
+
+    def sql_field_info(self, name: str) -> Tuple[Type, FieldInfo]:
+        title = name.replace("_", " ").title()
+        if name in self.counts:
+            return int, FieldInfo(default=0, title=title)
+        return bool, FieldInfo(default=False, title=title)
+
     def validate_configuration(self) -> None:
         self.include = set() if self.include == ALL_FIELDS else set(self.include or ())  # type: ignore [comparison-overlap]
 
@@ -269,6 +361,16 @@ class ModelSchemaConfig(BaseConfig):
                     f'Field{"" if len(invalid_options_fields) == 1 else "s"}: {invalid_options_fields} {"is" if len(invalid_options_fields) == 1 else "are"} not in model.'
                 )
 
+    def check_raw_json(self, **field_names: Field) -> None:
+        for name in self.raw_json:
+            field = field_names.get(name)
+            # `JSONField` is only in `django.db.models` from Django 3.1
+            if field is None or field.get_internal_type() != "JSONField":
+                raise ConfigError(f"'{name}' in 'raw_json' is not a JSONField.")
+        for name in self.defer_binary:
+            if not isinstance(field_names.get(name), BinaryField):
+                raise ConfigError(f"'{name}' in 'defer_binary' is not a BinaryField.")
+
     def is_field_in_optional(self, field_name: str) -> bool:
         if not self.optional:
             return False
@@ -301,13 +403,32 @@ class ModelSchemaMetaclass(ModelMetaclass):
         bases: tuple,
         namespace: dict,
     ):
-        cls = super().__new__(mcs, name, bases, namespace)
         if bases == (SchemaBaseModel,) or not namespace.get("Config"):
-            return cls
+            cls = super().__new__(mcs, name, bases, namespace)
+        else:
+            # timed for `build_report`
+            with recording_build(name) as build:
+                cls = mcs.build_schema(name, bases, namespace, build)
+                build.schema = weakref.ref(cls)
+            profile_schema(cls)
+        cls.__fields_fingerprint__ = fields_fingerprint(cls)
+        return cls
+
+    @classmethod
+    @no_type_check
+    def build_schema(
+        mcs,
+        name: str,
+        bases: tuple,
+        namespace: dict,
+        build: SchemaBuild,
+    ):
+        cls = super().__new__(mcs, name, bases, namespace)
 
         # `cls` will be subclass of `ModelSchema` in all other case
         config = namespace["Config"]
         config_instance = ModelSchemaConfig(name, config)
+        build.model = config_instance.model._meta.label
         annotations = namespace.get("__annotations__", {})
 
         fields = list(config_instance.model_fields())
@@ -316,6 +437,7 @@ class ModelSchemaMetaclass(ModelMetaclass):
 
         all_fields = {f.name: f for f in fields}
         config_instance.check_invalid_keys(**all_fields)
+        config_instance.check_raw_json(**all_fields)
 
         for field in chain(fields, annotations.copy()):
             field_name = getattr(field, "name", getattr(field, "related_name", field))
@@ -354,12 +476,14 @@ class ModelSchemaMetaclass(ModelMetaclass):
                 )
 
             else:
-                python_type, pydantic_field = django_to_pydantic_with_choices(
-                    field,
-                    registry=config_instance.registry,
-                    depth=config_instance.depth,
-                    skip_registry=config_instance.skip_registry,
-                )
+                with build.converting():
+                    python_type, pydantic_field = django_to_pydantic_with_choices(
+                        field,
+                        registry=config_instance.registry,
+                        depth=config_instance.depth,
+                        skip_registry=config_instance.skip_registry,
+                        recursive=config_instance.recursive,
+                    )
                 if config_instance.is_field_in_optional(field_name):
                     pydantic_field = ModelSchemaConfig.clone_field(
                         field=pydantic_field, default=None, default_factory=None
@@ -367,18 +491,389 @@ class ModelSchemaMetaclass(ModelMetaclass):
 
             field_values[field_name] = (python_type, pydantic_field)
 
-        cls = update_class_missing_fields(
-            cls, list(bases), compute_field_annotations(namespace, **field_values)
+        sql_fields = config_instance.sql_fields()
+        for field_name in sql_fields:
+            field_values[field_name] = config_instance.sql_field_info(field_name)
+        sql_fields.update(
+            (field_name, value.expression)
+            for field_name, value in namespace.items()
+            if isinstance(value, SQLFieldInfo)
         )
+        for field_name in sql_fields:
+            if field_name in all_fields:
+                raise ConfigError(f"'{field_name}' clashes with a model field.")
+
+        with build.updating():
+            cls = update_class_missing_fields(
+                cls, list(bases), compute_field_annotations(namespace, **field_values)
+            )
+        dependencies: List[str] = []
+        for base in reversed(bases):
+            dependencies.extend(getattr(base, "__depends_on__", ()))
+        for field_name in field_values:
+            for path in get_dependencies(config_instance.model, field_name):
+                resolve_path(config_instance.model, path)
+                dependencies.append(path)
+
+        inherited_sql_fields: Dict[str, Combinable] = {}
+        for base in reversed(bases):
+            inherited_sql_fields.update(getattr(base, "__sql_fields__", {}))
+        cls.__sql_fields__ = {**inherited_sql_fields, **sql_fields}
+        cls.__depends_on__ = tuple(unique_list(dependencies))
+        cls.__recursive__ = config_instance.recursive
+
+        raw_json: Dict[str, str] = {}
+        for base in reversed(bases):
+            raw_json.update(getattr(base, "__raw_json__", {}))
+        raw_json.update(
+            (field_name, f"{field_name}{RAW_JSON_SUFFIX}")
+            for field_name in config_instance.raw_json
+            if field_name in field_values
+        )
+        cls.__raw_json__ = raw_json
+
+        defer_binary: Set[str] = set()
+        for base in bases:
+            defer_binary.update(getattr(base, "__defer_binary__", ()))
+        defer_binary.update(config_instance.defer_binary & field_values.keys())
+        cls.__defer_binary__ = frozenset(defer_binary)
+
+        if raw_json or defer_binary:
+            # a getter of its own, reading the fields as configured
+            getter = cls.__config__.getter_dict
+            mixins = tuple(
+                mixin
+                for mixin in (RawJSONGetter, DeferredBinaryGetter)
+                if not issubclass(getter, mixin)
+            )
+            cls.__config__.getter_dict = type(
+                f"{name}Getter",
+                (*mixins, getter),
+                {"raw_json": raw_json, "defer_binary": cls.__defer_binary__},
+            )
         return cls
 
 
+def is_importable(cls: Type) -> bool:
+    obj: Any = sys.modules.get(cls.__module__)
+    for name in cls.__qualname__.split("."):
+        obj = getattr(obj, name, None)
+    return obj is cls
+
+
+def reduce_schema_class(
+    cls: Type["ModelSchema"],
+) -> Union[str, Tuple[Callable, Tuple]]:
+    """
+    Pickle schema classes by reference when they can be imported, otherwise
+    by model label and options, e.g. for schemas made by `SchemaFactory`.
+    """
+    from dantico.factory import SchemaFactory
+
+    if is_importable(cls):
+        return cls.__qualname__
+
+    key = getattr(cls.__config__, "registry", global_registry).get_schema_key(cls)
+    if key is None:
+        raise pickle.PicklingError(
+            f"Can't pickle {cls.__qualname__}: schema classes must be importable "
+            "or created with `SchemaFactory.create_schema`"
+        )
+    return SchemaFactory.create_schema_from_key, (key,)
+
+
+copyreg.pickle(ModelSchemaMetaclass, reduce_schema_class)
+
+
+def fields_fingerprint(cls: Type[BaseModel]) -> int:
+    """A checksum of the names of the fields of `cls`, in order."""
+    return zlib.crc32(" ".join(cls.__fields__).encode())
+
+
+def rebuild_schema(
+    cls: Type["ModelSchema"],
+    fingerprint: int,
+    values: Tuple,
+    fields_set: Optional[Tuple[str, ...]] = None,
+    extra: Optional[Dict[str, Any]] = None,
+    private: Optional[Dict[str, Any]] = None,
+) -> "ModelSchema":
+    """
+    Unpickle a schema instance without validating its values again, if the
+    fields of its class are still the ones its values were pickled for.
+    """
+    if fingerprint != cls.__fields_fingerprint__:
+        raise pickle.UnpicklingError(
+            f"Can't unpickle {cls.__qualname__}: its fields changed since it was "
+            "pickled"
+        )
+    instance = cls.__new__(cls)
+    values_dict = dict(zip(cls.__fields__, values))
+    if extra:
+        values_dict.update(extra)
+    object.__setattr__(instance, "__dict__", values_dict)
+    object.__setattr__(
+        instance,
+        "__fields_set__",
+        set(cls.__fields__) if fields_set is None else set(fields_set),
+    )
+    for name, value in (private or {}).items():
+        object.__setattr__(instance, name, value)
+    return instance
+
+
 class SchemaBaseModel(BaseModel, SchemaMixins):
     pass
 
 
 class ModelSchema(SchemaBaseModel, metaclass=ModelSchemaMetaclass):
+    __batch_validators__: ClassVar[BatchValidatorListDict] = {}
+    # fields computed by the database, by name, see `QueryPlan`
+    __sql_fields__: ClassVar[Dict[str, Combinable]] = {}
+    # relation paths read by model properties, see `depends_on`
+    __depends_on__: ClassVar[Tuple[str, ...]] = ()
+    # annotations holding the text of `raw_json` fields, by field name
+    __raw_json__: ClassVar[Dict[str, str]] = {}
+    # `BinaryField` fields `from_queryset` doesn't load, see `DeferredBinary`
+    __defer_binary__: ClassVar[FrozenSet[str]] = frozenset()
+    # nested related schemas created with `recursive`, see `validate`
+    __recursive__: ClassVar[bool] = False
+    # checksum of the field names, see `rebuild_schema`
+    __fields_fingerprint__: ClassVar[int] = 0
+
     class Config:
         orm_mode = True
         # We use the `DjangoGetter` to get the values for the fields.
         getter_dict = DjangoGetter
+        # copies `raw_json` fields as is into the output of `.json()`
+        json_dumps = json_dumps
+
+    def __reduce__(self) -> Tuple[Callable, Tuple]:
+        # Values are pickled as a tuple in field order, with the class pickled
+        # by reference (see `reduce_schema_class`), which keeps the payload
+        # free of field names and unpickling free of validation. The field
+        # names are checked against a fingerprint, see `rebuild_schema`.
+        fields = self.__fields__
+        values = tuple(picklable(self.__dict__.get(name)) for name in fields)
+        fields_set = (
+            None if self.__fields_set__ == fields.keys() else tuple(self.__fields_set__)
+        )
+        extra = {k: v for k, v in self.__dict__.items() if k not in fields}
+        private = {
+            name: getattr(self, name)
+            for name in self.__private_attributes__ or ()
+            if hasattr(self, name)
+        }
+        args: Tuple = (
+            type(self),
+            self.__fields_fingerprint__,
+            values,
+            fields_set,
+            extra or None,
+            private or None,
+        )
+        while args[-1] is None:
+            args = args[:-1]
+        return rebuild_schema, args
+
+    def _copy_and_set_values(
+        self, values: Dict[str, Any], fields_set: Set[str], *, deep: bool
+    ) -> "ModelSchema":
+        if deep:
+            # `BinaryField` values, see `PicklableBuffer`
+            values = {name: picklable(value) for name, value in values.items()}
+        return super()._copy_and_set_values(values, fields_set, deep=deep)
+
+    @classmethod
+    def from_orm(cls, obj: Any) -> "ModelSchema":
+        if cls.__sql_fields__ and isinstance(obj, DJModel):
+            load_sql_fields(cls, obj)
+        if cls.__recursive__ and isinstance(obj, DJModel):
+            # see `validate`
+            with recursion_path(obj):
+                return cls._profiled_from_orm(obj)
+        return cls._profiled_from_orm(obj)
+
+    @classmethod
+    def _profiled_from_orm(cls, obj: Any) -> "ModelSchema":
+        if current_profile.get() is None:
+            return super().from_orm(obj)
+        with profiling_schema(cls):
+            return super().from_orm(obj)
+
+    @classmethod
+    def validate(cls, value: Any) -> Optional["ModelSchema"]:  # type: ignore
+        if not isinstance(value, DJModel) or value.pk is None:
+            return super().validate(value)
+        if cls.__recursive__ and on_recursion_path(value):
+            # rows related in a cycle, e.g. an employee heading their own
+            # department, are nested until the cycle closes, then `None`
+            return None
+        # nested schemas validated from model instances, see `identity_map`
+        objects = current_identity_map.get()
+        if objects is None:
+            return super().validate(value)
+        key = (cls, value.pk)
+        instance = objects.get(key)
+        if instance is None:
+            instance = objects[key] = super().validate(value)
+        return instance
+
+    @classmethod
+    def from_queryset(
+        cls, queryset: Any, *, prefetch_workers: Optional[int] = None
+    ) -> List["ModelSchema"]:
+        """
+        Serialize a queryset or manager, with the `select_related` and
+        `prefetch_related` lookups nested schemas need applied.
+
+        :param prefetch_workers: number of threads fetching independent
+          prefetched relations concurrently
+        """
+        return from_queryset(cls, queryset, prefetch_workers=prefetch_workers)
+
+    @classmethod
+    def sideload(cls, queryset: Any, **export: Any) -> Dict[str, Any]:
+        """
+        Serialize a queryset or manager as `{"data": [...], "included": {...}}`,
+        with nested related objects referenced by pk in `data` and serialized
+        once per model label and pk in `included`.
+
+        :param export: keyword arguments passed to `dict()`, e.g. `by_alias`,
+          `include` and `exclude` apply to the rows of `data` only
+        """
+        return sideload(cls, queryset, **export)
+
+    @classmethod
+    def from_tree(
+        cls,
+        queryset: Any,
+        *,
+        parent: Optional[str] = None,
+        children: str = "children",
+        max_depth: Optional[int] = None,
+    ) -> List["ModelSchema"]:
+        """
+        Serialize the nodes of a queryset or manager of a self-referencing
+        model with their descendants, nested in a `children` list. Descendants
+        are fetched with one query per level of the tree.
+
+        :param parent: foreign key to the parent node, found on the model when omitted
+        :param children: name of the field listing the children of a node
+        :param max_depth: how many levels below the nodes to fetch, all when omitted
+        """
+        return from_tree(
+            cls, queryset, parent=parent, children=children, max_depth=max_depth
+        )
+
+    @classmethod
+    async def afrom_orm(cls, obj: Any) -> "ModelSchema":
+        """
+        Async counterpart of `from_orm`: related objects the schema reads are
+        loaded through the async ORM first, so it can be awaited from async views.
+        """
+        return await afrom_orm(cls, obj)
+
+    @classmethod
+    def afrom_queryset(
+        cls, queryset: Any, *, chunk_size: int = 2000
+    ) -> AsyncIterator["ModelSchema"]:
+        """Async iterator serializing a queryset or manager, see `from_queryset`."""
+        return afrom_queryset(cls, queryset, chunk_size=chunk_size)
+
+    @classmethod
+    def parse_many(
+        cls,
+        records: Iterable[Any],
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        check_related: bool = True,
+        check_unique: bool = True,
+        using: Optional[str] = None,
+        workers: Optional[int] = None,
+        mp_context: Optional[BaseContext] = None,
+    ) -> BulkResult:
+        """
+        Validate a batch of records, reporting errors per record.
+
+        :param records: dicts or model instances to validate
+        :param chunk_size: how many records are checked against the database at once
+        :param check_related: whether to check that referenced related objects exist
+        :param check_unique: whether to check the unique constraints of the model
+        :param using: database alias used for the related objects and unique lookups
+        :param workers: number of processes to spread the per-record validation over
+        :param mp_context: multiprocessing context used to start the worker processes
+        """
+        return parse_many(
+            cls,
+            records,
+            chunk_size=chunk_size,
+            check_related=check_related,
+            check_unique=check_unique,
+            using=using,
+            workers=workers,
+            mp_context=mp_context,
+        )
+
+    @classmethod
+    def bulk_create(
+        cls,
+        instances: Iterable["ModelSchema"],
+        *,
+        batch_size: Optional[int] = None,
+        using: Optional[str] = None,
+        ignore_conflicts: bool = False,
+    ) -> List[DJModel]:
+        """
+        Create model rows for `instances`, many-to-many links included, in a
+        single transaction.
+        """
+        return bulk_create(
+            cls,
+            instances,
+            batch_size=batch_size,
+            using=using,
+            ignore_conflicts=ignore_conflicts,
+        )
+
+    @classmethod
+    def bulk_update(
+        cls,
+        instances: Iterable["ModelSchema"],
+        fields: Optional[List[str]] = None,
+        *,
+        batch_size: Optional[int] = None,
+        using: Optional[str] = None,
+    ) -> int:
+        """Update the model rows of `instances`, matched by primary key."""
+        return bulk_update(cls, instances, fields, batch_size=batch_size, using=using)
+
+    @classmethod
+    async def abulk_create(
+        cls,
+        instances: Iterable["ModelSchema"],
+        *,
+        batch_size: Optional[int] = None,
+        using: Optional[str] = None,
+        ignore_conflicts: bool = False,
+    ) -> List[DJModel]:
+        return await abulk_create(
+            cls,
+            instances,
+            batch_size=batch_size,
+            using=using,
+            ignore_conflicts=ignore_conflicts,
+        )
+
+    @classmethod
+    async def abulk_update(
+        cls,
+        instances: Iterable["ModelSchema"],
+        fields: Optional[List[str]] = None,
+        *,
+        batch_size: Optional[int] = None,
+        using: Optional[str] = None,
+    ) -> int:
+        return await abulk_update(
+            cls, instances, fields, batch_size=batch_size, using=using
+        )
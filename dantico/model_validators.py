@@ -1,6 +1,6 @@
 from itertools import chain
 from types import FunctionType
-from typing import Any, Callable
+from typing import Any, Callable, Dict, List, Optional, Set
 
 from dantico.exceptions import ConfigError
 from pydantic.class_validators import (
@@ -11,7 +11,24 @@ from pydantic.class_validators import (
 )
 from pydantic.typing import AnyCallable
 
-__all__ = ["model_validator", "ModelValidatorGroup"]
+__all__ = ["model_validator", "ModelValidatorGroup", "BatchValidator"]
+
+BATCH_VALIDATOR_CONFIG_KEY = "__batch_validator_config__"
+
+
+class BatchValidator:
+    """
+    A validator called once per chunk of records with the list of values of
+    a field, instead of once per value.
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func: AnyCallable) -> None:
+        self.func = func
+
+
+BatchValidatorListDict = Dict[str, List[BatchValidator]]
 
 
 class ModelValidator:
@@ -23,6 +40,7 @@ class ModelValidator:
         each_item: bool = False,
         always: bool = False,
         check_fields: bool = False,
+        batch: bool = False,
     ) -> Callable[[AnyCallable], classmethod]:
         """
         Decorate methods on the class indicating that they should be used to validate fields
@@ -32,6 +50,11 @@ class ModelValidator:
           whole object
         :param always: whether this method and other validators should be called even if the value is missing
         :param check_fields: whether to check that the fields actually exist on the model
+        :param batch: whether the method receives the list of values of a field across a
+          whole batch of records (see `ModelSchema.parse_many`). It must return a list of
+          the same length holding, for each item, the value to keep or the `ValueError`,
+          `TypeError` or `AssertionError` instance to report for that record. Batch
+          validators must name fields of the schema, `check_fields` isn't supported
         """
         if not fields:
             raise ConfigError("validator with no fields specified")
@@ -40,9 +63,21 @@ class ModelValidator:
                 "validators should be used with fields and keyword arguments, not bare. "  # noqa: Q000
                 "E.g. usage should be `@validator('<field_name>', ...)`"
             )
+        elif batch and (pre or each_item or always or check_fields):
+            raise ConfigError(
+                "batch validators can't be combined with 'pre', 'each_item', 'always' "
+                "or 'check_fields'"
+            )
 
         def dec(f: Any) -> classmethod:
             f_cls = _prepare_validator(f, True)
+            if batch:
+                setattr(
+                    f_cls,
+                    BATCH_VALIDATOR_CONFIG_KEY,
+                    (fields, BatchValidator(f_cls.__func__)),
+                )
+                return f_cls
             setattr(
                 f_cls,
                 VALIDATOR_CONFIG_KEY,
@@ -65,13 +100,50 @@ class ModelValidator:
 model_validator = ModelValidator.model_validator
 
 
+def extract_batch_validators(namespace: Dict[str, Any]) -> BatchValidatorListDict:
+    validators: BatchValidatorListDict = {}
+    for var_name, value in namespace.items():
+        validator_config = getattr(value, BATCH_VALIDATOR_CONFIG_KEY, None)
+        if validator_config:
+            fields, validator = validator_config
+            for field in fields:
+                validators.setdefault(field, []).append(validator)
+    return validators
+
+
+def inherit_batch_validators(
+    base_validators: BatchValidatorListDict, validators: BatchValidatorListDict
+) -> BatchValidatorListDict:
+    for field, field_validators in base_validators.items():
+        validators[field] = [*field_validators, *validators.get(field, [])]
+    return validators
+
+
 class ModelValidatorGroup(ValidatorGroup):
+    def __init__(
+        self,
+        validators: Dict[str, Any],
+        batch_validators: Optional[BatchValidatorListDict] = None,
+    ) -> None:
+        super().__init__(validators)
+        self.batch_validators = batch_validators or {}
+        self.used_batch_validators: Set[str] = set()
+
+    def get_batch_validators(self, name: str) -> List[BatchValidator]:
+        self.used_batch_validators.add(name)
+        return self.batch_validators.get(name, [])
+
     def check_for_unused(self) -> None:
         unused_validators = set(
             chain.from_iterable(
                 (v.func.__name__ for v in self.validators[f])
                 for f in (self.validators.keys() - self.used_validators)
             )
+        ) | set(
+            chain.from_iterable(
+                (v.func.__name__ for v in self.batch_validators[f])
+                for f in (self.batch_validators.keys() - self.used_batch_validators)
+            )
         )
         if unused_validators:
             fn = ", ".join(unused_validators)
@@ -0,0 +1,201 @@
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type
+
+from pydantic.fields import ModelField
+
+if TYPE_CHECKING:
+    from pydantic.error_wrappers import ErrorList
+    from pydantic.types import ModelOrDc
+
+__all__ = ["FieldProfile", "FieldTimes", "ProfiledModelField", "profile_fields"]
+
+# set while profiling, see `profile_fields`
+current_profile: ContextVar[Optional["FieldProfile"]] = ContextVar(
+    "dantico_profile", default=None
+)
+# schema whose values are being read, see `ModelSchema.from_orm`
+current_schema: ContextVar[Optional[type]] = ContextVar(
+    "dantico_profiled_schema", default=None
+)
+# `profile_fields` blocks running, in any thread
+profiling = 0
+profiling_lock = threading.Lock()
+
+
+class FieldTimes:
+    """Cumulative time and calls spent reading and validating a field."""
+
+    __slots__ = ("get_calls", "get_time", "validate_calls", "validate_time")
+
+    def __init__(self) -> None:
+        self.get_calls = 0
+        self.get_time = 0.0
+        self.validate_calls = 0
+        self.validate_time = 0.0
+
+    @property
+    def time(self) -> float:
+        return self.get_time + self.validate_time
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class FieldProfile:
+    """
+    Time spent per schema field, reading values from objects (attribute
+    access, related managers, file URLs) and validating them (type coercion,
+    validators, nested schemas, which include their own fields' time).
+    """
+
+    def __init__(self) -> None:
+        # by schema and field alias, the key values are read with
+        self.fields: Dict[Tuple[Optional[type], str], FieldTimes] = {}
+
+    def times(self, schema: Optional[type], alias: str) -> FieldTimes:
+        times = self.fields.get((schema, alias))
+        if times is None:
+            times = self.fields[schema, alias] = FieldTimes()
+        return times
+
+    def record_get(self, alias: str, duration: float) -> None:
+        times = self.times(current_schema.get(), alias)
+        times.get_calls += 1
+        times.get_time += duration
+
+    def record_validate(self, schema: type, alias: str, duration: float) -> None:
+        times = self.times(schema, alias)
+        times.validate_calls += 1
+        times.validate_time += duration
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Times by `Schema.field`, the most expensive fields first."""
+        return {
+            label: times.as_dict()
+            for label, times in sorted(
+                self.labelled(), key=lambda item: item[1].time, reverse=True
+            )
+        }
+
+    def table(self) -> str:
+        """The times of `as_dict()` as a text table."""
+        header = ("field", "get calls", "get ms", "validate calls", "validate ms")
+        rows: List[Tuple[str, ...]] = [header]
+        for label, times in self.as_dict().items():
+            rows.append(
+                (
+                    label,
+                    str(times["get_calls"]),
+                    f"{times['get_time'] * 1000:.3f}",
+                    str(times["validate_calls"]),
+                    f"{times['validate_time'] * 1000:.3f}",
+                )
+            )
+        widths = [max(len(row[i]) for row in rows) for i in range(len(header))]
+        return "\n".join(
+            "  ".join(
+                cell.ljust(width) if i == 0 else cell.rjust(width)
+                for i, (cell, width) in enumerate(zip(row, widths))
+            )
+            for row in rows
+        )
+
+    def labelled(self) -> Iterator[Tuple[str, FieldTimes]]:
+        for (schema, alias), times in self.fields.items():
+            if schema is None:
+                yield alias, times
+                continue
+            names = {
+                field.alias: name
+                for name, field in getattr(schema, "__fields__", {}).items()
+            }
+            yield f"{schema.__name__}.{names.get(alias, alias)}", times
+
+
+class ProfiledModelField(ModelField):
+    """
+    `ModelField` timing its validation while profiling, the class of the
+    fields of model schemas during `profile_fields` blocks.
+    """
+
+    # the class of fields is switched, see `set_field_class`
+    __slots__ = ()
+
+    def validate(
+        self,
+        v: Any,
+        values: Dict[str, Any],
+        *,
+        loc: Any,
+        cls: Optional["ModelOrDc"] = None,
+    ) -> Tuple[Any, Optional["ErrorList"]]:
+        profile = current_profile.get()
+        # items of lists and dicts are part of their field's time
+        if profile is None or cls is None or not isinstance(loc, str):
+            return super().validate(v, values, loc=loc, cls=cls)
+        start = perf_counter()
+        try:
+            return super().validate(v, values, loc=loc, cls=cls)
+        finally:
+            profile.record_validate(cls, self.alias, perf_counter() - start)
+
+
+def set_field_class(schema: type, field_class: Type[ModelField]) -> None:
+    for field in schema.__fields__.values():  # type: ignore [attr-defined]
+        if type(field) in (ModelField, ProfiledModelField):
+            field.__class__ = field_class
+
+
+def profile_schema(schema: type) -> None:
+    """Time the validation of the fields of `schema`, a new schema."""
+    if profiling:
+        set_field_class(schema, ProfiledModelField)
+
+
+def set_schemas_field_class(field_class: Type[ModelField]) -> None:
+    from dantico.model_schema import ModelSchema
+
+    schemas: List[type] = [ModelSchema]
+    while schemas:
+        schema = schemas.pop()
+        set_field_class(schema, field_class)
+        schemas.extend(schema.__subclasses__())
+
+
+@contextmanager
+def profiling_schema(schema: Type) -> Iterator[None]:
+    token = current_schema.set(schema)
+    try:
+        yield
+    finally:
+        current_schema.reset(token)
+
+
+@contextmanager
+def profile_fields() -> Iterator[FieldProfile]:
+    """
+    Record the time spent per field by the schemas serializing or validating
+    data in the block.
+
+    While a block runs, the fields of every model schema are timed, at the
+    cost of a context variable lookup per field for the code running outside
+    of it, e.g. in other threads.
+    """
+    global profiling
+    with profiling_lock:
+        profiling += 1
+        if profiling == 1:
+            set_schemas_field_class(ProfiledModelField)
+    profile = FieldProfile()
+    token = current_profile.set(profile)
+    try:
+        yield profile
+    finally:
+        current_profile.reset(token)
+        with profiling_lock:
+            profiling -= 1
+            if not profiling:
+                set_schemas_field_class(ModelField)
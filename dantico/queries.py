@@ -0,0 +1,156 @@
+import random
+import time
+import warnings
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from functools import partial
+from typing import Any, Callable, Dict, Iterator, Optional
+
+from dantico.exceptions import NPlusOneError
+from django.db import connections
+
+__all__ = ["NPlusOneWarning", "PathStats", "QueryStats", "track_queries"]
+
+WARN = "warn"
+RAISE = "raise"
+
+# set while queries are tracked, see `track_queries`
+current_stats: ContextVar[Optional["QueryStats"]] = ContextVar(
+    "dantico_query_stats", default=None
+)
+# schema field being read, e.g. `User.groups`, see `DjangoGetter`
+current_path: ContextVar[Optional[str]] = ContextVar("dantico_query_path", default=None)
+
+
+class NPlusOneWarning(UserWarning):
+    pass
+
+
+class PathStats:
+    """Queries run while reading a field, with how often each SQL ran."""
+
+    __slots__ = ("count", "time", "shapes")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.time = 0.0
+        self.shapes: Counter = Counter()
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "time": self.time,
+            "repeated": max(self.shapes.values(), default=0),
+        }
+
+
+class QueryStats:
+    """
+    Queries run while tracking, by the schema field they were run for (`None`
+    for queries run outside of serialization, like the queryset itself).
+
+    A query run `threshold` times or more for the same field, with the same
+    SQL but different parameters, is what serializing related objects one
+    row at a time looks like: N+1 queries.
+    """
+
+    def __init__(self, threshold: int = 2, sampled: bool = True) -> None:
+        self.threshold = threshold
+        self.sampled = sampled
+        self.count = 0
+        self.time = 0.0
+        self.paths: Dict[Optional[str], PathStats] = {}
+
+    def __repr__(self) -> str:
+        return (
+            f"QueryStats(count={self.count}, time={self.time:.6f}, "
+            f"n_plus_one={self.n_plus_one!r})"
+        )
+
+    def record(self, path: Optional[str], sql: str, duration: float) -> None:
+        stats = self.paths.get(path)
+        if stats is None:
+            stats = self.paths[path] = PathStats()
+        stats.count += 1
+        stats.time += duration
+        stats.shapes[sql] += 1
+        self.count += 1
+        self.time += duration
+
+    @property
+    def n_plus_one(self) -> Dict[str, int]:
+        """Fields whose queries repeat, with how many times the most repeated ran."""
+        repeated = {}
+        for path, stats in self.paths.items():
+            times = max(stats.shapes.values(), default=0)
+            if path is not None and times >= self.threshold:
+                repeated[path] = times
+        return repeated
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "time": self.time,
+            "paths": {str(path): stats.as_dict() for path, stats in self.paths.items()},
+            "n_plus_one": self.n_plus_one,
+        }
+
+
+def record_query(
+    stats: QueryStats,
+    execute: Callable,
+    sql: str,
+    params: Any,
+    many: bool,
+    context: Dict[str, Any],
+) -> Any:
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.record(current_path.get(), sql, time.perf_counter() - start)
+
+
+@contextmanager
+def track_queries(
+    mode: Optional[str] = None,
+    *,
+    threshold: int = 2,
+    sample_rate: float = 1.0,
+    using: Optional[str] = None,
+) -> Iterator[QueryStats]:
+    """
+    Count and time the queries run in the block, by the schema field being
+    serialized when they ran, on the connections of this thread.
+
+    :param mode: `"warn"` or `"raise"` when the block ran N+1 queries, see `QueryStats`
+    :param threshold: how many times a query has to repeat for a field to be reported
+    :param sample_rate: share of the blocks tracked, the others get empty stats
+    :param using: database alias to track, all of them when omitted
+    """
+    if mode not in (None, WARN, RAISE):
+        raise ValueError(f"mode must be None, '{WARN}' or '{RAISE}'")
+    if sample_rate < 1 and random.random() >= sample_rate:
+        yield QueryStats(threshold, sampled=False)
+        return
+
+    stats = QueryStats(threshold)
+    wrapper = partial(record_query, stats)
+    aliases = [using] if using else list(connections)
+    token = current_stats.set(stats)
+    try:
+        with ExitStack() as stack:
+            for alias in aliases:
+                stack.enter_context(connections[alias].execute_wrapper(wrapper))
+            yield stats
+    finally:
+        current_stats.reset(token)
+
+    if mode and stats.n_plus_one:
+        message = "N+1 queries serializing " + ", ".join(
+            f"{path} ({times} times)" for path, times in stats.n_plus_one.items()
+        )
+        if mode == RAISE:
+            raise NPlusOneError(message)
+        warnings.warn(message, NPlusOneWarning, stacklevel=3)
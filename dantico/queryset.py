@@ -0,0 +1,360 @@
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    no_type_check,
+)
+
+from dantico.exceptions import ConfigError
+from dantico.utils import is_generic_foreign_key
+from django.core.exceptions import FieldDoesNotExist
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import (
+    Count,
+    Exists,
+    Field,
+    Manager,
+    Model,
+    OuterRef,
+    Prefetch,
+    QuerySet,
+    TextField,
+    prefetch_related_objects,
+)
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.expressions import Combinable
+from django.db.models.fields.reverse_related import ForeignObjectRel
+from django.db.models.functions import Cast
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+from pydantic.utils import lenient_issubclass
+
+if TYPE_CHECKING:
+    from dantico.model_schema import ModelSchema
+
+__all__ = [
+    "QueryPlan",
+    "depends_on",
+    "count_expression",
+    "exists_expression",
+    "load_sql_fields",
+    "get_query_plan",
+    "optimize_queryset",
+    "prefetch_concurrently",
+]
+
+RelatedField = Union[Field, ForeignObjectRel]
+TResolver = TypeVar("TResolver")
+
+
+@no_type_check
+def get_model_field(model: Type[Model], name: str) -> Optional[RelatedField]:
+    """
+    Return the model field behind the schema field `name`, looking reverse
+    relations up by accessor name as well (e.g. `auction_set`).
+    """
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        for rel in model._meta.related_objects:
+            if rel.get_accessor_name() == name:
+                return rel
+    return None
+
+
+def get_nested_schema(model_field: ModelField) -> Optional[Type["ModelSchema"]]:
+    """Return the schema of a nested relation, `None` for pk valued fields."""
+    nested = model_field.type_
+    if lenient_issubclass(nested, BaseModel) and getattr(
+        nested.__config__, "model", None
+    ):
+        return nested  # type: ignore
+    return None
+
+
+def depends_on(*paths: str) -> Callable[[TResolver], TResolver]:
+    """
+    Declare the relations a model property or method used as a schema field
+    reads, e.g. `@depends_on("author__profile", "tags")`, so that querysets
+    serialized with the schema load them up front.
+    """
+
+    def decorator(resolver: TResolver) -> TResolver:
+        func: Any = getattr(resolver, "fget", resolver)  # properties
+        func.__depends_on__ = getattr(func, "__depends_on__", ()) + paths
+        return resolver
+
+    return decorator
+
+
+def get_dependencies(model: Type[Model], name: str) -> Tuple[str, ...]:
+    """Return the paths declared with `depends_on` by the attribute `name`."""
+    attr = inspect.getattr_static(model, name, None)
+    # properties, cached properties and plain methods
+    for func in (getattr(attr, "fget", None), getattr(attr, "func", None), attr):
+        if hasattr(func, "__depends_on__"):
+            return func.__depends_on__  # type: ignore
+    return ()
+
+
+def resolve_path(model: Type[Model], path: str) -> Tuple[str, bool]:
+    """
+    Return `path` made of relation names of `model` and the models after it
+    as a lookup of `select_related` or `prefetch_related`, and whether it has
+    to be prefetched.
+    """
+    lookups: List[str] = []
+    many = False
+    current: Optional[Type[Model]] = model
+    for name in path.split(LOOKUP_SEP):
+        field = get_model_field(current, name) if current else None
+        if current and (field is None or not field.is_relation):
+            raise ConfigError(f"'{path}' is not a relation path of '{model.__name__}'")
+        if field is None:
+            # past a generic foreign key, the model isn't known
+            lookups.append(name)
+            continue
+        many = many or is_many(field) or is_generic_foreign_key(field)
+        lookups.append(accessor_name(field) if is_many(field) else field.name)
+        current = field.related_model
+    return LOOKUP_SEP.join(lookups), many
+
+
+def relation_lookup(model: Type[Model], path: str) -> str:
+    """
+    Return `path` as a query lookup, its first part being a relation of `model`
+    given by query name or accessor name (`user` or `user_set`).
+    """
+    name, _, rest = path.partition(LOOKUP_SEP)
+    field = get_model_field(model, name)
+    if field is None or not field.is_relation:
+        raise ConfigError(f"'{name}' is not a relation of '{model.__name__}'")
+    return LOOKUP_SEP.join(filter(None, [field.name, rest]))
+
+
+def count_expression(model: Type[Model], path: str) -> Combinable:
+    """Number of objects related to a row of `model` through `path`."""
+    return Count(relation_lookup(model, path), distinct=True)
+
+
+def exists_expression(model: Type[Model], path: str) -> Combinable:
+    """Whether a row of `model` has objects related through `path`."""
+    lookup = {"pk": OuterRef("pk"), f"{relation_lookup(model, path)}__isnull": False}
+    return Exists(model._base_manager.filter(**lookup))
+
+
+def is_many(field: RelatedField) -> bool:
+    return bool(field.many_to_many or field.one_to_many)
+
+
+def accessor_name(field: RelatedField) -> str:
+    """Attribute of model instances the related object or manager is read from."""
+    if field.concrete:
+        return field.name
+    return field.get_accessor_name()  # type: ignore
+
+
+def related_fields(
+    schema: Type["ModelSchema"],
+) -> Iterator[Tuple[str, RelatedField, Optional[Type["ModelSchema"]]]]:
+    """
+    Yield the name, model field and nested schema (`None` for pk valued
+    fields) of the relations `schema` reads.
+    """
+    model = schema.__config__.model  # type: ignore
+    for name, model_field in schema.__fields__.items():
+        field = get_model_field(model, model_field.alias) or get_model_field(
+            model, name
+        )
+        if field is not None and field.is_relation:
+            yield name, field, get_nested_schema(model_field)
+
+
+class QueryPlan:
+    """
+    What a queryset needs to load up front for a schema to be serialized
+    without further queries: `select_related` for single related objects,
+    `prefetch_related` for managers. JSON fields kept as text are loaded as
+    such, in place of their column.
+
+    Related objects of schemas with SQL fields are prefetched with a queryset
+    computing them, see `prefetch_nested`.
+    """
+
+    def __init__(self) -> None:
+        self.select_related: List[str] = []
+        self.prefetch_related: List[Union[str, Prefetch]] = []
+        self.annotations: Dict[str, Combinable] = {}
+        self.defer: List[str] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"QueryPlan(select_related={self.select_related!r}, "
+            f"prefetch_related={self.prefetch_related!r}, "
+            f"annotations={self.annotations!r}, defer={self.defer!r})"
+        )
+
+    def add(
+        self,
+        schema: Type["ModelSchema"],
+        prefix: str = "",
+        prefetch: bool = False,
+        seen: Tuple[Type["ModelSchema"], ...] = (),
+    ) -> None:
+        if schema in seen:
+            # recursive schemas, the depth of the data isn't known
+            return
+        seen += (schema,)
+        if not prefix:
+            # related objects compute theirs when serialized, see
+            # `load_sql_fields`
+            self.annotations.update(schema.__sql_fields__)
+            for name, annotation in schema.__raw_json__.items():
+                self.annotations[annotation] = Cast(name, TextField())
+                self.defer.append(name)
+            self.defer.extend(sorted(schema.__defer_binary__))
+        model = schema.__config__.model  # type: ignore
+        for path in schema.__depends_on__:
+            lookup, many = resolve_path(model, path)
+            lookups = self.prefetch_related if many or prefetch else self.select_related
+            if f"{prefix}{lookup}" not in lookups:
+                lookups.append(f"{prefix}{lookup}")
+        for _, field, nested in related_fields(schema):
+            if is_generic_foreign_key(field):
+                # prefetched per content type, one `IN` query per target model
+                self.prefetch_related.append(f"{prefix}{field.name}")
+                continue
+            # prefetch lookups go through accessors, select_related through
+            # query names (the same for forward fields)
+            if is_many(field):
+                path = f"{prefix}{accessor_name(field)}"
+            else:
+                path = f"{prefix}{field.name}"
+            if nested and nested.__sql_fields__:
+                self.prefetch_nested(path, field, nested)
+            elif is_many(field):
+                self.prefetch_related.append(path)
+                if nested:
+                    self.add(nested, prefix=f"{path}__", prefetch=True, seen=seen)
+            elif nested:
+                # single related objects, forward or reverse one-to-one
+                if prefetch:
+                    self.prefetch_related.append(path)
+                else:
+                    self.select_related.append(path)
+                self.add(nested, prefix=f"{path}__", prefetch=prefetch, seen=seen)
+
+    def prefetch_nested(
+        self, path: str, field: Any, nested: Type["ModelSchema"]
+    ) -> None:
+        """
+        Prefetch the related objects at `path` with the queryset `nested`
+        needs, its SQL fields computed by the prefetch query rather than once
+        per related object by `load_sql_fields`.
+        """
+        queryset = optimize_queryset(nested, field.related_model._base_manager)
+        self.prefetch_related.append(Prefetch(path, queryset=queryset))
+
+    def apply(self, queryset: QuerySet, prefetch: bool = True) -> QuerySet:
+        annotations = {
+            name: expression
+            for name, expression in self.annotations.items()
+            if name not in queryset.query.annotations
+        }
+        if annotations:
+            queryset = queryset.annotate(**annotations)
+        if self.defer:
+            queryset = queryset.defer(*self.defer)
+        if self.select_related:
+            queryset = queryset.select_related(*self.select_related)
+        if self.prefetch_related and prefetch:
+            queryset = queryset.prefetch_related(*self.prefetch_related)
+        return queryset
+
+
+@lru_cache(maxsize=None)
+def get_query_plan(schema: Type["ModelSchema"]) -> QueryPlan:
+    plan = QueryPlan()
+    plan.add(schema)
+    return plan
+
+
+def optimize_queryset(
+    schema: Type["ModelSchema"], queryset: Any, prefetch: bool = True
+) -> QuerySet:
+    """
+    Apply the `select_related` and `prefetch_related` calls that `schema`
+    needs to `queryset`, a queryset or a manager of the schema's model.
+    """
+    if isinstance(queryset, Manager):
+        queryset = queryset.all()
+    return get_query_plan(schema).apply(queryset, prefetch=prefetch)
+
+
+def missing_sql_fields(
+    schema: Type["ModelSchema"], obj: Model
+) -> Dict[str, Combinable]:
+    return {
+        name: expression
+        for name, expression in schema.__sql_fields__.items()
+        if name not in obj.__dict__
+    }
+
+
+def load_sql_fields(schema: Type["ModelSchema"], obj: Model) -> None:
+    """
+    Compute the SQL fields of `schema` that `obj` wasn't annotated with, in a
+    single query, e.g. for objects not loaded through `optimize_queryset`.
+    """
+    missing = missing_sql_fields(schema, obj)
+    if missing and obj.pk is not None:
+        queryset = type(obj)._base_manager.using(obj._state.db).filter(pk=obj.pk)
+        obj.__dict__.update(queryset.annotate(**missing).values(*missing).get())
+
+
+def prefetch_concurrently(
+    objs: List[Model],
+    lookups: List[Union[str, Prefetch]],
+    workers: int,
+    using: str = DEFAULT_DB_ALIAS,
+) -> None:
+    """
+    Run `prefetch_related_objects` for `objs`, fetching independent relations
+    (lookups not sharing their first part) in a pool of at most `workers`
+    threads, each with its own database connection.
+
+    Threads can't see rows written in a transaction of the calling thread, so
+    inside an atomic block the lookups are prefetched one after the other.
+    """
+    groups: Dict[str, List[Union[str, Prefetch]]] = {}
+    for lookup in lookups:
+        through = lookup.prefetch_through if isinstance(lookup, Prefetch) else lookup
+        groups.setdefault(through.split(LOOKUP_SEP, 1)[0], []).append(lookup)
+
+    if workers < 2 or len(groups) < 2 or connections[using].in_atomic_block:
+        prefetch_related_objects(objs, *lookups)
+        return
+
+    for obj in objs:
+        # created up front, so threads don't race to set it
+        obj.__dict__.setdefault("_prefetched_objects_cache", {})
+
+    def prefetch(group: List[str]) -> None:
+        try:
+            prefetch_related_objects(objs, *group)
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(groups))) as executor:
+        list(executor.map(prefetch, groups.values()))
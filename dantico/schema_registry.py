@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, Dict, Tuple, Type, Union
+from enum import Enum
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type, Union
 
 from dantico.schema import Schema
 from dantico.utils import is_valid_class, is_valid_django_model
@@ -7,11 +8,14 @@ from django.db.models import Model
 if TYPE_CHECKING:
     from dantico.model_schema import ModelSchema
 
-__all__ = ["SchemaRegister", "registry"]
+__all__ = ["SchemaRegister", "SchemaKey", "registry"]
+
+# (model label, sorted schema factory options)
+SchemaKey = Tuple[str, Tuple[Tuple[str, Any], ...]]
 
 
 class SchemaRegisterBorg:
-    _shared_state: Dict[str, Dict] = {}
+    _shared_state: Dict[str, Any] = {}
 
     def __init__(self) -> None:
         self.__dict__ = self._shared_state
@@ -20,11 +24,27 @@ class SchemaRegisterBorg:
 class SchemaRegister(SchemaRegisterBorg):
     schemas: Dict[Type[Model], Union[Type["ModelSchema"], Type[Schema]]]
     fields: Dict[str, Tuple]
+    keys: Dict[SchemaKey, Type["ModelSchema"]]
+    schema_keys: Dict[Type["ModelSchema"], SchemaKey]
+    # enums created for fields with choices, by name and choices
+    enums: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Type[Enum]]
+    # forward reference names of the schemas being created, by key, and the
+    # schemas created since the outermost of them started, by the same names
+    building: Dict[SchemaKey, str]
+    built: List[Tuple[str, Type["ModelSchema"]]]
 
     def __init__(self) -> None:
         SchemaRegisterBorg.__init__(self)
         if not hasattr(self, "schemas"):
-            self._shared_state.update(schemas={}, fields={})
+            self._shared_state.update(
+                schemas={},
+                fields={},
+                keys={},
+                schema_keys={},
+                enums={},
+                building={},
+                built=[],
+            )
 
     def register_model(self, model: Type[Model], schema: Type["ModelSchema"]) -> None:
         from dantico.model_schema import ModelSchema
@@ -49,5 +69,15 @@ class SchemaRegister(SchemaRegisterBorg):
     ) -> Union[Type["ModelSchema"], Type[Schema], None]:
         return self.schemas[model] if model in self.schemas else None
 
+    def register_schema_key(self, key: SchemaKey, schema: Type["ModelSchema"]) -> None:
+        self.keys[key] = schema
+        self.schema_keys.setdefault(schema, key)
+
+    def get_schema_by_key(self, key: SchemaKey) -> Optional[Type["ModelSchema"]]:
+        return self.keys.get(key)
+
+    def get_schema_key(self, schema: Type["ModelSchema"]) -> Optional[SchemaKey]:
+        return self.schema_keys.get(schema)
+
 
 registry = SchemaRegister()
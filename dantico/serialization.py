@@ -0,0 +1,361 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Type,
+    no_type_check,
+)
+
+import django
+from asgiref.sync import sync_to_async
+from dantico.files import get_url_resolver
+from dantico.queryset import (
+    QueryPlan,
+    RelatedField,
+    accessor_name,
+    get_model_field,
+    get_query_plan,
+    is_many,
+    missing_sql_fields,
+    optimize_queryset,
+    prefetch_concurrently,
+    related_fields,
+)
+from dantico.utils import is_generic_foreign_key
+from django.db.models import FileField, Manager, Model
+from django.db.models.fields.files import FieldFile
+
+if TYPE_CHECKING:
+    from dantico.model_schema import ModelSchema
+
+__all__ = ["from_queryset", "afrom_orm", "afrom_queryset", "identity_map", "sideload"]
+
+# `aget`, `async for` over querysets and friends
+ASYNC_ORM = django.VERSION >= (4, 1)
+# `aiterator()` accepting `prefetch_related()` lookups
+ASYNC_PREFETCH = django.VERSION >= (5, 0)
+
+IdentityMap = Dict[Tuple[Type["ModelSchema"], Any], "ModelSchema"]
+
+current_identity_map: ContextVar[Optional[IdentityMap]] = ContextVar(
+    "dantico_identity_map", default=None
+)
+
+
+@contextmanager
+def identity_map(objects: Optional[IdentityMap] = None) -> Iterator[IdentityMap]:
+    """
+    Within the block, related objects are converted once per schema and pk:
+    nested schemas validated again from the same object reuse the instance,
+    so rows sharing a related object share its nested instance.
+
+    :param objects: the map to use, to keep it across several blocks
+    """
+    if objects is None:
+        objects = current_identity_map.get()
+    token = current_identity_map.set({} if objects is None else objects)
+    try:
+        yield current_identity_map.get()  # type: ignore
+    finally:
+        current_identity_map.reset(token)
+
+
+# the (model, pk) of the objects being validated by recursive schemas
+current_recursion_path: ContextVar[FrozenSet[Tuple[Type[Model], Any]]] = ContextVar(
+    "dantico_recursion_path", default=frozenset()
+)
+
+
+def on_recursion_path(obj: Model) -> bool:
+    """Whether `obj` is being validated already, i.e. rows related in a cycle."""
+    return (type(obj), obj.pk) in current_recursion_path.get()
+
+
+@contextmanager
+def recursion_path(obj: Model) -> Iterator[None]:
+    """Within the block, `obj` is on the path of objects being validated."""
+    path = current_recursion_path.get()
+    token = current_recursion_path.set(path | {(type(obj), obj.pk)})
+    try:
+        yield
+    finally:
+        current_recursion_path.reset(token)
+
+
+def from_queryset(
+    schema: Type["ModelSchema"],
+    queryset: Any,
+    *,
+    prefetch_workers: Optional[int] = None,
+) -> List["ModelSchema"]:
+    """
+    Serialize a queryset (or manager), loading up front the related objects
+    the schema needs. With `prefetch_workers`, independent prefetched
+    relations are fetched concurrently, see `prefetch_concurrently`.
+
+    Related objects are converted once, see `identity_map`.
+    """
+    objs: Iterable[Model]
+    if prefetch_workers:
+        queryset = optimize_queryset(schema, queryset, prefetch=False)
+        objs = list(queryset)
+        prefetch_concurrently(
+            objs,
+            get_query_plan(schema).prefetch_related,
+            prefetch_workers,
+            using=queryset.db,
+        )
+    else:
+        objs = list(optimize_queryset(schema, queryset))
+    prefetch_file_urls(schema, objs)
+
+    with identity_map():
+        return [schema.from_orm(obj) for obj in objs]
+
+
+def sideload(
+    schema: Type["ModelSchema"], queryset: Any, **export: Any
+) -> Dict[str, Any]:
+    """
+    Serialize a queryset (or manager) in a normalized form: nested related
+    objects of the rows are replaced by their pk (a list of pks for managers)
+    and serialized once in `included`, keyed by model label and pk.
+
+    Every relation is prefetched, which is one `IN` query per related model.
+
+    :param export: keyword arguments of `dict()`, e.g. `by_alias`. `include`
+      and `exclude` apply to the rows of `data` only
+    """
+    if isinstance(queryset, Manager):
+        queryset = queryset.all()
+    plan = QueryPlan()
+    plan.add(schema, prefetch=True)
+    include = export.pop("include", None)
+    exclude = export.pop("exclude", None)
+    sideloaded = [
+        (name, field, nested)
+        for name, field, nested in related_fields(schema)
+        if nested is not None and not is_excluded(name, include, exclude)
+    ]
+    # the relations are replaced by pks in the rows
+    names = [name for name, _, nested in related_fields(schema) if nested is not None]
+    if isinstance(exclude, Mapping):
+        exclude = {**exclude, **dict.fromkeys(names, True)}
+    else:
+        exclude = {*(exclude or ()), *names}
+
+    data: List[Dict[str, Any]] = []
+    included: Dict[str, Dict[Any, Dict[str, Any]]] = {}
+    with identity_map():
+        for obj in plan.apply(queryset):
+            instance = schema.from_orm(obj)
+            row = instance.dict(include=include, exclude=exclude, **export)
+            for name, field, nested in sideloaded:
+                # reverse one-to-one relations without a row raise
+                # `RelatedObjectDoesNotExist`, an `AttributeError`
+                related: Any = getattr(obj, accessor_name(field), None)
+                label = field.related_model._meta.label_lower  # type: ignore
+                rows = included.setdefault(label, {})
+                if is_many(field):
+                    related = list(related.all())
+                    values = getattr(instance, name)
+                else:
+                    values = [getattr(instance, name)]
+                    related = [] if related is None else [related]
+                for related_obj, value in zip(related, values):
+                    if related_obj.pk not in rows:
+                        rows[related_obj.pk] = value.dict(**export)
+                pks = [related_obj.pk for related_obj in related]
+                row[name] = pks if is_many(field) else next(iter(pks), None)
+            data.append(row)
+    return {"data": data, "included": included}
+
+
+def is_excluded(name: str, include: Any, exclude: Any) -> bool:
+    """Whether the `include` and `exclude` of `dict()` leave out field `name`."""
+    if include is not None and name not in include:
+        return True
+    if isinstance(exclude, Mapping):
+        return exclude.get(name) in (True, ...)
+    return exclude is not None and name in exclude
+
+
+def collect_files(
+    schema: Type["ModelSchema"],
+    objs: List[Model],
+    files: List[FieldFile],
+    seen: Tuple[Type["ModelSchema"], ...] = (),
+) -> None:
+    """
+    Collect the files `schema` serializes from `objs` into `files`, the ones
+    of the loaded related objects with a nested schema included.
+    """
+    if schema in seen or not objs:
+        return
+    seen += (schema,)
+    model = schema.__config__.model  # type: ignore
+    for model_field in schema.__fields__.values():
+        field = get_model_field(model, model_field.alias)
+        if isinstance(field, FileField):
+            files.extend(getattr(obj, field.attname) for obj in objs)
+    for _, field, nested in related_fields(schema):
+        if nested is None or is_generic_foreign_key(field):
+            continue
+        related: List[Model] = []
+        for obj in objs:
+            if is_many(field):
+                # the prefetched ones only, collecting files doesn't query
+                cache = getattr(obj, "_prefetched_objects_cache", {})
+                manager = getattr(obj, accessor_name(field))
+                related.extend(cache.get(prefetch_cache_name(manager), ()))
+            elif field.is_cached(obj):  # type: ignore [union-attr]
+                value = field.get_cached_value(obj)  # type: ignore [union-attr]
+                if value is not None:
+                    related.append(value)
+        collect_files(nested, related, files, seen)
+
+
+def prefetch_file_urls(schema: Type["ModelSchema"], objs: List[Model]) -> None:
+    """
+    Resolve the URLs of the files `schema` serializes from `objs` up front,
+    signing them in batches on storages able to, see `FileURLResolver`.
+    """
+    files: List[FieldFile] = []
+    collect_files(schema, objs, files)
+    if files:
+        get_url_resolver().prefetch(files)
+
+
+def prefetch_cache_name(manager: Manager) -> str:
+    name = getattr(manager, "prefetch_cache_name", None)
+    if name is None:
+        # reverse foreign key managers
+        remote_field = manager.field.remote_field  # type: ignore
+        name = (
+            getattr(remote_field, "cache_name", None) or remote_field.get_cache_name()
+        )
+    return name  # type: ignore
+
+
+async def aload_related_manager(
+    obj: Model, manager: Manager, nested: Optional[Type["ModelSchema"]]
+) -> None:
+    cache_name = prefetch_cache_name(manager)
+    cache = obj.__dict__.setdefault("_prefetched_objects_cache", {})
+    if cache_name in cache:
+        return
+    queryset = manager.all()
+    loader = queryset if nested is None else optimize_queryset(nested, queryset)
+    items = [item async for item in loader]
+    queryset._result_cache = items
+    queryset._prefetch_done = True  # type: ignore
+    cache[cache_name] = queryset
+
+
+@no_type_check
+async def aload_related_object(
+    obj: Model, field: RelatedField, nested: Type["ModelSchema"]
+) -> Optional[Model]:
+    if field.is_cached(obj):
+        return field.get_cached_value(obj)
+
+    queryset = optimize_queryset(nested, field.related_model._base_manager)
+    if field.concrete:
+        value = getattr(obj, field.attname)
+        lookup = {field.target_field.name: value}
+    else:
+        # reverse one-to-one
+        value = obj.pk
+        lookup = {field.field.name: value}
+
+    related = None
+    if value is not None:
+        try:
+            related = await queryset.aget(**lookup)
+        except field.related_model.DoesNotExist:
+            pass
+    field.set_cached_value(obj, related)
+    return related
+
+
+async def aload_sql_fields(schema: Type["ModelSchema"], obj: Model) -> None:
+    missing = missing_sql_fields(schema, obj)
+    if missing and obj.pk is not None:
+        queryset = type(obj)._base_manager.using(obj._state.db).filter(pk=obj.pk)
+        values = await queryset.annotate(**missing).values(*missing).aget()
+        obj.__dict__.update(values)
+
+
+@no_type_check
+async def aload_generic_related(obj: Model, field: Any) -> None:
+    if not field.is_cached(obj):
+        # resolved in a thread: looking up the target depends on its content type
+        await sync_to_async(getattr)(obj, field.name)
+
+
+async def aload_related(schema: Type["ModelSchema"], obj: Model) -> None:
+    """
+    Load through the async ORM the related objects of `obj` that `schema`
+    reads, caching them on `obj` the way `select_related()` and
+    `prefetch_related()` do, so serializing it afterwards runs no query.
+    """
+    await aload_sql_fields(schema, obj)
+    for _, field, nested in related_fields(schema):
+        if is_generic_foreign_key(field):
+            await aload_generic_related(obj, field)
+        elif is_many(field):
+            await aload_related_manager(obj, getattr(obj, accessor_name(field)), nested)
+        elif nested:
+            related = await aload_related_object(obj, field, nested)
+            if related is not None:
+                await aload_related(nested, related)
+
+
+async def afrom_orm(schema: Type["ModelSchema"], obj: Any) -> "ModelSchema":
+    if not isinstance(obj, Model):
+        return schema.from_orm(obj)
+    if not ASYNC_ORM:  # pragma: no cover
+        return await sync_to_async(schema.from_orm)(obj)
+    await aload_related(schema, obj)
+    return schema.from_orm(obj)
+
+
+async def afrom_queryset(
+    schema: Type["ModelSchema"], queryset: Any, *, chunk_size: int = 2000
+) -> AsyncIterator["ModelSchema"]:
+    """
+    Serialize a queryset (or manager) from async code, loading up front the
+    related objects the schema needs. Where the ORM can stream prefetched
+    querysets, rows are fetched `chunk_size` at a time.
+    """
+    queryset = optimize_queryset(schema, queryset)
+    # the map is only set around each conversion: the context of the caller
+    # may differ between two iterations
+    objects: IdentityMap = {}
+
+    def convert(obj: Model) -> "ModelSchema":
+        with identity_map(objects):
+            return schema.from_orm(obj)
+
+    if not ASYNC_ORM:  # pragma: no cover
+        await sync_to_async(queryset._fetch_all)()
+        for obj in queryset:
+            yield convert(obj)
+        return
+
+    if ASYNC_PREFETCH or not queryset._prefetch_related_lookups:
+        async for obj in queryset.aiterator(chunk_size=chunk_size):
+            yield convert(obj)
+    else:
+        async for obj in queryset:
+            yield convert(obj)
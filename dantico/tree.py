@@ -0,0 +1,125 @@
+from functools import lru_cache
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    ForwardRef,
+    List,
+    Optional,
+    Type,
+    no_type_check,
+)
+
+from dantico.exceptions import ConfigError
+from dantico.queryset import optimize_queryset
+from dantico.serialization import IdentityMap, identity_map
+from django.db.models import ForeignKey, Model
+from pydantic import create_model
+
+if TYPE_CHECKING:
+    from dantico.model_schema import ModelSchema
+
+__all__ = ["get_parent_field", "get_tree_schema", "from_tree"]
+
+
+@no_type_check
+def get_parent_field(model: Type[Model], name: Optional[str] = None) -> ForeignKey:
+    """
+    Return the foreign key of `model` pointing to itself, `name` when given.
+    """
+    if name is not None:
+        field = model._meta.get_field(name)
+        if not isinstance(field, ForeignKey) or field.related_model is not model:
+            raise ConfigError(
+                f"'{name}' must be a foreign key of '{model.__name__}' to itself"
+            )
+        return field
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if isinstance(field, ForeignKey) and field.related_model is model
+    ]
+    if len(fields) != 1:
+        raise ConfigError(
+            f"'{model.__name__}' must have exactly one foreign key to itself, "
+            "set the parent field to use"
+        )
+    return fields[0]
+
+
+@lru_cache(maxsize=None)
+def get_tree_schema(
+    schema: Type["ModelSchema"], children: str = "children"
+) -> Type["ModelSchema"]:
+    """
+    Return a subclass of `schema` adding a `children` list of itself, declared
+    with a forward reference so one class serves every level of the tree.
+    """
+    if children in schema.__fields__:
+        raise ConfigError(f"'{children}' is already a field of '{schema.__name__}'")
+    name = f"{schema.__name__}Tree"
+    tree = create_model(
+        name,
+        __base__=schema,
+        __module__=schema.__module__,
+        **{children: (List[ForwardRef(name)], [])},  # type: ignore
+    )
+    tree.update_forward_refs(**{name: tree})
+    return tree  # type: ignore
+
+
+def from_tree(
+    schema: Type["ModelSchema"],
+    queryset: Any,
+    *,
+    parent: Optional[str] = None,
+    children: str = "children",
+    max_depth: Optional[int] = None,
+) -> List["ModelSchema"]:
+    """
+    Serialize the rows of `queryset` (or manager) and their descendants as
+    trees, with the nodes below each node in its `children` list.
+
+    Descendants are fetched one level at a time, a query per level however
+    many nodes it has, and assembled in memory.
+
+    :param parent: foreign key to the parent node, found on the model when omitted
+    :param children: name of the field listing the children of a node
+    :param max_depth: how many levels below the roots to fetch, all when omitted
+    """
+    queryset = optimize_queryset(schema, queryset)
+    model = schema.__config__.model  # type: ignore
+    parent_field = get_parent_field(model, parent)
+    tree = get_tree_schema(schema, children)
+    manager = model._default_manager.db_manager(queryset.db)
+
+    levels: List[List[Model]] = [list(queryset)]
+    seen = {obj.pk for obj in levels[0]}
+    while levels[-1] and (max_depth is None or len(levels) <= max_depth):
+        lookup = {f"{parent_field.name}__in": [obj.pk for obj in levels[-1]]}
+        # rows already in the tree would loop forever on cyclic data
+        level = [
+            obj
+            for obj in optimize_queryset(schema, manager.filter(**lookup))
+            if obj.pk not in seen
+        ]
+        seen.update(obj.pk for obj in level)
+        levels.append(level)
+
+    # built from the leaves up: the children of a node are complete before it
+    objects: IdentityMap = {}
+    nodes: List["ModelSchema"] = []
+    children_of: Dict[Any, List["ModelSchema"]] = {}
+    for level in reversed(levels):
+        nodes, below, children_of = [], children_of, {}
+        for obj in level:
+            with identity_map(objects):
+                values = schema.from_orm(obj)
+            node = tree.construct(
+                _fields_set=values.__fields_set__ | {children},
+                **values.__dict__,
+                **{children: below.get(obj.pk, [])},
+            )
+            nodes.append(node)
+            children_of.setdefault(getattr(obj, parent_field.attname), []).append(node)
+    return nodes
@@ -43,3 +43,9 @@ def is_valid_django_model(model: Type[Model]) -> bool:
 
 def is_valid_class(object: type) -> bool:
     return inspect.isclass(object)
+
+
+def is_generic_foreign_key(field: Any) -> bool:
+    # checked on the field's flags: importing `GenericForeignKey` requires the
+    # contenttypes app to be installed
+    return bool(field.is_relation and field.many_to_one and field.related_model is None)
@@ -1,4 +1,5 @@
 import django
+import pytest
 
 
 def pytest_configure(config):
@@ -55,3 +56,27 @@ def pytest_configure(config):
     )
 
     django.setup()
+
+
+@pytest.fixture
+def create_users():
+    """
+    Create `count` users of a "gold" tier, with a profile each, members of
+    two groups, returning the tier.
+    """
+    from tests.models import Group, Profile, User, UserType
+
+    def create_users(count=3):
+        tier = UserType.objects.create(name="gold")
+        groups = [Group.objects.create(name=f"group {index}") for index in range(2)]
+        for index in range(count):
+            user = User.objects.create(
+                full_name=f"user {index}",
+                age=20 + index,
+                profile=Profile.objects.create(address=f"address {index}"),
+                tier=tier,
+            )
+            user.groups.set(groups)
+        return tier
+
+    return create_users
@@ -1,3 +1,6 @@
+from dantico import depends_on
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.contrib.contenttypes.models import ContentType
 from django.db import models
 
 from tests.conf import JSON_FIELD_COMPATIBILITY, TEXT_CHOICES_COMPATIBILITY
@@ -25,6 +28,70 @@ class Client(models.Model):
     key = models.CharField(max_length=20, unique=True)
 
 
+class Membership(models.Model):
+    client = models.ForeignKey(Client, on_delete=models.CASCADE)
+    group = models.ForeignKey("Group", on_delete=models.CASCADE)
+    code = models.CharField(max_length=20)
+
+    class Meta:
+        unique_together = [("client", "group")]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["client", "code"], name="unique_membership_code"
+            )
+        ]
+
+
+class Activity(models.Model):
+    verb = models.CharField(max_length=20)
+    content_type = models.ForeignKey(ContentType, on_delete=models.CASCADE)
+    object_id = models.PositiveIntegerField()
+    target = GenericForeignKey("content_type", "object_id")
+
+
+class Comment(models.Model):
+    text = models.CharField(max_length=100)
+    parent = models.ForeignKey(
+        "self", null=True, blank=True, on_delete=models.CASCADE, related_name="replies"
+    )
+
+    class Meta:
+        ordering = ["id"]
+
+    @property
+    @depends_on("parent", "replies")
+    def summary(self):
+        parent = self.parent.text if self.parent else "-"
+        return f"{parent} > {self.text} > {len(self.replies.all())} replies"
+
+
+class Folder(models.Model):
+    name = models.CharField(max_length=20)
+    cover = models.FileField(upload_to="covers", blank=True)
+
+
+class Document(models.Model):
+    folder = models.ForeignKey(Folder, on_delete=models.CASCADE)
+    file = models.FileField(upload_to="documents", blank=True)
+
+
+class Attachment(models.Model):
+    name = models.CharField(max_length=50)
+    data = models.BinaryField(null=True)
+
+
+class Department(models.Model):
+    name = models.CharField(max_length=20)
+    head = models.ForeignKey(
+        "Employee", null=True, on_delete=models.SET_NULL, related_name="+"
+    )
+
+
+class Employee(models.Model):
+    name = models.CharField(max_length=20)
+    department = models.ForeignKey(Department, on_delete=models.CASCADE)
+
+
 class Profile(models.Model):
     address = models.TextField()
     dob = models.DateTimeField(null=True, blank=True)
@@ -0,0 +1,41 @@
+import pytest
+
+from benchmarks.cases import BENCHMARKS
+from benchmarks.data import create_dataset
+from benchmarks.runner import compare, run
+from benchmarks.scale import measure
+from tests.models import User
+
+
+@pytest.mark.django_db
+def test_benchmarks():
+    dataset = create_dataset(users=5, groups=3, groups_per_user=2)
+
+    results = run(BENCHMARKS, dataset, repeat=2, number=1)
+
+    assert User.objects.count() == 5
+    assert results["meta"]["dataset"]["memberships"] == 10
+    assert set(results["benchmarks"]) == set(BENCHMARKS)
+    assert all(
+        0 < result["min"] <= result["median"] and result["rounds"] == 2
+        for result in results["benchmarks"].values()
+    )
+
+
+def test_compare():
+    baseline = {"benchmarks": {"a": {"min": 1.0}, "b": {"min": 1.0}}}
+    current = {"benchmarks": {"a": {"min": 1.05}, "b": {"min": 1.5}, "c": {"min": 1}}}
+
+    rows, regressions = compare(baseline, current, tolerance=0.1)
+
+    assert rows == [("a", 1.0, 1.05, 1.05), ("b", 1.0, 1.5, 1.5)]
+    assert regressions == ["b"]
+
+
+def test_measure_memory():
+    result = measure(lambda: len([object() for _ in range(1000)]), trace=True)
+
+    assert result["items"] == 1000
+    assert result["peak_rss"] >= result["rss_before"] > 0
+    assert result["traced_peak"] > 1000 * 16
+    assert len(result["top_allocations"]) <= 5
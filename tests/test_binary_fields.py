@@ -0,0 +1,131 @@
+import base64
+import copy
+import json
+import pickle
+from typing import List
+
+import pytest
+from dantico import ModelSchema, Schema
+from dantico.binary_fields import Binary, DeferredBinary, iter_base64
+from dantico.exceptions import ConfigError
+from dantico.json_fields import iter_json
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from pydantic import ValidationError
+from pydantic.json import pydantic_encoder
+
+from tests.models import Attachment, User
+
+DATA = bytes(range(256)) * 10
+
+
+class AttachmentSchema(ModelSchema):
+    class Config:
+        model = Attachment
+
+
+class LazyAttachmentSchema(ModelSchema):
+    class Config:
+        model = Attachment
+        defer_binary = ["data"]
+
+
+def test_memoryview_not_copied():
+    buffer = bytearray(DATA)
+    schema = AttachmentSchema(id=1, name="a", data=memoryview(buffer))
+    assert isinstance(schema.data, memoryview)
+    assert schema.data.obj is buffer
+    assert AttachmentSchema(id=1, name="a", data=DATA).data.obj is DATA
+
+
+def test_base64():
+    schema = AttachmentSchema(id=1, name="a", data=DATA)
+    output = json.loads(schema.json())
+    assert output["data"] == base64.b64encode(DATA).decode()
+    assert bytes(AttachmentSchema.parse_raw(schema.json()).data) == DATA
+    with pytest.raises(ValidationError):
+        AttachmentSchema(id=1, name="a", data="not base64!")
+    with pytest.raises(ValidationError):
+        AttachmentSchema(id=1, name="a", data=1)
+
+
+def test_nested_in_schema():
+    class AttachmentsSchema(Schema):
+        attachments: List[AttachmentSchema]
+
+    schema = AttachmentsSchema(
+        attachments=[AttachmentSchema(id=1, name="a", data=DATA)]
+    )
+    encoded = base64.b64encode(DATA).decode()
+    assert json.loads(schema.json())["attachments"][0]["data"] == encoded
+    output = json.dumps(schema.dict(), default=pydantic_encoder)
+    assert json.loads(output)["attachments"][0]["data"] == encoded
+
+
+def test_iter_base64():
+    chunks = list(iter_base64(memoryview(DATA), chunk_size=100))
+    assert all(len(chunk) == 132 for chunk in chunks[:-1])
+    assert "".join(chunks) == base64.b64encode(DATA).decode()
+    assert list(iter_base64(b"")) == []
+
+
+def test_iter_json():
+    schemas = [AttachmentSchema(id=i, name=f"{i}", data=DATA) for i in range(3)]
+    chunks = list(iter_json(schemas, chunk_size=1000))
+    assert len(chunks) > 3
+    assert json.loads("".join(chunks)) == [
+        {"id": i, "name": f"{i}", "data": base64.b64encode(DATA).decode()}
+        for i in range(3)
+    ]
+
+
+@pytest.mark.django_db
+def test_defer_binary():
+    first = Attachment.objects.create(name="first", data=DATA)
+    Attachment.objects.create(name="empty")
+
+    with CaptureQueriesContext(connection) as queries:
+        schemas = LazyAttachmentSchema.from_queryset(Attachment.objects.order_by("pk"))
+    assert len(queries) == 1
+    assert "data" not in queries[0]["sql"]
+    assert isinstance(schemas[0].data, DeferredBinary)
+
+    # loaded one row at a time while encoded
+    with CaptureQueriesContext(connection) as queries:
+        output = json.loads("".join(iter_json(schemas)))
+    assert len(queries) == 2
+    assert output == [
+        {"id": first.pk, "name": "first", "data": base64.b64encode(DATA).decode()},
+        {"id": first.pk + 1, "name": "empty", "data": ""},
+    ]
+    assert json.loads(schemas[0].json())["data"] == output[0]["data"]
+    dumped = json.dumps(schemas[0].dict(), default=pydantic_encoder)
+    assert json.loads(dumped)["data"] == output[0]["data"]
+
+    # loaded with their row
+    schema = LazyAttachmentSchema.from_orm(Attachment.objects.get(pk=first.pk))
+    assert bytes(schema.data) == DATA
+
+
+def test_defer_binary_not_binary_field():
+    with pytest.raises(ConfigError, match="'username' in 'defer_binary'"):
+
+        class UserSchema(ModelSchema):
+            class Config:
+                model = User
+                defer_binary = ["username"]
+
+
+def test_validate():
+    assert Binary.validate(b"a").obj == b"a"
+    deferred = DeferredBinary(Attachment, 1, "data", "default")
+    assert Binary.validate(deferred) is deferred
+
+
+def test_pickle_and_copy():
+    schema = AttachmentSchema(id=1, name="a", data=DATA)
+    for copied in (pickle.loads(pickle.dumps(schema)), schema.copy(deep=True)):
+        assert isinstance(copied.data, memoryview)
+        assert bytes(copied.data) == DATA
+        assert copied.json() == schema.json()
+    assert copy.deepcopy(schema).data == schema.data
@@ -0,0 +1,112 @@
+import pytest
+from dantico import ModelSchema, SchemaFactory, build_report
+from dantico.build_stats import builds
+from dantico.exceptions import ConfigError
+from dantico.schema_registry import SchemaRegister
+
+from tests.conf import TEXT_CHOICES_COMPATIBILITY
+from tests.models import Auction, User
+
+
+def last_build(name):
+    return next(build for build in reversed(builds) if build.name == name)
+
+
+def test_schema_build():
+    class UserBuildSchema(ModelSchema):
+        class Config:
+            model = User
+
+    build = last_build("UserBuildSchema")
+
+    assert build.model == "tests.User"
+    assert build.schema() is UserBuildSchema
+    assert not build.factory
+    assert build.fields == len(UserBuildSchema.__fields__)
+    assert build.time >= (
+        build.conversion_time + build.nested_time + build.enum_time + build.update_time
+    )
+    assert build.as_dict()["own_time"] == build.time - build.nested_time
+
+
+def test_nested_builds(monkeypatch):
+    # so that the schemas of the relations are built again
+    monkeypatch.setattr(SchemaRegister(), "schemas", {})
+    monkeypatch.setattr(SchemaRegister(), "keys", {})
+    count = len(builds)
+
+    SchemaFactory.create_schema(
+        User, name="UserBuildNested", depth=1, skip_registry=True
+    )
+
+    *nested, build = builds[count:]
+    assert build.name == "UserBuildNested"
+    assert build.factory
+    assert build.nested == len(nested) == 3
+    assert build.nested_time == pytest.approx(sum(b.time for b in nested))
+    assert build.own_time < build.time
+
+
+@pytest.mark.skipif(
+    not TEXT_CHOICES_COMPATIBILITY, reason="models.TextChoices introduced in django 3.0"
+)
+def test_enum_builds(monkeypatch):
+    from tests.models import UserTier
+
+    # enums are created once per name and choices
+    monkeypatch.setattr(SchemaRegister(), "enums", {})
+
+    class UserTierBuildSchema(ModelSchema):
+        class Config:
+            model = UserTier
+
+    build = last_build("UserTierBuildSchema")
+    assert build.enums == 1
+    assert 0 < build.enum_time < build.time
+
+
+def test_failed_build_not_recorded():
+    count = len(builds)
+
+    with pytest.raises(ConfigError):
+
+        class AuctionBuildSchema(ModelSchema):
+            class Config:
+                model = Auction
+                include = ["missing"]
+
+    assert len(builds) == count
+
+
+def test_build_report():
+    class AuctionReportSchema(ModelSchema):
+        class Config:
+            model = Auction
+
+    report = build_report(limit=3)
+
+    assert report.schemas == len(builds)
+    assert len(report.slowest) == 3
+    assert report.slowest[0].own_time >= report.slowest[-1].own_time
+    assert set(report.as_dict()) == {
+        "schemas",
+        "factory_schemas",
+        "enums",
+        "time",
+        "slowest",
+    }
+    assert report.table().splitlines()[1].split() == [
+        "schema",
+        "model",
+        "fields",
+        "own",
+        "ms",
+        "fields",
+        "ms",
+        "nested",
+        "ms",
+        "enums",
+        "ms",
+        "update",
+        "ms",
+    ]
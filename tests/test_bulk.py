@@ -0,0 +1,526 @@
+import multiprocessing
+import pickle
+import threading
+import time
+
+import pytest
+from asgiref.sync import async_to_sync
+from dantico import ModelSchema, SchemaFactory, model_validator
+from dantico.bulk import (
+    abulk_create,
+    abulk_create_many,
+    abulk_update,
+    abulk_update_many,
+    check_foreign_keys,
+    check_unique_constraints,
+    unique_sets,
+)
+from dantico.exceptions import ConfigError
+from django.db import connection
+
+from tests.models import (
+    Auction,
+    Category,
+    Client,
+    Group,
+    Membership,
+    Profile,
+    User,
+)
+
+
+class AuctionBulkSchema(ModelSchema):
+    class Config:
+        model = Auction
+        include = ["title", "category", "start_date", "end_date"]
+
+
+class ClientBulkSchema(ModelSchema):
+    class Config:
+        model = Client
+
+
+class MembershipBulkSchema(ModelSchema):
+    class Config:
+        model = Membership
+
+
+class UserBulkSchema(ModelSchema):
+    class Config:
+        model = User
+        include = ["full_name", "age", "profile", "groups"]
+
+
+@pytest.mark.django_db
+class TestBulkValidation:
+    def test_parse_many_keeps_input_order(self):
+        result = AuctionBulkSchema.parse_many(
+            [
+                {
+                    "title": "first",
+                    "start_date": "2022-01-01",
+                    "end_date": "2022-01-02",
+                },
+                {"start_date": "2022-01-01", "end_date": "2022-01-02"},
+                {
+                    "title": "third",
+                    "start_date": "2022-01-01",
+                    "end_date": "2022-01-02",
+                },
+            ],
+            chunk_size=2,
+        )
+
+        assert len(result) == 3
+        assert not result.is_valid
+        assert [instance.title for instance in result.valid] == ["first", "third"]
+        assert list(result.errors) == [1]
+        assert result.errors[1][0]["loc"] == ("title",)
+
+    def test_missing_foreign_keys(self, django_assert_num_queries):
+        category = Category.objects.create(
+            name="Laptops", start_date="2022-01-01", end_date="2022-01-02"
+        )
+        records = [
+            {
+                "title": f"auction {index}",
+                "category_id": category_id,
+                "start_date": "2022-01-01",
+                "end_date": "2022-01-02",
+            }
+            for index, category_id in enumerate([category.pk, 999, None, category.pk])
+        ]
+
+        with django_assert_num_queries(1):
+            result = AuctionBulkSchema.parse_many(records, check_unique=False)
+
+        assert list(result.errors) == [1]
+        assert result.errors[1] == [
+            {
+                "loc": ("category_id",),
+                "msg": "Category instance with id 999 does not exist.",
+                "type": "value_error.related_does_not_exist",
+            }
+        ]
+        assert result.instances[2].category is None
+
+    def test_missing_many_to_many_keys(self, django_assert_num_queries):
+        profile = Profile.objects.create(address="Somewhere")
+        group = Group.objects.create(name="staff")
+        instances = [
+            UserBulkSchema(
+                full_name="Alice", age=30, profile_id=profile.pk, groups=[group.pk]
+            ),
+            UserBulkSchema(
+                full_name="Bob", age=31, profile_id=profile.pk, groups=[group.pk, 42]
+            ),
+            None,
+        ]
+
+        with django_assert_num_queries(2):
+            errors = check_foreign_keys(UserBulkSchema, instances)
+
+        assert errors == {
+            1: [
+                {
+                    "loc": ("groups", 1),
+                    "msg": "Group instance with id 42 does not exist.",
+                    "type": "value_error.related_does_not_exist",
+                }
+            ]
+        }
+
+    def test_skip_database_checks(self, django_assert_num_queries):
+        with django_assert_num_queries(0):
+            result = AuctionBulkSchema.parse_many(
+                [
+                    {
+                        "title": "auction",
+                        "category_id": 999,
+                        "start_date": "2022-01-01",
+                        "end_date": "2022-01-02",
+                    }
+                ],
+                check_related=False,
+                check_unique=False,
+            )
+        assert result.is_valid
+
+
+@pytest.mark.django_db
+class TestBatchValidators:
+    def test_batch_validator_called_once_per_chunk(self, django_assert_num_queries):
+        Auction.objects.create(title="taken")
+        calls = []
+
+        class AuctionSchema(ModelSchema):
+            class Config:
+                model = Auction
+                include = ["title", "start_date", "end_date"]
+
+            @model_validator("title", batch=True)
+            def unique_titles(cls, values):
+                calls.append(values)
+                taken = set(
+                    Auction.objects.filter(title__in=values).values_list(
+                        "title", flat=True
+                    )
+                )
+                return [
+                    (
+                        ValueError("title already taken")
+                        if value in taken
+                        else value.upper()
+                    )
+                    for value in values
+                ]
+
+        records = [
+            {"title": title, "start_date": "2022-01-01", "end_date": "2022-01-02"}
+            for title in ["free", "taken", "other", "last"]
+        ]
+        with django_assert_num_queries(2):
+            result = AuctionSchema.parse_many(records, chunk_size=3)
+
+        assert calls == [["free", "taken", "other"], ["last"]]
+        assert [instance.title for instance in result.valid] == [
+            "FREE",
+            "OTHER",
+            "LAST",
+        ]
+        assert result.errors == {
+            1: [
+                {"loc": ("title",), "msg": "title already taken", "type": "value_error"}
+            ]
+        }
+
+    def test_batch_validator_is_not_called_per_value(self):
+        class AuctionSchema(ModelSchema):
+            class Config:
+                model = Auction
+                include = ["title"]
+
+            @model_validator("title", batch=True)
+            def validate_titles(cls, values):  # pragma: no cover
+                raise AssertionError("not expected")
+
+        assert AuctionSchema(title="MacBook").title == "MacBook"
+
+    def test_inherited_batch_validators(self):
+        class AuctionSchema(ModelSchema):
+            class Config:
+                model = Auction
+                include = ["title"]
+
+            @model_validator("title", batch=True)
+            def strip_titles(cls, values):
+                return [value.strip() for value in values]
+
+        class ChildAuctionSchema(AuctionSchema):
+            class Config:
+                model = Auction
+                include = ["title"]
+
+            @model_validator("title", batch=True)
+            def upper_titles(cls, values):
+                return [value.upper() for value in values]
+
+        result = ChildAuctionSchema.parse_many([{"title": " mac "}])
+        assert result.valid[0].title == "MAC"
+
+    def test_invalid_batch_validators(self):
+        with pytest.raises(ConfigError):
+
+            class AuctionSchema(ModelSchema):
+                class Config:
+                    model = Auction
+                    include = ["title"]
+
+                @model_validator("title", batch=True, pre=True)
+                def validate_titles(cls, values):  # pragma: no cover
+                    return values
+
+        with pytest.raises(ConfigError):
+
+            class AuctionCheckedSchema(ModelSchema):
+                class Config:
+                    model = Auction
+                    include = ["title"]
+
+                @model_validator("title", batch=True, check_fields=True)
+                def validate_titles(cls, values):  # pragma: no cover
+                    return values
+
+        with pytest.raises(ConfigError):
+
+            class AuctionSchema2(ModelSchema):
+                class Config:
+                    model = Auction
+                    include = ["title"]
+
+                @model_validator("invalid_field", batch=True)
+                def validate_titles(cls, values):  # pragma: no cover
+                    return values
+
+
+@pytest.mark.django_db
+class TestUniqueConstraints:
+    def test_unique_sets(self):
+        assert unique_sets(ClientBulkSchema) == [("key",)]
+        assert unique_sets(MembershipBulkSchema) == [
+            ("client", "group"),
+            ("client", "code"),
+        ]
+        assert unique_sets(AuctionBulkSchema) == [("category",)]
+
+    def test_unique_field(self, django_assert_num_queries):
+        existing = Client.objects.create(key="taken")
+        records = [{"key": "taken"}, {"key": "free"}, {"key": "free"}]
+
+        with django_assert_num_queries(1):
+            result = ClientBulkSchema.parse_many(records)
+
+        assert result.errors == {
+            0: [
+                {
+                    "loc": ("key",),
+                    "msg": "Client with this Key already exists.",
+                    "type": "value_error.unique",
+                }
+            ],
+            2: [
+                {
+                    "loc": ("key",),
+                    "msg": "Client with this Key is duplicated in the batch.",
+                    "type": "value_error.unique.batch",
+                }
+            ],
+        }
+        # updating the existing row itself doesn't collide
+        assert not check_unique_constraints(
+            ClientBulkSchema, [ClientBulkSchema(id=existing.pk, key="taken")]
+        )
+
+    def test_unique_together_and_constraints(self, django_assert_num_queries):
+        client = Client.objects.create(key="client")
+        staff, admins = Group.objects.create(name="staff"), Group.objects.create(
+            name="admins"
+        )
+        Membership.objects.create(client=client, group=staff, code="A")
+        instances = [
+            MembershipBulkSchema(client_id=client.pk, group_id=staff.pk, code="B"),
+            MembershipBulkSchema(client_id=client.pk, group_id=admins.pk, code="A"),
+            MembershipBulkSchema(client_id=client.pk, group_id=admins.pk, code="C"),
+        ]
+
+        with django_assert_num_queries(2):
+            errors = check_unique_constraints(MembershipBulkSchema, instances)
+
+        assert errors == {
+            0: [
+                {
+                    "loc": ("__root__",),
+                    "msg": "Membership with this Client and Group already exists.",
+                    "type": "value_error.unique",
+                }
+            ],
+            1: [
+                {
+                    "loc": ("__root__",),
+                    "msg": "Membership with this Client and Code already exists.",
+                    "type": "value_error.unique",
+                }
+            ],
+            2: [
+                {
+                    "loc": ("__root__",),
+                    "msg": "Membership with this Client and Group is duplicated in the batch.",
+                    "type": "value_error.unique.batch",
+                }
+            ],
+        }
+
+
+@pytest.mark.django_db
+class TestParallelParsing:
+    def test_factory_schema_is_reconstructible(self):
+        schema = SchemaFactory.create_schema(
+            Category, name="CategoryParallelSchema", fields=["name"], skip_registry=True
+        )
+        key = SchemaFactory.get_schema_key(
+            Category,
+            name="CategoryParallelSchema",
+            depth=0,
+            fields=["name"],
+            exclude=None,
+            skip_registry=True,
+        )
+        assert key == (
+            "tests.Category",
+            (
+                ("depth", 0),
+                ("exclude", None),
+                ("fields", ("name",)),
+                ("name", "CategoryParallelSchema"),
+                ("skip_registry", True),
+            ),
+        )
+        assert SchemaFactory.create_schema_from_key(key) is schema
+        assert pickle.loads(pickle.dumps(schema)) is schema
+
+    def test_local_schema_is_not_picklable(self):
+        class CategorySchema(ModelSchema):
+            class Config:
+                model = Category
+
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(CategorySchema)
+
+    @pytest.mark.parametrize("workers", [None, 2])
+    def test_parse_many_with_workers(self, workers):
+        schema = SchemaFactory.create_schema(
+            Category,
+            name="CategoryWorkersSchema",
+            exclude=["id"],
+            skip_registry=True,
+        )
+        records = [
+            {"name": f"category {index}", "start_date": "2022-01-01", "end_date": date}
+            for index, date in enumerate(["2022-01-02", "invalid"] * 5)
+        ]
+
+        result = schema.parse_many(
+            records,
+            chunk_size=3,
+            workers=workers,
+            mp_context=multiprocessing.get_context("fork"),
+        )
+
+        assert len(result) == 10
+        assert sorted(result.errors) == [1, 3, 5, 7, 9]
+        assert [instance.name for instance in result.valid] == [
+            f"category {index}" for index in range(0, 10, 2)
+        ]
+        assert all(type(instance) is schema for instance in result.valid)
+
+
+@pytest.mark.django_db
+class TestBulkWrite:
+    @pytest.mark.skipif(
+        not connection.features.can_return_rows_from_bulk_insert,
+        reason="many-to-many links need the primary keys of the created rows",
+    )
+    def test_bulk_create(self, django_assert_num_queries):
+        profiles = [Profile.objects.create(address="Somewhere") for _ in range(2)]
+        staff, admins = Group.objects.create(name="staff"), Group.objects.create(
+            name="admins"
+        )
+        instances = [
+            UserBulkSchema(
+                full_name="Alice", age=30, profile_id=profiles[0].pk, groups=[staff.pk]
+            ),
+            UserBulkSchema(
+                full_name="Bob",
+                age=31,
+                profile_id=profiles[1].pk,
+                groups=[staff.pk, admins.pk],
+            ),
+        ]
+
+        with django_assert_num_queries(2):
+            users = UserBulkSchema.bulk_create(instances)
+
+        assert [user.full_name for user in users] == ["Alice", "Bob"]
+        assert list(
+            User.objects.get(full_name="Bob")
+            .groups.order_by("pk")
+            .values_list("name", flat=True)
+        ) == ["staff", "admins"]
+
+    def test_bulk_update(self):
+        category = Category.objects.create(
+            name="Laptops", start_date="2022-01-01", end_date="2022-01-02"
+        )
+
+        class CategorySchema(ModelSchema):
+            class Config:
+                model = Category
+
+        updated = CategorySchema.bulk_update(
+            [
+                CategorySchema(
+                    id=category.pk,
+                    name="Phones",
+                    start_date="2022-02-01",
+                    end_date="2022-02-02",
+                )
+            ],
+            ["name"],
+        )
+
+        assert updated == 1
+        category.refresh_from_db()
+        assert category.name == "Phones"
+        assert str(category.start_date) == "2022-01-01"
+
+    def test_abulk_create_and_update_many(self):
+        instances = [ClientBulkSchema(key=f"client {index}") for index in range(5)]
+        instances += [
+            AuctionBulkSchema(
+                title=f"auction {index}", start_date="2022-01-01", end_date="2022-01-02"
+            )
+            for index in range(3)
+        ]
+
+        created = async_to_sync(abulk_create_many)(
+            instances, concurrency=2, chunk_size=2
+        )
+
+        assert len(created[ClientBulkSchema]) == 5
+        assert len(created[AuctionBulkSchema]) == 3
+        assert Client.objects.count() == 5
+        assert Auction.objects.count() == 3
+
+        clients = [
+            ClientBulkSchema(id=client.pk, key=client.key.upper())
+            for client in Client.objects.all()
+        ]
+        updated = async_to_sync(abulk_update_many)(clients, chunk_size=2)
+
+        assert updated == {ClientBulkSchema: 5}
+        assert Client.objects.filter(key__startswith="CLIENT").count() == 5
+
+    def test_abulk_create_and_update(self):
+        created = async_to_sync(abulk_create)(
+            ClientBulkSchema, [ClientBulkSchema(key=f"client {i}") for i in range(3)]
+        )
+        assert [client.key for client in created] == [f"client {i}" for i in range(3)]
+
+        clients = [
+            ClientBulkSchema(id=client.pk, key=client.key.upper())
+            for client in Client.objects.all()
+        ]
+        assert async_to_sync(abulk_update)(ClientBulkSchema, clients) == 3
+        assert Client.objects.filter(key__startswith="CLIENT").count() == 3
+
+
+def test_abulk_create_many_concurrently(monkeypatch):
+    running, overlapping = set(), []
+    lock = threading.Lock()
+
+    def bulk_create(schema, chunk, **kwargs):
+        with lock:
+            running.add(threading.get_ident())
+            overlapping.append(len(running))
+        time.sleep(0.05)
+        with lock:
+            running.discard(threading.get_ident())
+        return chunk
+
+    monkeypatch.setattr("dantico.bulk.bulk_create", bulk_create)
+    instances = [ClientBulkSchema(key=f"client {index}") for index in range(8)]
+
+    created = async_to_sync(abulk_create_many)(instances, concurrency=4, chunk_size=1)
+
+    assert created == {ClientBulkSchema: instances}
+    assert max(overlapping) == 4
@@ -0,0 +1,64 @@
+import json
+
+import pytest
+from dantico import ModelSchema
+from dantico.cli import describe_schema, get_schemas, main
+
+from tests.models import Group, User
+
+
+class UserCLISchema(ModelSchema):
+    class Config:
+        model = User
+        depth = 1
+
+
+class GroupCLISchema(ModelSchema):
+    class Config:
+        model = Group
+
+
+def test_get_schemas():
+    schemas = get_schemas()
+
+    assert UserCLISchema in schemas
+    assert GroupCLISchema in schemas
+    assert len(schemas) == len(set(schemas))
+
+
+def test_describe_schema():
+    assert describe_schema(UserCLISchema) == {
+        "schema": "tests.test_cli.UserCLISchema",
+        "model": "tests.User",
+        "fields": 6,
+        "depth": 1,
+        "nested": 3,
+        "enums": 0,
+    }
+
+
+def test_list(capsys):
+    assert main(["-k", "CLISchema"]) == 0
+
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].split() == ["schema", "model", "fields", "depth", "nested", "enums"]
+    assert [line.split()[0] for line in lines[1:]] == [
+        "tests.test_cli.UserCLISchema",
+        "tests.test_cli.GroupCLISchema",
+    ]
+
+
+@pytest.mark.django_db
+def test_time(capsys, create_users):
+    create_users(3)
+
+    main(["-k", "CLISchema", "--time", "--rows", "2", "--json"])
+
+    user, group = json.loads(capsys.readouterr().out)
+    assert user["rows"] == 2
+    # users with their profile and tier, then their groups
+    assert user["queries_per_row"] == 1
+    assert user["ms_per_row"] > 0
+    assert user["n_plus_one"] == {}
+    assert group["rows"] == 2
+    assert group["schema"] == describe_schema(GroupCLISchema)["schema"]
@@ -107,6 +107,7 @@ def test_all_fields():
                 "title": "Binary Field",
                 "type": "string",
                 "format": "binary",
+                "contentEncoding": "base64",
             },
             "boolean_field": {"title": "Boolean Field", "type": "boolean"},
             "char_field": {"title": "Char Field", "type": "string"},
@@ -308,11 +309,7 @@ def test_django_31_fields():
         "type": "object",
         "properties": {
             "id": {"title": "Id", "type": "integer", "extra": {}},
-            "json_field": {
-                "title": "Json Field",
-                "format": "json-string",
-                "type": "string",
-            },
+            "json_field": {"title": "Json Field"},
             "positive_big_integer_field": {
                 "title": "Positive Big Integer Field",
                 "type": "integer",
@@ -320,19 +317,19 @@ def test_django_31_fields():
         },
         "required": ["json_field", "positive_big_integer_field"],
     }
-    with pytest.raises(Exception):
-        ModelNewFieldsSchema(
-            id=1, json_field={"any": "data"}, positive_big_integer_field=1
-        )
-
+    # decoded by the model field, not parsed again
     obj = ModelNewFieldsSchema(
-        id=1, json_field=json.dumps({"any": "data"}), positive_big_integer_field=1
+        id=1, json_field={"any": "data"}, positive_big_integer_field=1
     )
     assert obj.dict() == {
         "id": 1,
         "json_field": {"any": "data"},
         "positive_big_integer_field": 1,
     }
+    obj = ModelNewFieldsSchema(
+        id=1, json_field=json.dumps({"any": "data"}), positive_big_integer_field=1
+    )
+    assert obj.json_field == '{"any": "data"}'
 
 
 def test_relational():
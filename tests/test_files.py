@@ -0,0 +1,120 @@
+import time
+
+import pytest
+from dantico import ModelSchema
+from dantico.files import FileURLResolver, get_url_resolver, set_url_resolver
+from django.core.files.storage import Storage
+from django.db.models.fields.files import FieldFile
+
+from tests.models import Document, Folder
+
+
+class SigningStorage(Storage):
+    """Storage signing URLs, one at a time or in batches, counting both."""
+
+    def __init__(self):
+        self.signed = []
+        self.batches = []
+
+    def url(self, name):
+        self.signed.append(name)
+        return f"https://cdn.example.com/{name}?signature={len(self.signed)}"
+
+    def urls(self, names):
+        self.batches.append(list(names))
+        return {
+            name: f"https://cdn.example.com/{name}?signature=batch" for name in names
+        }
+
+
+class DocumentSchema(ModelSchema):
+    class Config:
+        model = Document
+        depth = 1
+
+
+@pytest.fixture
+def storage(monkeypatch):
+    storage = SigningStorage()
+    for model, name in ((Document, "file"), (Folder, "cover")):
+        monkeypatch.setattr(model._meta.get_field(name), "storage", storage)
+    resolver = get_url_resolver()
+    set_url_resolver(FileURLResolver())
+    yield storage
+    set_url_resolver(resolver)
+
+
+def test_cached_url(storage):
+    field = Document._meta.get_field("file")
+    file = FieldFile(None, field, "documents/a.pdf")
+
+    resolver = FileURLResolver(ttl=60)
+    assert resolver.url(file) == "https://cdn.example.com/documents/a.pdf?signature=1"
+    assert resolver.url(FieldFile(None, field, "documents/a.pdf")).endswith("=1")
+    assert resolver.url(FieldFile(None, field, "")) is None
+    assert storage.signed == ["documents/a.pdf"]
+
+
+def test_expired_url(storage, monkeypatch):
+    file = FieldFile(None, Document._meta.get_field("file"), "documents/a.pdf")
+    resolver = FileURLResolver(ttl=60)
+    resolver.url(file)
+
+    now = time.monotonic()
+    monkeypatch.setattr("dantico.files.time.monotonic", lambda: now + 61)
+
+    assert resolver.url(file).endswith("=2")
+
+
+def test_maxsize(storage):
+    field = Document._meta.get_field("file")
+    resolver = FileURLResolver(maxsize=2)
+    for name in ("a", "b", "c", "a"):
+        resolver.url(FieldFile(None, field, name))
+
+    assert storage.signed == ["a", "b", "c", "a"]
+    assert list(resolver.cache) == [(storage, "c"), (storage, "a")]
+
+
+@pytest.mark.django_db
+def test_batch_signing(storage, django_assert_num_queries):
+    folder = Folder.objects.create(name="folder", cover="covers/folder.png")
+    Document.objects.create(folder=folder, file="documents/a.pdf")
+    Document.objects.create(folder=folder, file="documents/b.pdf")
+    Document.objects.create(folder=folder, file="")
+
+    with django_assert_num_queries(1):
+        documents = DocumentSchema.from_queryset(Document.objects.order_by("pk"))
+
+    assert storage.signed == []
+    assert storage.batches == [
+        ["covers/folder.png", "documents/a.pdf", "documents/b.pdf"]
+    ]
+    assert [document.file for document in documents] == [
+        "https://cdn.example.com/documents/a.pdf?signature=batch",
+        "https://cdn.example.com/documents/b.pdf?signature=batch",
+        None,
+    ]
+    assert documents[0].folder.cover.endswith("folder.png?signature=batch")
+
+    # cached for the next requests
+    DocumentSchema.from_queryset(Document.objects.all())
+    assert len(storage.batches) == 1
+
+
+@pytest.mark.django_db
+def test_without_batches(storage, monkeypatch):
+    # storages without `urls` sign files one at a time, once
+    monkeypatch.setattr(storage, "urls", None)
+    folder = Folder.objects.create(name="folder", cover="covers/folder.png")
+    Document.objects.create(folder=folder, file="documents/a.pdf")
+    Document.objects.create(folder=folder, file="documents/b.pdf")
+
+    documents = DocumentSchema.from_queryset(Document.objects.order_by("pk"))
+
+    assert sorted(storage.signed) == [
+        "covers/folder.png",
+        "documents/a.pdf",
+        "documents/b.pdf",
+    ]
+    assert documents[1].file.startswith("https://cdn.example.com/documents/b.pdf")
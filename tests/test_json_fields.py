@@ -0,0 +1,116 @@
+import json
+from typing import List, Optional
+
+import pytest
+from dantico import ModelSchema, Schema
+from dantico.exceptions import ConfigError
+from dantico.json_fields import RawJSON, iter_json, json_dumps
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from pydantic import BaseModel
+
+from tests.conf import JSON_FIELD_COMPATIBILITY
+from tests.models import User
+
+if JSON_FIELD_COMPATIBILITY:
+    from tests.models import JSONConfig
+
+pytestmark = pytest.mark.skipif(
+    not JSON_FIELD_COMPATIBILITY, reason="json field introduced in django 3.1"
+)
+
+
+class Option(BaseModel):
+    name: str
+    enabled: bool = False
+
+
+class Options(BaseModel):
+    options: List[Option]
+
+
+def test_decoded_values():
+    class JSONConfigSchema(ModelSchema):
+        class Config:
+            model = JSONConfig
+
+    config = {"options": [{"name": "dark mode", "enabled": True}]}
+    schema = JSONConfigSchema.from_orm(JSONConfig(id=1, config=config))
+    assert schema.config == config
+    assert JSONConfigSchema.from_orm(JSONConfig(id=1)).config is None
+
+
+def test_nested_schema():
+    class JSONConfigSchema(ModelSchema):
+        config: Optional[Options]
+
+        class Config:
+            model = JSONConfig
+
+    config = {"options": [{"name": "dark mode"}]}
+    schema = JSONConfigSchema.from_orm(JSONConfig(id=1, config=config))
+    assert schema.config == Options(options=[Option(name="dark mode")])
+    with pytest.raises(ValueError):
+        JSONConfigSchema.from_orm(JSONConfig(id=1, config={"options": [{}]}))
+
+
+@pytest.mark.django_db
+def test_raw_json():
+    class JSONConfigSchema(ModelSchema):
+        class Config:
+            model = JSONConfig
+            raw_json = ["config"]
+
+    assert JSONConfigSchema.schema()["properties"]["config"] == {"title": "Config"}
+    first = JSONConfig.objects.create(config={"b": [1, 2.5, None], "a": "é"})
+    JSONConfig.objects.create(config=None)
+
+    with CaptureQueriesContext(connection) as queries:
+        schemas = JSONConfigSchema.from_queryset(JSONConfig.objects.order_by("pk"))
+        output = [json.loads(schema.json()) for schema in schemas]
+    assert len(queries) == 1
+    assert isinstance(schemas[0].config, RawJSON)
+    assert schemas[0].config == {"b": [1, 2.5, None], "a": "é"}
+    assert output == [
+        {"id": first.pk, "config": {"b": [1, 2.5, None], "a": "é"}},
+        {"id": first.pk + 1, "config": None},
+    ]
+
+    # objects not loaded by `from_queryset` have their value encoded
+    schema = JSONConfigSchema.from_orm(first)
+    assert json.loads(schema.json()) == output[0]
+
+    # or decoded when nested in other schemas
+    class JSONConfigsSchema(Schema):
+        configs: List[JSONConfigSchema]
+
+    assert json.loads(JSONConfigsSchema(configs=schemas).json()) == {"configs": output}
+
+
+def test_raw_json_not_json_field():
+    with pytest.raises(ConfigError, match="'username' in 'raw_json'"):
+
+        class UserSchema(ModelSchema):
+            class Config:
+                model = User
+                raw_json = ["username"]
+
+
+def test_json_dumps():
+    data = {"a": RawJSON('{"b": [1, 2]}'), "c": RawJSON("null"), "d": "text"}
+    assert json_dumps(data) == '{"a": {"b": [1, 2]}, "c": null, "d": "text"}'
+    assert json.loads(json_dumps([RawJSON('"\\u0000"')])) == ["\0"]
+    assert json_dumps([RawJSON(value={"a": 1})]) == '[{"a": 1}]'
+    assert json_dumps({"a": 1}, default=str) == '{"a": 1}'
+    with pytest.raises(TypeError):
+        json_dumps({"a": object()})
+
+
+def test_json_dumps_placeholder_in_data():
+    for token in ("\0dantico-0\0", "\0dantico-0123456789abcdef-0\0"):
+        data = {"name": token, "config": RawJSON('{"admin": true}')}
+        assert json.loads(json_dumps(data)) == {
+            "name": token,
+            "config": {"admin": True},
+        }
+        assert json.loads("".join(iter_json(data))) == json.loads(json_dumps(data))
@@ -555,11 +555,7 @@ class TestModelSchema:
             "type": "object",
             "properties": {
                 "id": {"title": "Id", "extra": {}, "type": "integer"},
-                "config": {
-                    "title": "Config",
-                    "type": "string",
-                    "format": "json-string",
-                },
+                "config": {"title": "Config"},
             },
         }
 
@@ -0,0 +1,94 @@
+import pickle
+
+import pytest
+from dantico import ModelSchema, SchemaFactory
+from django.core.cache import cache
+
+from tests.models import Auction, Client, Membership, User
+from tests.test_custom_fields import Programmer
+
+
+class ProgrammerPickleSchema(ModelSchema):
+    class Config:
+        model = Programmer
+
+
+class TestPickle:
+    def test_factory_schema_instance(self):
+        schema = SchemaFactory.create_schema(
+            Membership, name="MembershipPickleSchema", skip_registry=True
+        )
+        membership = schema(client_id=1, group_id=2, code="A")
+
+        unpickled = pickle.loads(pickle.dumps(membership))
+
+        assert type(unpickled) is schema
+        assert unpickled == membership
+        assert unpickled.__fields_set__ == {"client", "group", "code"}
+
+    def test_choices_enum(self):
+        programmer = ProgrammerPickleSchema(framework="3")
+
+        unpickled = pickle.loads(pickle.dumps(programmer))
+        assert unpickled == programmer
+        assert unpickled.framework is programmer.framework
+
+        framework = pickle.loads(pickle.dumps(programmer.framework))
+        assert framework is ProgrammerPickleSchema.__fields__["framework"].type_("3")
+
+    def test_choices_enum_shared_between_schemas(self):
+        schema = SchemaFactory.create_schema(
+            Programmer, name="ProgrammerPickleSchema2", skip_registry=True
+        )
+        assert (
+            schema.__fields__["framework"].type_
+            is ProgrammerPickleSchema.__fields__["framework"].type_
+        )
+
+    def test_nested_schema_instance(self):
+        class UserSchema(ModelSchema):
+            class Config:
+                model = User
+                depth = 1
+
+        nested_schema = UserSchema.__fields__["profile"].type_
+        profile = nested_schema(id=1, address="Somewhere")
+
+        assert pickle.loads(pickle.dumps(profile)) == profile
+
+    def test_compact_payload(self):
+        programmer = ProgrammerPickleSchema(id=1, framework="1")
+        assert b"framework" not in pickle.dumps(programmer)
+
+    def test_fields_changed(self, monkeypatch):
+        class ExtendedSchema(ProgrammerPickleSchema):
+            extra: int = 0
+
+        fingerprint = ProgrammerPickleSchema.__fields_fingerprint__
+        assert ExtendedSchema.__fields_fingerprint__ != fingerprint
+
+        payload = pickle.dumps(ProgrammerPickleSchema(id=1, framework="1"))
+        # as if a field was added, removed or reordered since
+        monkeypatch.setattr(ProgrammerPickleSchema, "__fields_fingerprint__", 0)
+        with pytest.raises(pickle.UnpicklingError, match="fields changed"):
+            pickle.loads(payload)
+
+    def test_django_cache(self):
+        schema = SchemaFactory.create_schema(
+            Client, name="ClientCacheSchema", skip_registry=True
+        )
+        cache.set("client", schema(key="client"))
+
+        assert cache.get("client") == schema(key="client")
+
+    def test_unpicklable_schema(self):
+        class AuctionSchema(ModelSchema):
+            class Config:
+                model = Auction
+
+        with pytest.raises(pickle.PicklingError):
+            pickle.dumps(
+                AuctionSchema(
+                    title="MacBook Pro", start_date="2022-01-01", end_date="2022-01-02"
+                )
+            )
@@ -0,0 +1,93 @@
+import pytest
+from dantico import ModelSchema, model_validator
+from dantico.profiling import ProfiledModelField, profile_fields
+
+from tests.models import Group, User
+
+
+class UserProfilingSchema(ModelSchema):
+    class Config:
+        model = User
+        depth = 1
+
+    @model_validator("full_name")
+    def strip_name(cls, value):
+        return value.strip()
+
+
+def test_profiled_fields():
+    fields = UserProfilingSchema.__fields__.values()
+    assert not any(isinstance(field, ProfiledModelField) for field in fields)
+    with profile_fields():
+        with profile_fields():
+            assert all(isinstance(field, ProfiledModelField) for field in fields)
+
+            class GroupProfilingSchema(ModelSchema):
+                class Config:
+                    model = Group
+
+        assert all(isinstance(field, ProfiledModelField) for field in fields)
+        assert all(
+            isinstance(field, ProfiledModelField)
+            for field in GroupProfilingSchema.__fields__.values()
+        )
+    assert not any(isinstance(field, ProfiledModelField) for field in fields)
+    assert not any(
+        isinstance(field, ProfiledModelField)
+        for field in GroupProfilingSchema.__fields__.values()
+    )
+
+
+def test_validation():
+    with profile_fields() as profile:
+        UserProfilingSchema.parse_obj(
+            {
+                "full_name": " Jane ",
+                "age": 30,
+                "profile": {"address": "here"},
+                "groups": [],
+            }
+        )
+
+    times = profile.as_dict()
+    assert times["UserProfilingSchema.full_name"]["validate_calls"] == 1
+    assert times["UserProfilingSchema.full_name"]["get_calls"] == 0
+    assert times["UserProfilingSchema.profile"]["validate_time"] > 0
+
+
+def test_disabled():
+    with profile_fields() as profile:
+        pass
+    UserProfilingSchema.parse_obj(
+        {"full_name": "Jane", "age": 30, "profile": {"address": "here"}, "groups": []}
+    )
+
+    assert profile.fields == {}
+
+
+@pytest.mark.django_db
+def test_from_queryset(create_users):
+    create_users(2)
+
+    with profile_fields() as profile:
+        UserProfilingSchema.from_queryset(User.objects.all())
+
+    times = profile.as_dict()
+    groups = times["UserProfilingSchema.groups"]
+    assert (groups["get_calls"], groups["validate_calls"]) == (2, 2)
+    # nested schemas are profiled on their own, and within their parent field
+    (address,) = [
+        label for label in times if label.endswith(".address") and "User" not in label
+    ]
+    assert times[address]["get_calls"] == 2
+    assert times["UserProfilingSchema.profile"]["validate_time"] >= (
+        times[address]["validate_time"]
+    )
+
+    table = profile.table().splitlines()
+    assert table[0].split() == ["field", "get", "calls", "get", "ms", "validate"] + [
+        "calls",
+        "validate",
+        "ms",
+    ]
+    assert len(table) == len(times) + 1
@@ -0,0 +1,88 @@
+import pytest
+from dantico import ModelSchema
+from dantico.exceptions import NPlusOneError
+from dantico.queries import NPlusOneWarning, track_queries
+
+from tests.models import User
+
+
+class UserQueriesSchema(ModelSchema):
+    class Config:
+        model = User
+        depth = 1
+
+
+def serialize_lazily():
+    return [UserQueriesSchema.from_orm(user) for user in User.objects.all()]
+
+
+@pytest.mark.django_db
+class TestTrackQueries:
+    def test_n_plus_one(self, create_users):
+        create_users()
+
+        with track_queries() as stats:
+            serialize_lazily()
+
+        assert stats.count == 10
+        assert stats.n_plus_one == {"User.profile": 3, "User.tier": 3, "User.groups": 3}
+        assert stats.paths[None].count == 1
+
+    def test_from_queryset(self, create_users):
+        create_users()
+
+        with track_queries(mode="raise") as stats:
+            UserQueriesSchema.from_queryset(User.objects.all())
+
+        assert stats.count == 2
+        assert stats.n_plus_one == {}
+        assert set(stats.paths) == {None}
+
+    def test_raise(self, create_users):
+        create_users(2)
+
+        with pytest.raises(NPlusOneError, match="User.groups"):
+            with track_queries(mode="raise"):
+                serialize_lazily()
+
+    def test_warn(self, create_users):
+        create_users(2)
+
+        with pytest.warns(NPlusOneWarning, match="User.profile"):
+            with track_queries(mode="warn"):
+                serialize_lazily()
+
+    def test_threshold(self, create_users):
+        create_users(2)
+
+        with track_queries(threshold=3) as stats:
+            serialize_lazily()
+
+        assert stats.n_plus_one == {}
+
+    def test_sample_rate(self, create_users):
+        create_users(1)
+
+        with track_queries(mode="raise", sample_rate=0) as stats:
+            serialize_lazily()
+
+        assert not stats.sampled
+        assert stats.count == 0
+
+    def test_as_dict(self, create_users):
+        create_users(1)
+
+        with track_queries() as stats:
+            serialize_lazily()
+
+        data = stats.as_dict()
+        assert data["count"] == 4
+        assert data["paths"]["User.groups"]["count"] == 1
+        assert data["paths"]["None"]["repeated"] == 1
+        assert data["n_plus_one"] == {}
+
+
+def test_invalid_mode():
+    with pytest.raises(ValueError):
+        with track_queries(mode="log"):
+            pass  # pragma: no cover
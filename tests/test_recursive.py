@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from dantico import ModelSchema, SchemaFactory
+from dantico.queryset import get_query_plan
+from dantico.schema_registry import registry
+
+from tests.models import Comment, Department, Employee, Group
+
+
+class CommentRecursiveSchema(ModelSchema):
+    class Config:
+        model = Comment
+        recursive = True
+
+
+class EmployeeRecursiveSchema(ModelSchema):
+    class Config:
+        model = Employee
+        recursive = True
+
+
+def test_self_reference():
+    parent = CommentRecursiveSchema.__fields__["parent"].type_
+
+    assert parent.__config__.model is Comment
+    assert parent.__fields__["parent"].type_ is parent
+    # recursive schemas don't replace the default schema of the model
+    assert registry.get_model_schema(Comment) is None
+
+
+def test_cycle():
+    department = EmployeeRecursiveSchema.__fields__["department"].type_
+    employee = department.__fields__["head"].type_
+
+    assert employee.__config__.model is Employee
+    assert employee.__fields__["department"].type_ is department
+
+
+def test_one_schema_per_model():
+    department = SchemaFactory.create_schema(Department, recursive=True)
+
+    assert department is EmployeeRecursiveSchema.__fields__["department"].type_
+    assert SchemaFactory.create_schema(
+        Group, skip_registry=True, depth=1
+    ) is SchemaFactory.create_schema(Group, skip_registry=True, depth=1)
+
+
+def test_create_schema_in_threads():
+    def create(index: int) -> type:
+        return SchemaFactory.create_schema(
+            Comment, name="ThreadComment", skip_registry=True, recursive=True
+        )
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        schemas = set(pool.map(create, range(32)))
+
+    assert len(schemas) == 1
+    schema = schemas.pop()
+    assert schema.__fields__["parent"].type_.__config__.model is Comment
+
+
+def test_query_plan():
+    plan = get_query_plan(EmployeeRecursiveSchema)
+
+    # stops where the schemas loop
+    assert plan.select_related == [
+        "department",
+        "department__head",
+        "department__head__department",
+    ]
+
+
+@pytest.mark.django_db
+def test_from_orm():
+    root = Comment.objects.create(text="root")
+    reply = Comment.objects.create(text="reply", parent=root)
+    comment = Comment.objects.create(text="comment", parent=reply)
+
+    schema = CommentRecursiveSchema.from_orm(comment)
+
+    assert schema.parent.parent.text == "root"
+    assert schema.parent.parent.parent is None
+    assert schema.dict()["parent"]["parent"] == {
+        "id": root.pk,
+        "text": "root",
+        "parent": None,
+    }
+
+
+@pytest.mark.django_db
+def test_from_orm_cycle():
+    department = Department.objects.create(name="sales")
+    employee = Employee.objects.create(name="head", department=department)
+    department.head = employee
+    department.save()
+    other = Employee.objects.create(name="other", department=department)
+
+    # nested until the rows loop back to an object already nested
+    schema = EmployeeRecursiveSchema.from_orm(employee)
+    assert schema.department.name == "sales"
+    assert schema.department.head is None
+
+    schema = EmployeeRecursiveSchema.from_orm(other)
+    assert schema.department.head.name == "head"
+    assert schema.department.head.department is None
+
+    # rows share the nested department, cut where it was first nested
+    schemas = EmployeeRecursiveSchema.from_queryset(Employee.objects.order_by("pk"))
+    assert schemas[0].department.head is None
+    assert schemas[1].department.head is None
@@ -0,0 +1,479 @@
+import threading
+from typing import List, Optional
+
+import pytest
+from asgiref.sync import async_to_sync
+from dantico import ModelSchema, SQLField, depends_on
+from dantico.exceptions import ConfigError
+from dantico.queryset import get_query_plan, prefetch_concurrently
+from dantico.schema_registry import registry
+from dantico.serialization import identity_map
+from django.db.models import F, TextField, Value, prefetch_related_objects
+from django.db.models.functions import Concat, Length
+
+from tests.models import (
+    Activity,
+    AgencyAdmin,
+    Client,
+    Comment,
+    Group,
+    Membership,
+    User,
+    UserType,
+)
+
+
+class UserSerializationSchema(ModelSchema):
+    class Config:
+        model = User
+        depth = 1
+
+
+class UserFlatSchema(ModelSchema):
+    class Config:
+        model = User
+        include = ["id", "full_name", "profile", "groups"]
+
+
+class UserTypeSchema(ModelSchema):
+    users: list = []
+
+    class Config:
+        model = UserType
+
+
+class GroupSchema(ModelSchema):
+    user_set: list = []
+    membership_set: list = []
+
+    class Config:
+        model = Group
+
+
+class ActivitySchema(ModelSchema):
+    class Config:
+        model = Activity
+
+
+class GroupNameSchema(ModelSchema):
+    class Config:
+        model = Group
+        include = ["name"]
+
+
+class GroupCountSchema(ModelSchema):
+    class Config:
+        model = Group
+        counts = {"user_count": "user_set"}
+        exists = {"has_memberships": "membership"}
+
+
+class UserLabelSchema(ModelSchema):
+    label: str = SQLField(
+        Concat("full_name", Value(" at "), "profile__address", output_field=TextField())
+    )
+    name_length: int = SQLField(Length("full_name"))
+
+    class Config:
+        model = User
+        include = ["id", "full_name"]
+
+
+class CommentSummarySchema(ModelSchema):
+    summary: str
+
+    class Config:
+        model = Comment
+        include = ["id"]
+
+
+def create_memberships(groups):
+    client = Client.objects.create(key="client")
+    for index, group in enumerate(groups):
+        Membership.objects.create(client=client, group=group, code=str(index))
+
+
+def test_query_plan():
+    plan = get_query_plan(UserSerializationSchema)
+    assert plan.select_related == ["profile", "tier"]
+    assert plan.prefetch_related == ["groups"]
+
+    plan = get_query_plan(UserFlatSchema)
+    assert plan.select_related == []
+    assert plan.prefetch_related == ["groups"]
+
+    plan = get_query_plan(ActivitySchema)
+    assert plan.prefetch_related == ["target"]
+
+    plan = get_query_plan(GroupCountSchema)
+    assert set(plan.annotations) == {"user_count", "has_memberships"}
+    assert GroupCountSchema.__fields__["user_count"].default == 0
+
+
+def test_depends_on():
+    assert CommentSummarySchema.__depends_on__ == ("parent", "replies")
+
+    plan = get_query_plan(CommentSummarySchema)
+    assert plan.select_related == ["parent"]
+    assert plan.prefetch_related == ["replies"]
+
+
+def test_depends_on_invalid_path(monkeypatch):
+    resolver = property(depends_on("parent__author")(lambda comment: ""))
+    monkeypatch.setattr(Comment, "author_name", resolver, raising=False)
+
+    with pytest.raises(ConfigError):
+
+        class CommentAuthorSchema(ModelSchema):
+            author_name: str
+
+            class Config:
+                model = Comment
+
+
+@pytest.mark.django_db
+def test_depends_on_queries(django_assert_num_queries):
+    root = Comment.objects.create(text="root")
+    a = Comment.objects.create(text="a", parent=root)
+    Comment.objects.create(text="b", parent=root)
+    Comment.objects.create(text="a1", parent=a)
+    Comment.objects.create(text="a2", parent=a)
+
+    with django_assert_num_queries(2):
+        comments = CommentSummarySchema.from_queryset(Comment.objects.all())
+
+    assert [comment.summary for comment in comments[:2]] == [
+        "- > root > 2 replies",
+        "root > a > 2 replies",
+    ]
+
+
+def test_sql_fields():
+    assert set(UserLabelSchema.__sql_fields__) == {"label", "name_length"}
+    assert UserLabelSchema(id=1, full_name="user").label is None
+
+    with pytest.raises(ConfigError):
+
+        class UserSchema(ModelSchema):
+            full_name: str = SQLField(F("full_name"))
+
+            class Config:
+                model = User
+
+
+def test_count_fields_config():
+    with pytest.raises(ConfigError):
+
+        class GroupSchema(ModelSchema):
+            class Config:
+                model = Group
+                counts = {"user_count": "name"}
+
+    with pytest.raises(ConfigError):
+
+        class GroupNameSchema(ModelSchema):
+            class Config:
+                model = Group
+                exists = {"name": "user"}
+
+
+@pytest.mark.django_db
+class TestSerialization:
+    def test_from_queryset(self, django_assert_num_queries, create_users):
+        create_users()
+
+        with django_assert_num_queries(2):
+            users = UserSerializationSchema.from_queryset(User.objects.order_by("id"))
+
+        assert [user.full_name for user in users] == ["user 0", "user 1", "user 2"]
+        assert users[0].tier.name == "gold"
+        assert [group.name for group in users[0].groups] == ["group 0", "group 1"]
+
+    def test_from_queryset_identity_map(self, create_users):
+        create_users()
+
+        users = UserSerializationSchema.from_queryset(User.objects.order_by("id"))
+
+        assert users[0].tier is users[1].tier is users[2].tier
+        assert users[0].groups[1] is users[2].groups[1]
+        assert users[0].profile is not users[1].profile
+
+    def test_identity_map(self, create_users):
+        create_users(2)
+        first, second = User.objects.order_by("id")
+
+        assert (
+            UserSerializationSchema.from_orm(first).tier
+            is not UserSerializationSchema.from_orm(second).tier
+        )
+        with identity_map() as objects:
+            assert (
+                UserSerializationSchema.from_orm(first).tier
+                is UserSerializationSchema.from_orm(second).tier
+            )
+            with identity_map() as nested:
+                assert nested is objects
+        assert len(objects) == 5
+
+    def test_sideload(self, django_assert_num_queries, create_users):
+        tier = create_users()
+        first, second = Group.objects.order_by("id")
+
+        # users, profiles, tiers and groups
+        with django_assert_num_queries(4):
+            output = UserSerializationSchema.sideload(User.objects.order_by("id"))
+
+        assert [user["full_name"] for user in output["data"]] == [
+            "user 0",
+            "user 1",
+            "user 2",
+        ]
+        user = output["data"][0]
+        assert user["tier"] == tier.pk
+        assert user["groups"] == [first.pk, second.pk]
+        assert user["profile"] == User.objects.get(full_name="user 0").profile_id
+        assert set(output["included"]) == {
+            "tests.profile",
+            "tests.usertype",
+            "tests.group",
+        }
+        assert output["included"]["tests.usertype"] == {
+            tier.pk: {"id": tier.pk, "name": "gold"}
+        }
+        assert output["included"]["tests.group"][second.pk] == {
+            "id": second.pk,
+            "name": "group 1",
+        }
+        assert len(output["included"]["tests.profile"]) == 3
+
+    def test_sideload_include_exclude(self, create_users):
+        tier = create_users(1)
+        users = User.objects.all()
+
+        output = UserSerializationSchema.sideload(users, exclude={"age", "groups"})
+        assert "age" not in output["data"][0]
+        assert "groups" not in output["data"][0]
+        assert "tests.group" not in output["included"]
+        assert output["included"]["tests.usertype"] == {
+            tier.pk: {"id": tier.pk, "name": "gold"}
+        }
+
+        output = UserSerializationSchema.sideload(users, include={"full_name", "tier"})
+        assert output["data"] == [{"full_name": "user 0", "tier": tier.pk}]
+        assert set(output["included"]) == {"tests.usertype"}
+        assert output["included"]["tests.usertype"] == {
+            tier.pk: {"id": tier.pk, "name": "gold"}
+        }
+
+        output = UserSerializationSchema.sideload(users, exclude={"tier": {"name"}})
+        assert output["data"][0]["tier"] == tier.pk
+
+    def test_sideload_null_relation(self, create_users):
+        create_users(1)
+        User.objects.update(tier=None)
+
+        output = UserSerializationSchema.sideload(User.objects.all())
+
+        assert output["data"][0]["tier"] is None
+        assert output["included"]["tests.usertype"] == {}
+
+    def test_sideload_missing_reverse_one_to_one(self, create_users):
+        class AdminSchema(ModelSchema):
+            class Config:
+                model = AgencyAdmin
+                include = ["id", "name"]
+
+        class UserAdminSchema(ModelSchema):
+            agency_admin: Optional[AdminSchema] = None
+
+            class Config:
+                model = User
+                include = ["id", "full_name"]
+
+        create_users(2)
+        first = User.objects.order_by("id").first()
+        admin = AgencyAdmin.objects.create(name="admin", user=first)
+
+        output = UserAdminSchema.sideload(User.objects.order_by("id"))
+
+        assert [user["agency_admin"] for user in output["data"]] == [admin.pk, None]
+        assert output["included"]["tests.agencyadmin"] == {
+            admin.pk: {"id": admin.pk, "name": "admin"}
+        }
+
+    def test_generic_foreign_key(self, monkeypatch, django_assert_num_queries):
+        monkeypatch.setattr(registry, "schemas", {Group: GroupNameSchema})
+        client = Client.objects.create(key="client")
+        for group in [Group.objects.create(name=name) for name in ["a", "b"]]:
+            Activity.objects.create(verb="joined", target=group)
+        Activity.objects.create(verb="created", target=client)
+
+        # activities, then groups and clients
+        with django_assert_num_queries(3):
+            activities = ActivitySchema.from_queryset(Activity.objects.order_by("id"))
+
+        assert [activity.target for activity in activities[:2]] == [
+            GroupNameSchema(name="a"),
+            GroupNameSchema(name="b"),
+        ]
+        assert activities[0].dict()["target"] == {"name": "a"}
+        assert activities[2].dict()["target"] == {"id": client.pk, "key": "client"}
+        # the schema made for the target isn't the default one of its model
+        assert Client not in registry.schemas
+
+    def test_generic_foreign_key_afrom_orm(self, monkeypatch):
+        monkeypatch.setattr(registry, "schemas", {Group: GroupNameSchema})
+        activity = Activity.objects.create(
+            verb="joined", target=Group.objects.create(name="a")
+        )
+
+        schema = async_to_sync(ActivitySchema.afrom_orm)(
+            Activity.objects.get(pk=activity.pk)
+        )
+
+        assert schema.target == GroupNameSchema(name="a")
+
+    def test_count_fields(self, django_assert_num_queries, create_users):
+        create_users(2)
+        create_memberships(Group.objects.filter(name="group 0"))
+        Group.objects.create(name="empty")
+
+        with django_assert_num_queries(1):
+            groups = GroupCountSchema.from_queryset(Group.objects.order_by("id"))
+
+        assert [(group.user_count, group.has_memberships) for group in groups] == [
+            (2, True),
+            (2, False),
+            (0, False),
+        ]
+
+    def test_nested_count_fields(self, django_assert_num_queries, create_users):
+        class NestedCountUser(ModelSchema):
+            class Config:
+                model = User
+                include = ["id", "full_name"]
+                counts = {"group_count": "groups"}
+
+        class TierUsersSchema(ModelSchema):
+            users: List[NestedCountUser]
+
+            class Config:
+                model = UserType
+
+        create_users(5)
+        User.objects.get(full_name="user 0").groups.clear()
+
+        # tiers, then users with their counts
+        with django_assert_num_queries(2):
+            tiers = TierUsersSchema.from_queryset(UserType.objects.all())
+
+        counts = {user.full_name: user.group_count for user in tiers[0].users}
+        assert counts == {"user 0": 0, **{f"user {i}": 2 for i in range(1, 5)}}
+
+    def test_count_fields_from_orm(self, django_assert_num_queries, create_users):
+        create_users(1)
+        group = Group.objects.first()
+
+        # one query for all the fields the object wasn't annotated with
+        with django_assert_num_queries(1):
+            schema = GroupCountSchema.from_orm(group)
+        assert (schema.user_count, schema.has_memberships) == (1, False)
+
+        schema = async_to_sync(GroupCountSchema.afrom_orm)(Group.objects.first())
+        assert schema.user_count == 1
+
+    def test_sql_fields(self, django_assert_num_queries, create_users):
+        create_users(2)
+
+        with django_assert_num_queries(1):
+            users = UserLabelSchema.from_queryset(User.objects.order_by("id"))
+
+        assert [user.label for user in users] == [
+            "user 0 at address 0",
+            "user 1 at address 1",
+        ]
+        assert users[0].name_length == 6
+
+        user = User.objects.order_by("id").first()
+        with django_assert_num_queries(1):
+            assert UserLabelSchema.from_orm(user).label == "user 0 at address 0"
+
+    def test_afrom_orm(self, create_users):
+        create_users(1)
+        user = User.objects.get()
+
+        # queries run from the event loop would raise `SynchronousOnlyOperation`
+        schema = async_to_sync(UserSerializationSchema.afrom_orm)(user)
+
+        assert schema == UserSerializationSchema.from_orm(User.objects.get())
+        assert schema.profile.address == "address 0"
+
+    def test_afrom_orm_pk_values(self, create_users):
+        create_users(1)
+        user = User.objects.get()
+
+        schema = async_to_sync(UserFlatSchema.afrom_orm)(user)
+
+        assert schema.groups == list(user.groups.values_list("pk", flat=True))
+
+    def test_afrom_queryset(self, django_assert_num_queries, create_users):
+        create_users()
+
+        async def serialize():
+            return [
+                user
+                async for user in UserSerializationSchema.afrom_queryset(
+                    User.objects.order_by("id")
+                )
+            ]
+
+        with django_assert_num_queries(2):
+            users = async_to_sync(serialize)()
+
+        assert [user.full_name for user in users] == ["user 0", "user 1", "user 2"]
+        assert users[2].groups[1].name == "group 1"
+        assert users[0].tier is users[2].tier
+
+    def test_afrom_orm_reverse_manager(self, create_users):
+        tier = create_users(2)
+        tier = UserType.objects.get(pk=tier.pk)
+
+        schema = async_to_sync(UserTypeSchema.afrom_orm)(tier)
+
+        assert len(schema.users) == 2
+
+    def test_from_queryset_workers_in_transaction(
+        self, django_assert_num_queries, create_users
+    ):
+        create_users(2)
+        create_memberships(Group.objects.all())
+
+        # worker threads can't see uncommitted rows, prefetch on this thread
+        with django_assert_num_queries(3):
+            groups = GroupSchema.from_queryset(
+                Group.objects.order_by("id"), prefetch_workers=2
+            )
+
+        assert [len(group.user_set) for group in groups] == [2, 2]
+        assert [len(group.membership_set) for group in groups] == [1, 1]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_prefetch_concurrently(monkeypatch, create_users):
+    create_users(2)
+    create_memberships(Group.objects.all())
+    threads = {}
+
+    def prefetch(objs, *lookups):
+        threads[lookups] = threading.get_ident()
+        prefetch_related_objects(objs, *lookups)
+
+    monkeypatch.setattr("dantico.queryset.prefetch_related_objects", prefetch)
+
+    groups = list(Group.objects.order_by("id"))
+    prefetch_concurrently(groups, ["user_set", "membership_set"], workers=2)
+
+    assert set(threads) == {("user_set",), ("membership_set",)}
+    assert threading.get_ident() not in threads.values()
+    assert [len(group._prefetched_objects_cache) for group in groups] == [2, 2]
+    assert [group.user_set.count() for group in groups] == [2, 2]
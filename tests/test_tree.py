@@ -0,0 +1,108 @@
+import pytest
+from dantico import ModelSchema
+from dantico.exceptions import ConfigError
+from dantico.tree import get_parent_field, get_tree_schema
+
+from tests.models import Comment, User
+
+
+class CommentSchema(ModelSchema):
+    class Config:
+        model = Comment
+
+
+def create_thread():
+    # root
+    # ├── a
+    # │   ├── a1
+    # │   │   └── a1x
+    # │   └── a2
+    # └── b
+    root = Comment.objects.create(text="root")
+    a = Comment.objects.create(text="a", parent=root)
+    b = Comment.objects.create(text="b", parent=root)
+    a1 = Comment.objects.create(text="a1", parent=a)
+    Comment.objects.create(text="a2", parent=a)
+    Comment.objects.create(text="a1x", parent=a1)
+    return root, b
+
+
+def texts(nodes):
+    return [(node.text, texts(node.children)) for node in nodes]
+
+
+def test_tree_schema():
+    tree = get_tree_schema(CommentSchema)
+
+    assert tree is get_tree_schema(CommentSchema)
+    assert issubclass(tree, CommentSchema)
+    assert tree.__fields__["children"].type_ is tree
+
+    node = tree(text="root", children=[{"text": "reply"}])
+    assert node.children[0].text == "reply"
+
+
+def test_parent_field():
+    assert get_parent_field(Comment) is Comment._meta.get_field("parent")
+
+    with pytest.raises(ConfigError):
+        get_parent_field(User)
+    with pytest.raises(ConfigError):
+        get_parent_field(Comment, "text")
+
+
+@pytest.mark.django_db
+class TestTree:
+    def test_from_tree(self, django_assert_num_queries):
+        root, _ = create_thread()
+
+        # roots, then one query per level
+        with django_assert_num_queries(5):
+            trees = CommentSchema.from_tree(Comment.objects.filter(parent=None))
+
+        assert texts(trees) == [
+            ("root", [("a", [("a1", [("a1x", [])]), ("a2", [])]), ("b", [])])
+        ]
+        assert trees[0].id == root.pk
+        assert trees[0].dict()["children"][1] == {
+            "id": root.pk + 2,
+            "text": "b",
+            "parent": root.pk,
+            "children": [],
+        }
+
+    def test_max_depth(self):
+        create_thread()
+
+        trees = CommentSchema.from_tree(
+            Comment.objects.filter(parent=None), max_depth=1
+        )
+
+        assert texts(trees) == [("root", [("a", []), ("b", [])])]
+
+    def test_subtrees(self):
+        _, b = create_thread()
+        Comment.objects.create(text="b1", parent=b)
+
+        trees = CommentSchema.from_tree(
+            Comment.objects.filter(text__in=["b", "a1"]).order_by("-text")
+        )
+
+        assert texts(trees) == [("b", [("b1", [])]), ("a1", [("a1x", [])])]
+
+    def test_cycle(self):
+        root, b = create_thread()
+        Comment.objects.filter(pk=root.pk).update(parent=b)
+
+        trees = CommentSchema.from_tree(Comment.objects.filter(pk=root.pk))
+
+        assert texts(trees)[0][1][1] == ("b", [])
+
+    def test_children_name(self):
+        create_thread()
+
+        trees = CommentSchema.from_tree(
+            Comment.objects.filter(parent=None), children="replies", max_depth=1
+        )
+
+        assert [reply.text for reply in trees[0].replies] == ["a", "b"]